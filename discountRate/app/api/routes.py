@@ -3,7 +3,7 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, HTTPException
 
 from app.main_deps import get_order_service
-from app.schemas.orders import OrderIn, OrderOut, OrderTotalsOut
+from app.schemas.orders import OrderBatchIn, OrderBatchTotalsOut, OrderIn, OrderOut, OrderTotalsOut
 from app.services.order_service import OrderService
 
 router = APIRouter()
@@ -14,17 +14,22 @@ def preview_order(order_in: OrderIn, svc: OrderService = Depends(get_order_servi
     return svc.preview(order_in)
 
 
+@router.post("/orders/preview:batch", response_model=OrderBatchTotalsOut)
+def preview_orders_batch(batch_in: OrderBatchIn, svc: OrderService = Depends(get_order_service)):
+    return {"results": svc.preview_batch(batch_in.orders)}
+
+
 @router.post("/orders", response_model=OrderOut)
-def create_order(order_in: OrderIn, svc: OrderService = Depends(get_order_service)):
-    return svc.create(order_in)
+async def create_order(order_in: OrderIn, svc: OrderService = Depends(get_order_service)):
+    return await svc.create(order_in)
 
 
 @router.get("/orders/{order_id}", response_model=OrderOut)
-def get_order(order_id: str, svc: OrderService = Depends(get_order_service)):
+async def get_order(order_id: str, svc: OrderService = Depends(get_order_service)):
     if not svc.repo:
         raise HTTPException(status_code=500, detail="Repository not configured")
 
-    doc = svc.repo.get(order_id)
+    doc = await svc.repo.get(order_id)
     if not doc:
         raise HTTPException(status_code=404, detail="Order not found")
     return doc
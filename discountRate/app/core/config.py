@@ -7,11 +7,20 @@ import os
 class Settings(BaseModel):
     mongo_uri: str = "mongodb://mongo:27017"
     mongo_db: str = "shop"
+    # default (built-in rules), file (JSON at discount_rules_path) or mongo (discount_rules collection)
+    discount_rules_source: str = "default"
+    discount_rules_path: str = "discount_rules.json"
+    discount_rules_ttl_seconds: float = 30.0
+    order_read_after_write: bool = False
 
 
 def get_settings() -> Settings:
     return Settings(
         mongo_uri=os.getenv("MONGO_URI", "mongodb://mongo:27017"),
         mongo_db=os.getenv("MONGO_DB", "shop"),
+        discount_rules_source=os.getenv("DISCOUNT_RULES_SOURCE", "default"),
+        discount_rules_path=os.getenv("DISCOUNT_RULES_PATH", "discount_rules.json"),
+        discount_rules_ttl_seconds=float(os.getenv("DISCOUNT_RULES_TTL_SECONDS", "30")),
+        order_read_after_write=os.getenv("ORDER_READ_AFTER_WRITE", "false").lower() in ("1", "true", "yes"),
     )
 
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-from pymongo import MongoClient
-from pymongo.database import Database
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
 
 
-def get_mongo_client(mongo_uri: str) -> MongoClient:
-    return MongoClient(mongo_uri)
+def get_async_mongo_client(mongo_uri: str) -> AsyncMongoClient:
+    return AsyncMongoClient(mongo_uri)
 
 
-def get_database(client: MongoClient, db_name: str) -> Database:
+def get_async_database(client: AsyncMongoClient, db_name: str) -> AsyncDatabase:
     return client[db_name]
-
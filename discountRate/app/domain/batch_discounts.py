@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+from app.domain.discounts import Item
+from app.domain.rules import (
+    BULK10_MIN_QTY,
+    BULK10_PERCENT,
+    DEFAULT_RULES,
+    ORDER5_AMOUNT,
+    ORDER5_MIN_SUBTOTAL,
+    SAFETY_CAP_PERCENT,
+    WELCOME15_MAX,
+    WELCOME15_PERCENT,
+    RuleSet,
+)
+from app.utils.money import Money
+
+# Amounts are int64 Money units (1/10000 dollar): whole-cent prices stay exact
+# under the 10%, 15% and 30% rates, so results match calculate_totals exactly.
+WELCOME15_CODE = "WELCOME15"
+
+# Order subtotals above this are left to calculate_totals (subtotal * 30 must fit in int64).
+MAX_SUBTOTAL_UNITS = np.iinfo(np.int64).max // 100
+MAX_QTY = 2**53
+
+DISCOUNT_CODES = ("BULK10", "ORDER5", "WELCOME15")
+DISCOUNT_TYPES = ("line", "order", "coupon")
+BULK10, ORDER5, WELCOME15 = range(3)
+
+
+@dataclass(frozen=True)
+class BatchTotals:
+    # Per order, in units.
+    subtotal: np.ndarray
+    discount_total: np.ndarray
+    total: np.ndarray
+    # Orders the integer engine cannot price exactly; their rows are zero.
+    unsupported: np.ndarray
+    # Every discount of every order, grouped by order in application order.
+    discount_order: np.ndarray
+    discount_code: np.ndarray
+    discount_amount: np.ndarray
+
+
+def supports(rules: RuleSet) -> bool:
+    """Whether `rules` are the default BULK10/ORDER5/WELCOME15 rules this engine implements."""
+    return rules.rules == DEFAULT_RULES and rules.safety_cap_percent == SAFETY_CAP_PERCENT
+
+
+def price_units(price: Money) -> Optional[int]:
+    """Price in units if it is a whole, non-negative number of cents."""
+    if price.units < 0 or not price.whole_cents:
+        return None
+    return price.units
+
+
+def _group_sums(values: np.ndarray, groups: np.ndarray, n_groups: int) -> np.ndarray:
+    """Exact int64 sum of `values` per group; `groups` is sorted."""
+    sums = np.zeros(n_groups, dtype=np.int64)
+    if values.size:
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+        sums[groups[starts]] = np.add.reduceat(values, starts)
+    return sums
+
+
+def calculate_totals_batch(orders: Sequence[tuple[Sequence[Item], Optional[str]]]) -> BatchTotals:
+    n = len(orders)
+    counts = np.fromiter((len(items) for items, _ in orders), dtype=np.int64, count=n)
+    line_order = np.repeat(np.arange(n), counts)
+    lines = [(i.qty, price_units(i.unit_price)) for items, _ in orders for i in items]
+    bad_line = np.fromiter((p is None or q > MAX_QTY for q, p in lines), dtype=np.float64, count=len(lines))
+    qty = np.fromiter((min(q, MAX_QTY) for q, _ in lines), dtype=np.int64, count=len(lines))
+    price = np.fromiter((p or 0 for _, p in lines), dtype=np.int64, count=len(lines))
+    coupon = np.fromiter((code == WELCOME15_CODE for _, code in orders), dtype=bool, count=n)
+
+    # Orders that could overflow are estimated in floating point first, with room to spare.
+    estimate = np.bincount(line_order, weights=qty.astype(np.float64) * price, minlength=n)
+    unsupported = (np.bincount(line_order, weights=bad_line, minlength=n) > 0) | (
+        estimate > MAX_SUBTOTAL_UNITS / 2
+    )
+    keep = ~unsupported[line_order]
+    line = qty * np.where(keep, price, 0)
+    subtotal = _group_sums(line, line_order, n)
+
+    # 1) BULK10 per line, 2) ORDER5, 3) WELCOME15, in that order within each order.
+    bulk = keep & (qty >= BULK10_MIN_QTY)
+    order5 = ~unsupported & (subtotal >= ORDER5_MIN_SUBTOTAL.units)
+    welcome = ~unsupported & coupon
+    orders_of = np.concatenate((line_order[bulk], np.flatnonzero(order5), np.flatnonzero(welcome)))
+    codes = np.concatenate(
+        (
+            np.full(int(bulk.sum()), BULK10),
+            np.full(int(order5.sum()), ORDER5),
+            np.full(int(welcome.sum()), WELCOME15),
+        )
+    )
+    amounts = np.concatenate(
+        (
+            line[bulk] * BULK10_PERCENT // 100,
+            np.full(int(order5.sum()), ORDER5_AMOUNT.units, dtype=np.int64),
+            np.minimum(subtotal[welcome] * WELCOME15_PERCENT // 100, WELCOME15_MAX.units),
+        )
+    )
+    sequence = np.argsort(orders_of, kind="stable")
+    orders_of, codes, amounts = orders_of[sequence], codes[sequence], amounts[sequence]
+
+    # 4) Safety cap: reduce from the last discount backwards. Discount j loses
+    # whatever of the excess the discounts after it in its order cannot absorb.
+    cap = subtotal * SAFETY_CAP_PERCENT // 100
+    group_total = _group_sums(amounts, orders_of, n)
+    # Running sums may wrap across a large batch; differences within an order stay exact.
+    running = np.cumsum(amounts.astype(np.uint64))
+    first = np.searchsorted(orders_of, orders_of)
+    before_group = np.where(first > 0, running[first - 1], np.uint64(0))
+    after = group_total[orders_of] - (running - before_group).view(np.int64)
+    excess = (group_total - cap)[orders_of]
+    amounts = amounts - np.clip(excess - after, 0, amounts)
+
+    discount_total = _group_sums(amounts, orders_of, n)
+    total = np.maximum(subtotal - discount_total, 0)
+    return BatchTotals(
+        subtotal=subtotal,
+        discount_total=discount_total,
+        total=total,
+        unsupported=unsupported,
+        discount_order=orders_of,
+        discount_code=codes,
+        discount_amount=amounts,
+    )
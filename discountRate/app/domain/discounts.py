@@ -1,98 +1,103 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from decimal import Decimal
 from typing import Iterable, Optional
 
+from app.domain.rules import DEFAULT_RULE_SET, DiscountRule, RuleSet
+from app.utils.money import Money, percent_units
+
 
 @dataclass(frozen=True)
 class Item:
     sku: str
     name: str
     qty: int
-    unit_price: Decimal
+    unit_price: Money
 
 
 @dataclass
 class DiscountApplied:
     code: str
     type: str  # line | order | coupon
-    amount: Decimal
+    amount: Money
 
 
 @dataclass(frozen=True)
 class Totals:
-    subtotal: Decimal
+    subtotal: Money
     discounts_applied: list[DiscountApplied]
-    discount_total: Decimal
-    total: Decimal
-
+    discount_total: Money
+    total: Money
 
-def _cap_discounts(discounts: list[DiscountApplied], cap: Decimal) -> list[DiscountApplied]:
-    if cap <= Decimal("0"):
-        for d in discounts:
-            d.amount = Decimal("0")
-        return discounts
 
-    def current_total() -> Decimal:
-        return sum((d.amount for d in discounts), Decimal("0"))
+def _cap_amounts(amounts: list[int], cap: int) -> list[int]:
+    if cap <= 0:
+        return [0] * len(amounts)
 
-    over = current_total() - cap
-    if over <= Decimal("0"):
-        return discounts
+    over = sum(amounts) - cap
+    if over <= 0:
+        return amounts
 
     # Reduce from the last applied discount backwards until within cap.
-    for d in reversed(discounts):
-        if over <= Decimal("0"):
+    capped = list(amounts)
+    for j in range(len(capped) - 1, -1, -1):
+        if over <= 0:
             break
-        reducible = min(d.amount, over)
-        d.amount -= reducible
+        reducible = min(capped[j], over)
+        capped[j] -= reducible
         over -= reducible
 
+    return capped
+
+
+def _cap_discounts(discounts: list[DiscountApplied], cap: Money) -> list[DiscountApplied]:
+    amounts = _cap_amounts([d.amount.units for d in discounts], cap.units)
+    for d, units in zip(discounts, amounts):
+        d.amount = Money(units)
     return discounts
 
 
-def calculate_totals(items: Iterable[Item], coupon_code: Optional[str] = None) -> Totals:
-    items_list = list(items)
-    subtotal = sum((Decimal(i.qty) * i.unit_price for i in items_list), Decimal("0"))
+def calculate_totals(
+    items: Iterable[Item], coupon_code: Optional[str] = None, rules: RuleSet = DEFAULT_RULE_SET
+) -> Totals:
+    # Works on integer Money units throughout; Money objects are built once at the end.
+    line_totals = [(i.unit_price.units * i.qty, i.qty, i.sku) for i in items]
+    subtotal = sum(line for line, _, _ in line_totals)
 
-    discounts: list[DiscountApplied] = []
+    # (rank, line index, rule, amount): rules apply in priority order, line
+    # rules line by line, and the safety cap trims the last applied first.
+    applied: list[tuple[int, int, DiscountRule, int]] = []
 
-    # 1) Line discount BULK10
-    for i in items_list:
-        if i.qty >= 10:
-            line_total = Decimal(i.qty) * i.unit_price
-            discounts.append(
-                DiscountApplied(code="BULK10", type="line", amount=line_total * Decimal("0.10"))
-            )
+    # 1) Line discounts
+    for n, (line, qty, sku) in enumerate(line_totals):
+        for rank, rule in rules.line_rules(sku):
+            if qty >= rule.min_qty and subtotal >= rule.min_subtotal.units:
+                applied.append((rank, n, rule, rule.discount(line)))
 
-    # 2) Order discount ORDER5
-    if subtotal >= Decimal("100"):
-        discounts.append(DiscountApplied(code="ORDER5", type="order", amount=Decimal("5.00")))
+    # 2) Order discounts
+    for rank, rule in rules.order_rules(subtotal):
+        applied.append((rank, 0, rule, rule.discount(subtotal)))
 
-    # 3) Coupon discount WELCOME15
-    if coupon_code == "WELCOME15":
-        coupon_amount = subtotal * Decimal("0.15")
-        if coupon_amount > Decimal("20.00"):
-            coupon_amount = Decimal("20.00")
-        discounts.append(DiscountApplied(code="WELCOME15", type="coupon", amount=coupon_amount))
+    # 3) Coupon discounts
+    for rank, rule in rules.coupon_rules(coupon_code):
+        if subtotal >= rule.min_subtotal.units:
+            applied.append((rank, 0, rule, rule.discount(subtotal)))
 
-    # 4) Safety cap
-    cap = subtotal * Decimal("0.30")
-    discounts = _cap_discounts(discounts, cap)
+    applied.sort(key=lambda a: (a[0], a[1]))
 
-    discount_total = sum((d.amount for d in discounts), Decimal("0"))
-    if discount_total < Decimal("0"):
-        discount_total = Decimal("0")
+    # 4) Safety cap
+    cap = percent_units(subtotal, rules.safety_cap_percent)
+    amounts = _cap_amounts([a[3] for a in applied], cap)
 
-    total = subtotal - discount_total
-    if total < Decimal("0"):
-        total = Decimal("0")
+    discount_total = max(sum(amounts), 0)
+    total = max(subtotal - discount_total, 0)
 
     return Totals(
-        subtotal=subtotal,
-        discounts_applied=discounts,
-        discount_total=discount_total,
-        total=total,
+        subtotal=Money(subtotal),
+        discounts_applied=[
+            DiscountApplied(code=rule.code, type=rule.type, amount=Money(units))
+            for (_, _, rule, _), units in zip(applied, amounts)
+        ],
+        discount_total=Money(discount_total),
+        total=Money(total),
     )
-
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Sequence
+
+from app.utils.money import ZERO, Money, percent_units
+
+RULE_TYPES = ("line", "order", "coupon")
+
+BULK10_MIN_QTY = 10
+BULK10_PERCENT = 10
+ORDER5_MIN_SUBTOTAL = Money.dollars(100)
+ORDER5_AMOUNT = Money.dollars(5)
+WELCOME15_PERCENT = 15
+WELCOME15_MAX = Money.dollars(20)
+SAFETY_CAP_PERCENT = 30
+
+
+@dataclass(frozen=True)
+class DiscountRule:
+    code: str
+    type: str  # line | order | coupon
+    # Rules are applied in ascending priority; the safety cap trims the last applied first.
+    priority: int = 0
+    # Exactly one of percent (of the line total or subtotal) and amount is set.
+    percent: Optional[int] = None
+    amount: Optional[Money] = None
+    max_amount: Optional[Money] = None
+    min_qty: int = 0  # line rules
+    min_subtotal: Money = ZERO
+    skus: Optional[frozenset[str]] = None  # line rules; None means every SKU
+    coupon_code: Optional[str] = None  # coupon rules; defaults to code
+
+    def __post_init__(self) -> None:
+        if self.type not in RULE_TYPES:
+            raise ValueError(f"{self.code}: type must be one of {', '.join(RULE_TYPES)}")
+        if (self.percent is None) == (self.amount is None):
+            raise ValueError(f"{self.code}: exactly one of percent and amount is required")
+        if self.percent is not None and not 0 <= self.percent <= 100:
+            raise ValueError(f"{self.code}: percent must be between 0 and 100")
+        if self.amount is not None and self.amount < ZERO:
+            raise ValueError(f"{self.code}: amount must not be negative")
+        if self.type != "line" and (self.skus is not None or self.min_qty):
+            raise ValueError(f"{self.code}: skus and minQty only apply to line rules")
+        if self.type != "coupon" and self.coupon_code is not None:
+            raise ValueError(f"{self.code}: couponCode only applies to coupon rules")
+
+    def discount(self, base: int) -> int:
+        """Discount in Money units on a line total or subtotal of `base` units."""
+        if self.percent is not None:
+            amount = percent_units(base, self.percent)
+        else:
+            amount = self.amount.units
+        if self.max_amount is not None:
+            amount = min(amount, self.max_amount.units)
+        return amount
+
+
+def _money(value: Any) -> Optional[Money]:
+    return None if value is None else Money.parse(value)
+
+
+def rule_from_dict(data: dict[str, Any]) -> DiscountRule:
+    """Rule from a stored definition (a JSON object or Mongo document with camelCase keys)."""
+    skus = data.get("skus")
+    percent = data.get("percent")
+    if percent is not None and (isinstance(percent, bool) or not float(percent).is_integer()):
+        raise ValueError(f"{data.get('code')}: percent must be a whole number")
+    try:
+        return DiscountRule(
+            code=str(data["code"]),
+            type=str(data["type"]),
+            priority=int(data.get("priority", 0)),
+            percent=None if percent is None else int(percent),
+            amount=_money(data.get("amount")),
+            max_amount=_money(data.get("maxAmount")),
+            min_qty=int(data.get("minQty", 0)),
+            min_subtotal=_money(data.get("minSubtotal")) or ZERO,
+            skus=None if skus is None else frozenset(str(s) for s in skus),
+            coupon_code=data.get("couponCode"),
+        )
+    except KeyError as exc:
+        raise ValueError(f"discount rule is missing {exc.args[0]!r}") from None
+
+
+DEFAULT_RULES = (
+    DiscountRule(code="BULK10", type="line", priority=10, percent=BULK10_PERCENT, min_qty=BULK10_MIN_QTY),
+    DiscountRule(
+        code="ORDER5", type="order", priority=20, amount=ORDER5_AMOUNT, min_subtotal=ORDER5_MIN_SUBTOTAL
+    ),
+    DiscountRule(code="WELCOME15", type="coupon", priority=30, percent=WELCOME15_PERCENT, max_amount=WELCOME15_MAX),
+)
+
+
+class RuleSet:
+    """Discount rules indexed for evaluation.
+
+    Each rule gets a rank from its priority (ties keep definition order).
+    Line rules are looked up by SKU, coupon rules by code, and order rules
+    by subtotal threshold, so the work per order depends on the rules that
+    can match it rather than on how many are defined.
+    """
+
+    def __init__(self, rules: Iterable[DiscountRule], safety_cap_percent: int = SAFETY_CAP_PERCENT) -> None:
+        self.rules = tuple(sorted(rules, key=lambda r: r.priority))
+        self.safety_cap_percent = safety_cap_percent
+        self._any_sku: list[tuple[int, DiscountRule]] = []
+        self._by_sku: dict[str, list[tuple[int, DiscountRule]]] = {}
+        self._coupons: dict[str, list[tuple[int, DiscountRule]]] = {}
+        orders: list[tuple[int, int, DiscountRule]] = []
+        for rank, rule in enumerate(self.rules):
+            if rule.type == "line":
+                if rule.skus is None:
+                    self._any_sku.append((rank, rule))
+                for sku in rule.skus or ():
+                    self._by_sku.setdefault(sku, []).append((rank, rule))
+            elif rule.type == "coupon":
+                self._coupons.setdefault(rule.coupon_code or rule.code, []).append((rank, rule))
+            else:
+                orders.append((rule.min_subtotal.units, rank, rule))
+        # Each SKU's list already includes the rules for every SKU, in rank order.
+        for sku, specific in self._by_sku.items():
+            self._by_sku[sku] = sorted(specific + self._any_sku, key=lambda r: r[0])
+        orders.sort(key=lambda o: o[0])
+        self._order_thresholds = [threshold for threshold, _, _ in orders]
+        self._orders = [(rank, rule) for _, rank, rule in orders]
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def line_rules(self, sku: str) -> Sequence[tuple[int, DiscountRule]]:
+        return self._by_sku.get(sku, self._any_sku)
+
+    def order_rules(self, subtotal: int) -> list[tuple[int, DiscountRule]]:
+        return self._orders[: bisect_right(self._order_thresholds, subtotal)]
+
+    def coupon_rules(self, code: Optional[str]) -> Sequence[tuple[int, DiscountRule]]:
+        if code is None:
+            return ()
+        return self._coupons.get(code, ())
+
+
+DEFAULT_RULE_SET = RuleSet(DEFAULT_RULES)
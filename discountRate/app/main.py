@@ -1,28 +1,59 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from contextlib import asynccontextmanager
+from typing import Optional
+
 from fastapi import FastAPI
+from pymongo.asynchronous.database import AsyncDatabase
 
 from app.api.routes import router
-from app.core.config import get_settings
-from app.db.mongo import get_database, get_mongo_client
-from app.repositories.mongo_order_repository import OrderRepository
+from app.core.config import Settings, get_settings
+from app.db.mongo import get_async_database, get_async_mongo_client
+from app.repositories.discount_rule_repository import FileDiscountRuleRepository, MongoDiscountRuleRepository
+from app.repositories.mongo_order_repository import AsyncOrderRepository
+from app.services.discount_rules import AsyncReloadingRuleSet, ReloadingRuleSet, RuleProvider
 from app.services.order_service import OrderService
 
 
+async def _discount_rules(settings: Settings, db: AsyncDatabase) -> Optional[RuleProvider]:
+    ttl = settings.discount_rules_ttl_seconds
+    if settings.discount_rules_source == "default":
+        return None
+    if settings.discount_rules_source == "file":
+        # A stat per TTL and a small local read on change; cheap enough to do inline.
+        return ReloadingRuleSet(FileDiscountRuleRepository(settings.discount_rules_path), ttl_seconds=ttl)
+    if settings.discount_rules_source == "mongo":
+        source = await MongoDiscountRuleRepository.from_database(db)
+        return await AsyncReloadingRuleSet.open(source, ttl_seconds=ttl)
+    raise ValueError(f"Unknown DISCOUNT_RULES_SOURCE {settings.discount_rules_source!r}")
+
+
 def create_app() -> FastAPI:
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         settings = get_settings()
-        client = get_mongo_client(settings.mongo_uri)
-        db = get_database(client, settings.mongo_db)
-        repo = OrderRepository.from_database(db)
+        client = get_async_mongo_client(settings.mongo_uri)
+        db = get_async_database(client, settings.mongo_db)
+        repo = await AsyncOrderRepository.from_database(db)
+        rules = await _discount_rules(settings, db)
+        # Mongo rules are refreshed in the background, never on a request.
+        refresher = asyncio.create_task(rules.run()) if isinstance(rules, AsyncReloadingRuleSet) else None
         app.state.mongo_client = client
-        app.state.order_service = OrderService(repo=repo)
+        app.state.order_service = OrderService(
+            repo=repo,
+            rules=rules,
+            read_after_write=settings.order_read_after_write,
+        )
         try:
             yield
         finally:
-            client.close()
+            if refresher is not None:
+                refresher.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await refresher
+            await client.close()
 
     app = FastAPI(title="Order Totals API", version="1.0.0", lifespan=lifespan)
     app.include_router(router)
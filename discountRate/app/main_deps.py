@@ -5,6 +5,7 @@ from fastapi import Request
 from app.services.order_service import OrderService
 
 
-def get_order_service(request: Request) -> OrderService:
+# async so FastAPI resolves it on the event loop instead of in the threadpool.
+async def get_order_service(request: Request) -> OrderService:
     return request.app.state.order_service
 
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional
+
+from pymongo import ASCENDING
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
+
+
+@dataclass
+class FileDiscountRuleRepository:
+    # A JSON list of rule definitions (see app.domain.rules.rule_from_dict).
+    path: str
+
+    def version(self) -> Optional[Hashable]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self) -> list[dict[str, Any]]:
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError(f"{self.path}: expected a JSON list of discount rules")
+        return [d for d in data if d.get("active", True)]
+
+
+@dataclass
+class MongoDiscountRuleRepository:
+    # Async, so reloads run on the event loop without blocking it.
+    collection: AsyncCollection
+
+    @classmethod
+    async def from_database(cls, db: AsyncDatabase) -> "MongoDiscountRuleRepository":
+        repo = cls(collection=db["discount_rules"])
+        await repo.ensure_indexes()
+        return repo
+
+    async def ensure_indexes(self) -> None:
+        await self.collection.create_index([("code", ASCENDING)], unique=True)
+
+    async def load(self) -> list[dict[str, Any]]:
+        return await self.collection.find({"active": {"$ne": False}}, {"_id": 0}).to_list()
@@ -4,42 +4,64 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from bson import ObjectId
+from bson import CodecOptions, ObjectId
 from pymongo import ASCENDING
-from pymongo.collection import Collection
-from pymongo.database import Database
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
+
+
+def _object_id(order_id: str) -> Optional[ObjectId]:
+    try:
+        return ObjectId(order_id)
+    except Exception:
+        return None
+
+
+def _new_order(doc: dict[str, Any]) -> dict[str, Any]:
+    # Mongo stores datetimes with millisecond precision.
+    now = datetime.now(timezone.utc)
+    return {**doc, "createdAt": now.replace(microsecond=now.microsecond // 1000 * 1000)}
+
+
+def _materialize(inserted: dict[str, Any], codec_options: CodecOptions) -> dict[str, Any]:
+    """The inserted document as get() would read it back, without the round trip."""
+    doc = dict(inserted)
+    doc["id"] = str(doc.pop("_id"))
+    if not codec_options.tz_aware:
+        doc["createdAt"] = doc["createdAt"].replace(tzinfo=None)
+    return doc
 
 
 @dataclass
-class OrderRepository:
-    collection: Collection
+class AsyncOrderRepository:
+    """Orders on PyMongo's async client, for use from the event loop."""
+
+    collection: AsyncCollection
 
     @classmethod
-    def from_database(cls, db: Database) -> "OrderRepository":
+    async def from_database(cls, db: AsyncDatabase) -> "AsyncOrderRepository":
         collection = db["orders"]
         repo = cls(collection=collection)
-        repo.ensure_indexes()
+        await repo.ensure_indexes()
         return repo
 
-    def ensure_indexes(self) -> None:
-        self.collection.create_index([("createdAt", ASCENDING)])
-        self.collection.create_index([("customerId", ASCENDING)])
+    async def ensure_indexes(self) -> None:
+        await self.collection.create_index([("createdAt", ASCENDING)])
+        await self.collection.create_index([("customerId", ASCENDING)])
 
-    def create(self, doc: dict[str, Any]) -> str:
-        doc = {**doc, "createdAt": datetime.now(timezone.utc)}
-        result = self.collection.insert_one(doc)
-        return str(result.inserted_id)
+    async def create(self, doc: dict[str, Any]) -> dict[str, Any]:
+        doc = _new_order(doc)
+        await self.collection.insert_one(doc)
+        return _materialize(doc, self.collection.codec_options)
 
-    def get(self, order_id: str) -> Optional[dict[str, Any]]:
-        try:
-            oid = ObjectId(order_id)
-        except Exception:
+    async def get(self, order_id: str) -> Optional[dict[str, Any]]:
+        oid = _object_id(order_id)
+        if oid is None:
             return None
 
-        doc = self.collection.find_one({"_id": oid})
+        doc = await self.collection.find_one({"_id": oid})
         if not doc:
             return None
 
         doc["id"] = str(doc.pop("_id"))
         return doc
-
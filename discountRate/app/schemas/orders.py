@@ -1,10 +1,28 @@
 from __future__ import annotations
 
 from datetime import datetime
-from decimal import Decimal
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PlainSerializer, PlainValidator, WithJsonSchema
+
+from app.utils.money import Money, money_str
+
+
+# Money is parsed exactly from requests and formatted as a "0.00" string in
+# responses (and in stored orders); in between it stays a Money.
+MoneyStr = Annotated[
+    Money,
+    PlainValidator(Money.parse),
+    PlainSerializer(money_str, return_type=str),
+    WithJsonSchema({"type": "string", "examples": ["3.50"]}),
+]
+# Prices accept whatever a Decimal field did: any finite number, as a JSON number or string.
+PriceIn = Annotated[
+    Money,
+    PlainValidator(Money.parse),
+    PlainSerializer(money_str, return_type=str),
+    WithJsonSchema({"anyOf": [{"type": "number"}, {"type": "string"}]}),
+]
 
 
 class _Base(BaseModel):
@@ -17,7 +35,7 @@ class ItemIn(_Base):
     sku: str
     name: str
     qty: int = Field(..., ge=1)
-    unitPrice: Decimal = Field(..., alias="unitPrice")
+    unitPrice: PriceIn = Field(..., alias="unitPrice")
 
 
 class OrderIn(_Base):
@@ -26,17 +44,29 @@ class OrderIn(_Base):
     couponCode: Optional[str] = None
 
 
+# Orders per POST /orders/preview:batch request.
+MAX_BATCH_ORDERS = 10_000
+
+
+class OrderBatchIn(_Base):
+    orders: list[OrderIn] = Field(..., max_length=MAX_BATCH_ORDERS)
+
+
 class DiscountAppliedOut(_Base):
     code: str
     type: str
-    amount: str
+    amount: MoneyStr
 
 
 class OrderTotalsOut(_Base):
-    subtotal: str
+    subtotal: MoneyStr
     discountsApplied: list[DiscountAppliedOut]
-    discountTotal: str
-    total: str
+    discountTotal: MoneyStr
+    total: MoneyStr
+
+
+class OrderBatchTotalsOut(_Base):
+    results: list[OrderTotalsOut]
 
 
 class OrderOut(OrderTotalsOut):
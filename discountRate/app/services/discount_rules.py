@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional, Protocol, Union
+
+from app.domain.rules import RuleSet, rule_from_dict
+
+logger = logging.getLogger(__name__)
+
+
+class DiscountRuleSource(Protocol):
+    def version(self) -> Optional[Hashable]:
+        """Changes whenever the rules do; None when the source cannot tell."""
+
+    def load(self) -> list[dict[str, Any]]: ...
+
+
+class AsyncDiscountRuleSource(Protocol):
+    async def load(self) -> list[dict[str, Any]]: ...
+
+
+def compile_rules(definitions: list[dict[str, Any]]) -> RuleSet:
+    return RuleSet(rule_from_dict(d) for d in definitions)
+
+
+class ReloadingRuleSet:
+    """The compiled rules of a source, reloaded without a restart.
+
+    At most once per `ttl_seconds` the source's version is checked, and the
+    rules are re-read and recompiled when it changed (or always, for
+    sources without a version). If reloading fails, the previous rules stay
+    in effect; only the first load raises.
+    """
+
+    def __init__(
+        self,
+        source: DiscountRuleSource,
+        ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.source = source
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._version = source.version()
+        self._rules = compile_rules(source.load())
+        self._checked_at = clock()
+
+    def current(self) -> RuleSet:
+        if self._clock() - self._checked_at < self.ttl_seconds:
+            return self._rules
+        with self._lock:
+            if self._clock() - self._checked_at >= self.ttl_seconds:
+                self._reload()
+                self._checked_at = self._clock()
+        return self._rules
+
+    def _reload(self) -> None:
+        try:
+            version = self.source.version()
+            if version is not None and version == self._version:
+                return
+            self._rules = compile_rules(self.source.load())
+            self._version = version
+        except Exception:
+            logger.exception("Could not reload discount rules; keeping the previous rules")
+
+
+class AsyncReloadingRuleSet:
+    """The compiled rules of an async source, refreshed by a background task.
+
+    current() never waits on I/O, so it is safe to call from the event loop
+    and from sync pricing code alike. run() re-reads the source every
+    `ttl_seconds` until cancelled; if a reload fails, the previous rules stay
+    in effect.
+    """
+
+    def __init__(self, source: AsyncDiscountRuleSource, rules: RuleSet, ttl_seconds: float = 30.0) -> None:
+        self.source = source
+        self.ttl_seconds = ttl_seconds
+        self._rules = rules
+
+    @classmethod
+    async def open(cls, source: AsyncDiscountRuleSource, ttl_seconds: float = 30.0) -> "AsyncReloadingRuleSet":
+        """Load the first rules; unlike later reloads, a failure here raises."""
+        return cls(source, compile_rules(await source.load()), ttl_seconds)
+
+    def current(self) -> RuleSet:
+        return self._rules
+
+    async def reload(self) -> None:
+        try:
+            self._rules = compile_rules(await self.source.load())
+        except Exception:
+            logger.exception("Could not reload discount rules; keeping the previous rules")
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self.ttl_seconds)
+            await self.reload()
+
+
+RuleProvider = Union[ReloadingRuleSet, AsyncReloadingRuleSet]
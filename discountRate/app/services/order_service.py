@@ -3,15 +3,27 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Optional
 
+import numpy as np
+
+from app.domain.batch_discounts import DISCOUNT_CODES, DISCOUNT_TYPES, calculate_totals_batch, supports
 from app.domain.discounts import Item, calculate_totals
-from app.repositories.mongo_order_repository import OrderRepository
-from app.schemas.orders import OrderIn
-from app.utils.money import money_str
+from app.domain.rules import DEFAULT_RULE_SET, RuleSet
+from app.repositories.mongo_order_repository import AsyncOrderRepository
+from app.schemas.orders import OrderIn, OrderTotalsOut
+from app.services.discount_rules import RuleProvider
+from app.utils.money import ZERO, Money, money_str
 
 
 @dataclass
 class OrderService:
-    repo: Optional[OrderRepository] = None
+    repo: Optional[AsyncOrderRepository] = None
+    # Without a rule source the built-in BULK10/ORDER5/WELCOME15 rules apply.
+    rules: Optional[RuleProvider] = None
+    # Re-read each created order from Mongo instead of returning the inserted document.
+    read_after_write: bool = False
+
+    def rule_set(self) -> RuleSet:
+        return self.rules.current() if self.rules else DEFAULT_RULE_SET
 
     def _to_domain_items(self, order_in: OrderIn) -> list[Item]:
         return [
@@ -24,24 +36,59 @@ class OrderService:
             for i in order_in.items
         ]
 
-    def preview(self, order_in: OrderIn) -> dict[str, Any]:
-        totals = calculate_totals(self._to_domain_items(order_in), order_in.couponCode)
+    # Totals are returned as Money; the response models format them as strings.
+    def preview(self, order_in: OrderIn, rules: Optional[RuleSet] = None) -> dict[str, Any]:
+        totals = calculate_totals(self._to_domain_items(order_in), order_in.couponCode, rules or self.rule_set())
         return {
-            "subtotal": money_str(totals.subtotal),
+            "subtotal": totals.subtotal,
             "discountsApplied": [
-                {"code": d.code, "type": d.type, "amount": money_str(d.amount)}
+                {"code": d.code, "type": d.type, "amount": d.amount}
                 for d in totals.discounts_applied
-                if d.amount > 0
+                if d.amount > ZERO
             ],
-            "discountTotal": money_str(totals.discount_total),
-            "total": money_str(totals.total),
+            "discountTotal": totals.discount_total,
+            "total": totals.total,
         }
 
-    def create(self, order_in: OrderIn) -> dict[str, Any]:
+    def preview_batch(self, orders_in: list[OrderIn]) -> list[dict[str, Any]]:
+        rules = self.rule_set()
+        if not supports(rules):
+            # The vectorized engine only implements the built-in rules.
+            return [self.preview(o, rules) for o in orders_in]
+        batch = calculate_totals_batch([(self._to_domain_items(o), o.couponCode) for o in orders_in])
+        subtotal = batch.subtotal.tolist()
+        discount_total = batch.discount_total.tolist()
+        total = batch.total.tolist()
+        # Discounts are grouped by order; only those left non-zero after the cap are listed.
+        listed = batch.discount_amount > 0
+        bounds = np.searchsorted(batch.discount_order[listed], np.arange(len(orders_in) + 1)).tolist()
+        codes = batch.discount_code[listed].tolist()
+        amounts = batch.discount_amount[listed].tolist()
+
+        results: list[dict[str, Any]] = []
+        for n, order_in in enumerate(orders_in):
+            if batch.unsupported[n]:
+                # Prices outside whole cents or int64 range take the per-order path.
+                results.append(self.preview(order_in, rules))
+                continue
+            results.append(
+                {
+                    "subtotal": Money(subtotal[n]),
+                    "discountsApplied": [
+                        {"code": DISCOUNT_CODES[c], "type": DISCOUNT_TYPES[c], "amount": Money(a)}
+                        for c, a in zip(codes[bounds[n] : bounds[n + 1]], amounts[bounds[n] : bounds[n + 1]])
+                    ],
+                    "discountTotal": Money(discount_total[n]),
+                    "total": Money(total[n]),
+                }
+            )
+        return results
+
+    async def create(self, order_in: OrderIn) -> dict[str, Any]:
         if not self.repo:
             raise RuntimeError("Repository not configured")
 
-        preview = self.preview(order_in)
+        preview = OrderTotalsOut.model_validate(self.preview(order_in)).model_dump(mode="json")
         doc: dict[str, Any] = {
             "customerId": order_in.customerId,
             "couponCode": order_in.couponCode,
@@ -57,9 +104,10 @@ class OrderService:
             **preview,
         }
 
-        order_id = self.repo.create(doc)
-        saved = self.repo.get(order_id)
-        if not saved:
-            raise RuntimeError("Order was not found after insert")
+        saved = await self.repo.create(doc)
+        if self.read_after_write:
+            saved = await self.repo.get(saved["id"])
+            if not saved:
+                raise RuntimeError("Order was not found after insert")
         return saved
 
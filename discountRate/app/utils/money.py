@@ -1,14 +1,134 @@
 from __future__ import annotations
 
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Decimal, InvalidOperation
+from fractions import Fraction
+from typing import Any, Union
 
-TWOPLACES = Decimal("0.01")
+# Money is an integer count of 1/10000 dollar. Whole-cent prices stay exact
+# through the 10%, 15% and 30% discount rates, so nothing is rounded until an
+# amount is formatted, which rounds to cents half up (away from zero), the
+# way Decimal.quantize(Decimal("0.01"), ROUND_HALF_UP) does. Finer amounts
+# (a price of 0.00001, or 10% of 0.0005) are held as an exact Fraction of a
+# unit; they are rare and take the slower, general path.
+UNITS_PER_CENT = 100
+UNITS_PER_DOLLAR = 100 * UNITS_PER_CENT
 
 
-def quantize_money(value: Decimal) -> Decimal:
-    return value.quantize(TWOPLACES, rounding=ROUND_HALF_UP)
+def _half_up_div(numerator: Units, denominator: int) -> int:
+    quotient, remainder = divmod(abs(numerator), denominator)
+    if 2 * remainder >= denominator:
+        quotient += 1
+    return quotient if numerator >= 0 else -quotient
 
 
-def money_str(value: Decimal) -> str:
-    return f"{quantize_money(value):.2f}"
+Units = Union[int, Fraction]
 
+
+def percent_units(units: Units, rate: int) -> Units:
+    """rate% of an amount in units, exactly; an int whenever the result is whole."""
+    share = units * rate
+    if share % 100 == 0:
+        return share // 100
+    return Fraction(share, 100)
+
+
+class Money:
+    __slots__ = ("units",)
+
+    def __init__(self, units: Units = 0) -> None:
+        self.units = units
+
+    @classmethod
+    def parse(cls, value: Any) -> Money:
+        """Exact Money from a finite string, int, Decimal or float."""
+        if isinstance(value, Money):
+            return value
+        if isinstance(value, bool) or value is None:
+            raise ValueError(f"{value!r} is not an amount of money")
+        try:
+            amount = value if isinstance(value, Decimal) else Decimal(str(value))
+            if not amount.is_finite():
+                raise ValueError(f"{value!r} is not an amount of money")
+        except InvalidOperation:
+            raise ValueError(f"{value!r} is not an amount of money") from None
+        units = Fraction(amount) * UNITS_PER_DOLLAR
+        return cls(units.numerator if units.denominator == 1 else units)
+
+    @classmethod
+    def dollars(cls, amount: int) -> Money:
+        return cls(amount * UNITS_PER_DOLLAR)
+
+    @property
+    def whole_cents(self) -> bool:
+        return self.units % UNITS_PER_CENT == 0
+
+    def cents(self) -> int:
+        """Amount rounded to cents, half up."""
+        return _half_up_div(self.units, UNITS_PER_CENT)
+
+    def percent(self, rate: int) -> Money:
+        return Money(percent_units(self.units, rate))
+
+    def to_decimal(self) -> Decimal:
+        if isinstance(self.units, Fraction):
+            return Decimal(self.units.numerator) / Decimal(self.units.denominator) / UNITS_PER_DOLLAR
+        return Decimal(self.units).scaleb(-4)
+
+    def __add__(self, other: Money) -> Money:
+        return Money(self.units + other.units)
+
+    def __radd__(self, other: Any) -> Money:
+        # Lets sum() start from its default 0.
+        if other == 0:
+            return self
+        return NotImplemented
+
+    def __sub__(self, other: Money) -> Money:
+        return Money(self.units - other.units)
+
+    def __mul__(self, qty: int) -> Money:
+        return Money(self.units * qty)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> Money:
+        return Money(-self.units)
+
+    def __bool__(self) -> bool:
+        return self.units != 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.units == other.units
+
+    def __lt__(self, other: Money) -> bool:
+        return self.units < other.units
+
+    def __le__(self, other: Money) -> bool:
+        return self.units <= other.units
+
+    def __gt__(self, other: Money) -> bool:
+        return self.units > other.units
+
+    def __ge__(self, other: Money) -> bool:
+        return self.units >= other.units
+
+    def __hash__(self) -> int:
+        return hash(self.units)
+
+    def __str__(self) -> str:
+        # Like Decimal, a negative amount that rounds to zero keeps its sign ("-0.00").
+        sign = "-" if self.units < 0 else ""
+        cents = abs(self.cents())
+        return f"{sign}{cents // 100}.{cents % 100:02d}"
+
+    def __repr__(self) -> str:
+        return f"Money('{self.to_decimal()}')"
+
+
+ZERO = Money(0)
+
+
+def money_str(value: Money) -> str:
+    return str(value)
@@ -40,3 +40,23 @@ def test_create_and_get_round_trip(client):
     assert fetched["id"] == created["id"]
     assert fetched["total"] == "95.00"
 
+
+
+def test_preview_batch_matches_single_previews(client):
+    orders = [
+        {
+            "customerId": "cust_1",
+            "couponCode": "WELCOME15",
+            "items": [
+                {"sku": "A1", "name": "Widget", "qty": 10, "unitPrice": "3.50"},
+                {"sku": "B2", "name": "Gadget", "qty": 2, "unitPrice": "50.00"},
+            ],
+        },
+        {"customerId": "cust_2", "items": [{"sku": "A1", "name": "Widget", "qty": 11, "unitPrice": "0.05"}]},
+        {"customerId": "cust_3", "items": []},
+    ]
+    r = client.post("/orders/preview:batch", json={"orders": orders})
+    assert r.status_code == 200, r.text
+    results = r.json()["results"]
+    assert results == [client.post("/orders/preview", json=o).json() for o in orders]
+    assert results[0]["total"] == "106.50"
@@ -0,0 +1,75 @@
+import random
+from decimal import Decimal
+
+from app.domain.batch_discounts import calculate_totals_batch
+from app.domain.discounts import Item
+from app.schemas.orders import ItemIn, OrderIn
+from app.services.order_service import OrderService
+from app.utils.money import Money
+
+
+def _order(items, coupon=None):
+    return OrderIn(
+        customerId="c",
+        couponCode=coupon,
+        items=[ItemIn(sku=f"S{n}", name="x", qty=q, unitPrice=Decimal(p)) for n, (q, p) in enumerate(items)],
+    )
+
+
+def _random_orders(n, seed=0):
+    rng = random.Random(seed)
+    orders = []
+    for _ in range(n):
+        items = [
+            (rng.choice([1, 2, 3, 9, 10, 11, 25, 100]), f"{rng.randint(0, 20000) / 100:.2f}")
+            for _ in range(rng.randint(0, 6))
+        ]
+        orders.append(_order(items, rng.choice([None, "WELCOME15", "OTHER"])))
+    return orders
+
+
+def test_batch_matches_single_preview():
+    svc = OrderService()
+    orders = _random_orders(2000)
+    assert svc.preview_batch(orders) == [svc.preview(o) for o in orders]
+
+
+def test_batch_matches_edge_cases():
+    svc = OrderService()
+    orders = [
+        _order([]),
+        _order([(10, "0.00")], "WELCOME15"),
+        _order([(1, "100.00")]),
+        _order([(10, "3.50"), (2, "50.00")], "WELCOME15"),
+        # The safety cap trims WELCOME15, then ORDER5.
+        _order([(10, "1.00"), (100, "1.00")], "WELCOME15"),
+        _order([(10, "10.05"), (10, "0.01")], "WELCOME15"),
+        _order([(13, "7.77")], "WELCOME15"),
+        _order([(10**9, "99999.99")], "WELCOME15"),
+    ]
+    assert svc.preview_batch(orders) == [svc.preview(o) for o in orders]
+
+
+def test_unsupported_orders_fall_back():
+    svc = OrderService()
+    orders = [
+        ([Item(sku="A", name="x", qty=10, unit_price=Money.parse("0.015"))], "WELCOME15"),
+        ([Item(sku="A", name="x", qty=3, unit_price=Money.parse("-5.00"))], None),
+        ([Item(sku="A", name="x", qty=10**20, unit_price=Money.parse("1.00"))], None),
+        ([Item(sku="A", name="x", qty=1, unit_price=Money.parse("150.00"))], "WELCOME15"),
+    ]
+    assert calculate_totals_batch(orders).unsupported.tolist() == [True, True, True, False]
+    huge = _order([(10**20, "1.00"), (10, "2.50")], "WELCOME15")
+    assert svc.preview_batch([huge]) == [svc.preview(huge)]
+    odd = [_order([(11, "0.0005"), (1, "0.00001")], "WELCOME15"), _order([(2, "-0.004")]), _order([(10, "0.015")])]
+    assert svc.preview_batch(odd) == [svc.preview(o) for o in odd]
+    assert [str(r["subtotal"]) for r in svc.preview_batch(odd)] == ["0.01", "-0.01", "0.15"]
+
+
+def test_batch_totals_in_units():
+    batch = calculate_totals_batch(
+        [([Item(sku="A", name="x", qty=10, unit_price=Money.parse("3.50"))], None), ([], "WELCOME15")]
+    )
+    assert batch.subtotal.tolist() == [350000, 0]
+    assert batch.discount_amount.tolist() == [35000, 0]
+    assert batch.total.tolist() == [315000, 0]
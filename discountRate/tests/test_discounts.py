@@ -1,40 +1,50 @@
-from decimal import Decimal
-
 from app.domain.discounts import DiscountApplied, Item, _cap_discounts, calculate_totals
+from app.utils.money import Money
 
 
 def test_bulk10_applies_for_qty_10_plus():
-    totals = calculate_totals([Item(sku="A", name="x", qty=10, unit_price=Decimal("3.50"))])
-    assert totals.subtotal == Decimal("35.00")
+    totals = calculate_totals([Item(sku="A", name="x", qty=10, unit_price=Money.parse("3.50"))])
+    assert totals.subtotal == Money.parse("35.00")
     assert len(totals.discounts_applied) == 1
     assert totals.discounts_applied[0].code == "BULK10"
-    assert totals.discounts_applied[0].amount == Decimal("3.50")
-    assert totals.total == Decimal("31.50")
+    assert totals.discounts_applied[0].amount == Money.parse("3.50")
+    assert totals.total == Money.parse("31.50")
 
 
 def test_order5_applies_when_subtotal_ge_100():
-    totals = calculate_totals([Item(sku="A", name="x", qty=1, unit_price=Decimal("100.00"))])
+    totals = calculate_totals([Item(sku="A", name="x", qty=1, unit_price=Money.parse("100.00"))])
     codes = [d.code for d in totals.discounts_applied]
     assert "ORDER5" in codes
-    assert totals.discount_total == Decimal("5.00")
-    assert totals.total == Decimal("95.00")
+    assert totals.discount_total == Money.parse("5.00")
+    assert totals.total == Money.parse("95.00")
 
 
 def test_welcome15_capped_at_20():
     totals = calculate_totals(
-        [Item(sku="A", name="x", qty=1, unit_price=Decimal("200.00"))], coupon_code="WELCOME15"
+        [Item(sku="A", name="x", qty=1, unit_price=Money.parse("200.00"))], coupon_code="WELCOME15"
     )
     coupon = [d for d in totals.discounts_applied if d.code == "WELCOME15"][0]
-    assert coupon.amount == Decimal("20.00")
+    assert coupon.amount == Money.parse("20.00")
 
 
 def test_safety_cap_reduces_last_discount_to_fit():
     discounts = [
-        DiscountApplied(code="BULK10", type="line", amount=Decimal("10.00")),
-        DiscountApplied(code="ORDER5", type="order", amount=Decimal("5.00")),
-        DiscountApplied(code="WELCOME15", type="coupon", amount=Decimal("20.00")),
+        DiscountApplied(code="BULK10", type="line", amount=Money.parse("10.00")),
+        DiscountApplied(code="ORDER5", type="order", amount=Money.parse("5.00")),
+        DiscountApplied(code="WELCOME15", type="coupon", amount=Money.parse("20.00")),
     ]
-    capped = _cap_discounts(discounts, cap=Decimal("30.00"))
-    assert sum((d.amount for d in capped), Decimal("0")) == Decimal("30.00")
-    assert capped[-1].amount == Decimal("15.00")
+    capped = _cap_discounts(discounts, cap=Money.parse("30.00"))
+    assert sum((d.amount for d in capped), Money()) == Money.parse("30.00")
+    assert capped[-1].amount == Money.parse("15.00")
+
 
+def test_sub_cent_amounts_are_kept_until_formatting():
+    # Two BULK10 discounts of 0.055 each: each shows as 0.06, but they total 0.11.
+    totals = calculate_totals(
+        [
+            Item(sku="A", name="x", qty=11, unit_price=Money.parse("0.05")),
+            Item(sku="B", name="y", qty=11, unit_price=Money.parse("0.05")),
+        ]
+    )
+    assert [str(d.amount) for d in totals.discounts_applied] == ["0.06", "0.06"]
+    assert str(totals.discount_total) == "0.11" and str(totals.total) == "0.99"
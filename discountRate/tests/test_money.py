@@ -0,0 +1,57 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.orders import ItemIn, OrderTotalsOut
+from app.utils.money import ZERO, Money
+
+
+@pytest.mark.parametrize("text", ["0", "3.5", "3.50", "-1.2345", "1e2", "12345678901234.99", "0.00001", "-3.123456789"])
+def test_parse_is_exact(text):
+    assert Money.parse(text).to_decimal() == Decimal(text)
+
+
+@pytest.mark.parametrize("value", ["abc", "NaN", "Infinity", "", None, True])
+def test_parse_rejects_non_amounts(value):
+    with pytest.raises(ValueError):
+        Money.parse(value)
+
+
+@pytest.mark.parametrize(
+    "text", ["0.005", "0.0049", "1.2350", "-0.005", "-2.0051", "99.9950", "0", "0.004999999", "-0.0050001", "-0.001"]
+)
+def test_str_rounds_like_quantize_half_up(text):
+    expected = f"{Decimal(text).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP):.2f}"
+    assert str(Money.parse(text)) == expected
+
+
+def test_arithmetic():
+    price = Money.parse("3.50")
+    assert price * 10 == 10 * price == Money.dollars(35)
+    assert price + price - Money.parse("1.00") == Money.parse("6.00")
+    assert sum([price, price]) == Money.dollars(7)
+    assert Money.dollars(35).percent(10) == price
+    assert Money.parse("0.01").percent(15) == Money.parse("0.0015")
+    assert Money.parse("0.0001").percent(50) == Money.parse("0.00005")
+    assert -price < ZERO < price and not ZERO and price != Money.parse("3.5001")
+
+
+def test_schema_parses_and_formats():
+    item = ItemIn(sku="A", name="x", qty=1, unitPrice="3.5")
+    assert item.unitPrice == Money.parse("3.50")
+    out = OrderTotalsOut(
+        subtotal=Money.parse("35.004"), discountsApplied=[], discountTotal=ZERO, total="35.005"
+    ).model_dump(mode="json")
+    assert out == {"subtotal": "35.00", "discountsApplied": [], "discountTotal": "0.00", "total": "35.01"}
+
+
+@pytest.mark.parametrize("price", ["-1.00", "0.015", "0.00001", 2.5])
+def test_schema_accepts_any_finite_price(price):
+    assert ItemIn(sku="A", name="x", qty=1, unitPrice=price).unitPrice.to_decimal() == Decimal(str(price))
+
+
+@pytest.mark.parametrize("price", ["abc", "NaN", None])
+def test_schema_rejects_non_prices(price):
+    with pytest.raises(ValidationError):
+        ItemIn(sku="A", name="x", qty=1, unitPrice=price)
@@ -0,0 +1,54 @@
+import asyncio
+
+import bson
+from bson import CodecOptions, ObjectId
+
+from app.repositories.mongo_order_repository import AsyncOrderRepository
+from app.schemas.orders import OrderIn
+from app.services.order_service import OrderService
+
+
+class _Collection:
+    """Stores documents as BSON, so reads come back the way Mongo returns them."""
+
+    def __init__(self, codec_options: CodecOptions = CodecOptions()):
+        self.codec_options = codec_options
+        self.docs: dict[ObjectId, bytes] = {}
+        self.reads = 0
+
+    async def create_index(self, keys):
+        pass
+
+    async def insert_one(self, doc):
+        doc.setdefault("_id", ObjectId())
+        self.docs[doc["_id"]] = bson.encode(doc)
+
+    async def find_one(self, query):
+        self.reads += 1
+        raw = self.docs.get(query["_id"])
+        return None if raw is None else bson.decode(raw, codec_options=self.codec_options)
+
+
+ORDER = OrderIn(
+    customerId="cust_1",
+    couponCode="WELCOME15",
+    items=[{"sku": "A1", "name": "Widget", "qty": 10, "unitPrice": "3.50"}],
+)
+
+
+def test_create_returns_the_document_get_would_read():
+    for codec_options in (CodecOptions(), CodecOptions(tz_aware=True)):
+        collection = _Collection(codec_options)
+        svc = OrderService(repo=AsyncOrderRepository(collection=collection))
+        created = asyncio.run(svc.create(ORDER))
+        assert collection.reads == 0
+        assert created == asyncio.run(svc.repo.get(created["id"]))
+        assert created["total"] == "26.25"
+
+
+def test_read_after_write_is_optional():
+    collection = _Collection()
+    svc = OrderService(repo=AsyncOrderRepository(collection=collection), read_after_write=True)
+    created = asyncio.run(svc.create(ORDER))
+    assert collection.reads == 1
+    assert created["customerId"] == "cust_1"
@@ -0,0 +1,160 @@
+import asyncio
+import json
+
+import pytest
+
+from app.domain.discounts import Item, calculate_totals
+from app.domain.rules import DEFAULT_RULES, RuleSet, rule_from_dict
+from app.repositories.discount_rule_repository import FileDiscountRuleRepository
+from app.schemas.orders import OrderIn
+from app.services.discount_rules import AsyncReloadingRuleSet, ReloadingRuleSet
+from app.services.order_service import OrderService
+from app.utils.money import Money
+
+DEFAULT_DEFINITIONS = [
+    {"code": "BULK10", "type": "line", "priority": 10, "percent": 10, "minQty": 10},
+    {"code": "ORDER5", "type": "order", "priority": 20, "amount": "5.00", "minSubtotal": "100.00"},
+    {"code": "WELCOME15", "type": "coupon", "priority": 30, "percent": 15, "maxAmount": "20.00"},
+]
+
+
+def _item(sku: str, qty: int, price: str) -> Item:
+    return Item(sku=sku, name=sku, qty=qty, unit_price=Money.parse(price))
+
+
+def _applied(totals) -> list[tuple[str, str]]:
+    return [(d.code, str(d.amount)) for d in totals.discounts_applied]
+
+
+def test_definitions_compile_to_the_default_rules():
+    assert tuple(rule_from_dict(d) for d in DEFAULT_DEFINITIONS) == DEFAULT_RULES
+
+
+def test_sku_line_rules_and_coupon_lookup():
+    rules = RuleSet(
+        rule_from_dict(d)
+        for d in [
+            {"code": "SHOES20", "type": "line", "percent": 20, "skus": ["S1", "S2"]},
+            {"code": "SPRING", "type": "coupon", "couponCode": "SPRING24", "amount": "3.00"},
+        ]
+    )
+    items = [_item("S1", 1, "10.00"), _item("H1", 1, "10.00"), _item("S2", 2, "5.00")]
+    assert _applied(calculate_totals(items, None, rules)) == [("SHOES20", "2.00"), ("SHOES20", "2.00")]
+    assert _applied(calculate_totals(items, "SPRING24", rules))[-1] == ("SPRING", "3.00")
+    assert _applied(calculate_totals(items, "SPRING", rules))[-1] == ("SHOES20", "2.00")
+
+
+def test_order_thresholds_and_priority_decide_what_the_cap_trims():
+    rules = RuleSet(
+        rule_from_dict(d)
+        for d in [
+            {"code": "BIG", "type": "order", "priority": 1, "amount": "20.00", "minSubtotal": "200.00"},
+            {"code": "SMALL", "type": "order", "priority": 2, "amount": "10.00", "minSubtotal": "50.00"},
+            {"code": "FIRST", "type": "coupon", "priority": 0, "percent": 10},
+        ]
+    )
+    assert _applied(calculate_totals([_item("A", 1, "60.00")], None, rules)) == [("SMALL", "10.00")]
+    # 30% of 200.00 is 60.00: FIRST (20.00), BIG (20.00), SMALL (10.00) fit.
+    totals = calculate_totals([_item("A", 1, "200.00")], "FIRST", rules)
+    assert _applied(totals) == [("FIRST", "20.00"), ("BIG", "20.00"), ("SMALL", "10.00")]
+    # 30% of 100.00 is 30.00: SMALL, applied last, is trimmed.
+    totals = calculate_totals([_item("A", 1, "100.00")], "FIRST", rules)
+    assert _applied(totals) == [("FIRST", "10.00"), ("SMALL", "10.00")]
+    rules = RuleSet([*rules.rules], safety_cap_percent=15)
+    totals = calculate_totals([_item("A", 1, "100.00")], "FIRST", rules)
+    assert _applied(totals) == [("FIRST", "10.00"), ("SMALL", "5.00")]
+
+
+@pytest.mark.parametrize(
+    "definition",
+    [
+        {"code": "X", "type": "shipping", "percent": 10},
+        {"code": "X", "type": "order"},
+        {"code": "X", "type": "order", "percent": 10, "amount": "1.00"},
+        {"code": "X", "type": "order", "percent": 150},
+        {"code": "X", "type": "order", "percent": 12.5},
+        {"code": "X", "type": "order", "amount": "-1.00"},
+        {"code": "X", "type": "order", "amount": "1.00", "skus": ["A"]},
+        {"type": "order", "amount": "1.00"},
+    ],
+)
+def test_invalid_definitions_are_rejected(definition):
+    with pytest.raises(ValueError):
+        rule_from_dict(definition)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_file_rules_hot_reload(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps(DEFAULT_DEFINITIONS))
+    clock = _Clock()
+    rules = ReloadingRuleSet(FileDiscountRuleRepository(str(path)), ttl_seconds=10, clock=clock)
+    first = rules.current()
+    assert first.rules == DEFAULT_RULES
+
+    path.write_text(json.dumps([{"code": "ORDER1", "type": "order", "amount": "1.00"}]))
+    clock.now = 5
+    assert rules.current() is first
+    clock.now = 10
+    assert [r.code for r in rules.current().rules] == ["ORDER1"]
+
+    path.write_text("not json")
+    clock.now = 20
+    assert [r.code for r in rules.current().rules] == ["ORDER1"]
+
+    path.write_text(json.dumps([{**DEFAULT_DEFINITIONS[0], "active": False}, DEFAULT_DEFINITIONS[1]]))
+    clock.now = 30
+    assert [r.code for r in rules.current().rules] == ["ORDER5"]
+
+
+class _AsyncSource:
+    def __init__(self, definitions):
+        self.definitions = definitions
+        self.loads = 0
+
+    async def load(self):
+        self.loads += 1
+        if isinstance(self.definitions, Exception):
+            raise self.definitions
+        return self.definitions
+
+
+def test_async_rules_refresh_in_the_background():
+    async def scenario():
+        source = _AsyncSource(DEFAULT_DEFINITIONS)
+        rules = await AsyncReloadingRuleSet.open(source, ttl_seconds=0.01)
+        assert rules.current().rules == DEFAULT_RULES
+        source.definitions = [{"code": "ORDER1", "type": "order", "amount": "1.00"}]
+        # current() never loads; the background task does.
+        assert rules.current().rules == DEFAULT_RULES and source.loads == 1
+        task = asyncio.create_task(rules.run())
+        while source.loads < 2:
+            await asyncio.sleep(0.005)
+        assert [r.code for r in rules.current().rules] == ["ORDER1"]
+        source.definitions = RuntimeError("mongo is down")
+        loads = source.loads
+        while source.loads == loads:
+            await asyncio.sleep(0.005)
+        task.cancel()
+        assert [r.code for r in rules.current().rules] == ["ORDER1"]
+
+    asyncio.run(scenario())
+
+
+def test_service_batch_uses_configured_rules(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps([{"code": "ORDER1", "type": "order", "amount": "1.00"}]))
+    svc = OrderService(rules=ReloadingRuleSet(FileDiscountRuleRepository(str(path))))
+    order = OrderIn(
+        customerId="c", couponCode="WELCOME15", items=[{"sku": "A", "name": "a", "qty": 10, "unitPrice": "20.00"}]
+    )
+    [result] = svc.preview_batch([order])
+    assert result == svc.preview(order)
+    assert [(d["code"], str(d["amount"])) for d in result["discountsApplied"]] == [("ORDER1", "1.00")]
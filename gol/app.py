@@ -1,171 +1,93 @@
 """
 Conway's Game of Life — Streamlit app.
-Engine (pure, vectorized) in ENGINE section; UI uses session_state only.
+Engines (pure, vectorized), presets and board setup live in the `engine`
+package and frame rendering in `ui`; UI uses session_state only. Only the
+visible viewport is rasterized, downsampled when the board is larger than
+the view, so the image size does not grow with the board. The "Canvas"
+transport sends the viewport once and then only changed runs per frame to
+a browser-side canvas (ui.delta, ui.canvas) instead of a PNG per rerun.
+Every 64th generation of a run is kept in a process-wide keyframe cache,
+so a long Step from a board someone has already run skips ahead.
 """
 from __future__ import annotations
 
 import time
-from typing import Any
+from typing import Any, Callable, Optional
 
 import numpy as np
 import streamlit as st
-from PIL import Image
 from streamlit_image_coordinates import streamlit_image_coordinates
 
 from common.logging import get_logger
+from engine.dense import DTYPE, count_neighbors_no_wrap, count_neighbors_wrap, next_generation
+from engine.editing import BRUSHES, Edit, EditHistory, Stamp, Stroke, load_stamp, transform
+from engine.keyframes import KeyframeCache
+from engine.metrics import MetricsRecorder
+from engine.presets import PRESETS, build_initial_grid
+from engine.rules import CONWAY, RULES, Rule, RuleError, parse_rule
+from engine.runner import Frame, SimulationWorker
+from engine.selftest import SelfTestReport, run_self_test, self_check_neighbors, self_check_preset_bounds
+from ui.canvas import grid_canvas
+from ui.delta import DeltaEncoder
+from ui.renderer import DEFAULT_PALETTE
+from ui.viewport import Viewport, ViewportRenderer, shade_palette, viewport_levels
+
+# Engine entry points are re-exported so existing callers can keep importing them from app.
+__all__ = [
+    "PRESETS",
+    "build_initial_grid",
+    "count_neighbors_no_wrap",
+    "count_neighbors_wrap",
+    "main",
+    "next_generation",
+    "self_check_neighbors",
+    "self_check_preset_bounds",
+]
 
 logger = get_logger(__name__)
 
+SPEED_OPTIONS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, "Max"]
+# Generations of per-step stats kept for the metrics panel.
+METRICS_WINDOW = 600
+# Largest board image (width, height) in pixels; bigger boards are windowed or downsampled.
+VIEW_MAX_PX = (960, 720)
+MAX_BOARD_SIDE = 4096
+TRANSPORTS = ["Image (PNG)", "Canvas (deltas)"]
+CANVAS_KEY = "grid_canvas"
+SHADES = shade_palette(DEFAULT_PALETTE)
+EDIT_MODES = ["Toggle", "Paint", "Erase", "Stamp"]
+MAX_BRUSH = 32
+UNDO_LIMIT = 100
+MAX_STEP = 10_000
+# A worker no rerun has sampled for this long (the session ended) pauses and stops its thread.
+WORKER_IDLE_SECONDS = 30.0
+# Bytes of bit-packed keyframes shared by all sessions.
+KEYFRAME_CACHE_BYTES = 256 * 1024 * 1024
+
 # -----------------------------------------------------------------------------
-# ENGINE — Pure simulation (NumPy, no UI)
+# UI — Streamlit
 # -----------------------------------------------------------------------------
 
-DTYPE = np.uint8
 
+@st.cache_resource(show_spinner="Verifying engines…")
+def _engine_self_test() -> SelfTestReport:
+    """Verify every engine, rule and boundary mode once per process."""
+    return run_self_test(logger)
 
-def count_neighbors_wrap(grid: np.ndarray) -> np.ndarray:
-    """Count live neighbors with toroidal wrap via np.roll in 8 directions."""
-    out = np.zeros(grid.shape, dtype=DTYPE)
-    for dr in (-1, 0, 1):
-        for dc in (-1, 0, 1):
-            if dr == 0 and dc == 0:
-                continue
-            out += np.roll(np.roll(grid, dr, axis=0), dc, axis=1)
-    return out
 
-
-def count_neighbors_no_wrap(grid: np.ndarray) -> np.ndarray:
-    """Count live neighbors without wrap; outside = dead. Zero-pad and slice."""
-    padded = np.zeros((grid.shape[0] + 2, grid.shape[1] + 2), dtype=DTYPE)
-    padded[1:-1, 1:-1] = grid
-    out = (
-        padded[0:-2, 0:-2] + padded[0:-2, 1:-1] + padded[0:-2, 2:]
-        + padded[1:-1, 0:-2] + padded[1:-1, 2:]
-        + padded[2:, 0:-2] + padded[2:, 1:-1] + padded[2:, 2:]
-    )
-    return out
-
-
-def next_generation(grid: np.ndarray, wrap: bool) -> np.ndarray:
-    """Survival 2–3, birth 3, else dead."""
-    n = count_neighbors_wrap(grid) if wrap else count_neighbors_no_wrap(grid)
-    return ((grid == 1) & (n >= 2) & (n <= 3) | ((grid == 0) & (n == 3))).astype(DTYPE)
-
-
-def _glider() -> np.ndarray:
-    a = np.zeros((3, 3), dtype=DTYPE)
-    a[0, 1], a[1, 2], a[2, 0], a[2, 1], a[2, 2] = 1, 1, 1, 1, 1
-    return a
-
-
-def _lwss() -> np.ndarray:
-    a = np.zeros((4, 5), dtype=DTYPE)
-    a[0, 1], a[0, 2], a[0, 3], a[0, 4] = 1, 1, 1, 1
-    a[1, 0], a[1, 1], a[1, 2], a[1, 3] = 1, 1, 1, 1
-    a[2, 1], a[2, 2], a[2, 3] = 1, 1, 1
-    a[3, 0], a[3, 2] = 1, 1
-    return a
-
-
-def _gosper_glider_gun() -> np.ndarray:
-    gun = np.zeros((9, 36), dtype=DTYPE)
-    for c in (0, 1, 10, 11):
-        gun[4, c] = 1
-    for c in (0, 1, 10, 11):
-        gun[5, c] = 1
-    for c in (20, 21, 22):
-        gun[4, c], gun[5, c] = 1, 1
-    gun[5, 23], gun[6, 22], gun[6, 23], gun[6, 24] = 1, 1, 1, 1
-    gun[4, 34], gun[4, 35], gun[5, 34], gun[5, 35] = 1, 1, 1, 1
-    for r in (2, 3):
-        gun[r, 24] = 1
-    for r in (2, 3):
-        gun[r, 22] = 1
-    gun[3, 20], gun[3, 21], gun[4, 20], gun[4, 21] = 1, 1, 1, 1
-    return gun
-
-
-def _pulsar() -> np.ndarray:
-    a = np.zeros((13, 13), dtype=DTYPE)
-    for (r, c) in [
-        (0, 2), (0, 3), (0, 4), (0, 8), (0, 9), (0, 10),
-        (2, 0), (2, 5), (2, 7), (2, 12), (3, 0), (3, 5), (3, 7), (3, 12),
-        (4, 0), (4, 5), (4, 7), (4, 12), (5, 2), (5, 3), (5, 4), (5, 8), (5, 9), (5, 10),
-        (7, 2), (7, 3), (7, 4), (7, 8), (7, 9), (7, 10), (8, 0), (8, 5), (8, 7), (8, 12),
-        (9, 0), (9, 5), (9, 7), (9, 12), (10, 0), (10, 5), (10, 7), (10, 12),
-        (12, 2), (12, 3), (12, 4), (12, 8), (12, 9), (12, 10),
-    ]:
-        a[r, c] = 1
-    return a
-
-
-PRESETS: dict[str, Any] = {
-    "Blank": None,
-    "Random": "density",
-    "Glider": _glider(),
-    "Lightweight Spaceship": _lwss(),
-    "Gosper Glider Gun": _gosper_glider_gun(),
-    "Pulsar": _pulsar(),
-}
-
-
-def build_initial_grid(
-    rows: int,
-    cols: int,
-    preset_key: str,
-    density: float = 0.3,
-    rng: np.random.Generator | None = None,
-) -> tuple[np.ndarray, str | None]:
-    """Return (grid, error_message). If preset too large, return warning and empty grid."""
-    if rows <= 0 or cols <= 0:
-        return np.zeros((max(1, rows), max(1, cols)), dtype=DTYPE), "Invalid grid size."
-    grid = np.zeros((rows, cols), dtype=DTYPE)
-    if preset_key == "Blank":
-        return grid, None
-    if preset_key == "Random":
-        rng = rng or np.random.default_rng()
-        grid[:, :] = (rng.random((rows, cols)) < density).astype(DTYPE)
-        return grid, None
-    pattern = PRESETS.get(preset_key)
-    if pattern is None or not isinstance(pattern, np.ndarray):
-        return grid, None
-    ph, pw = pattern.shape
-    if ph > rows or pw > cols:
-        return grid, f"Grid too small for preset. Needs at least {ph}×{pw}; grid is {rows}×{cols}."
-    r0, c0 = (rows - ph) // 2, (cols - pw) // 2
-    grid[r0 : r0 + ph, c0 : c0 + pw] = pattern
-    return grid, None
-
-
-def self_check_neighbors() -> bool:
-    g = np.zeros((3, 3), dtype=DTYPE)
-    g[1, 1], g[0, 1] = 1, 1
-    nw = count_neighbors_wrap(g)
-    nn = count_neighbors_no_wrap(g)
-    assert nw[1, 1] == 1 and nn[1, 1] == 1
-    assert nw[0, 0] == 2 and nn[0, 0] == 2
-    return True
-
-
-def self_check_preset_bounds() -> bool:
-    _, err = build_initial_grid(2, 2, "Glider")
-    assert err is not None and "too small" in err.lower()
-    g, err = build_initial_grid(10, 10, "Glider")
-    # Glider has no cell at center (1,1); live cells include (0,1)->(3,4) and (2,2)->(5,5)
-    assert err is None and g[3, 4] == 1 and g.sum() == 5
-    return True
-
-
-# -----------------------------------------------------------------------------
-# UI — Streamlit
-# -----------------------------------------------------------------------------
+@st.cache_resource
+def _keyframe_cache() -> KeyframeCache:
+    """Generations already computed from a starting board, shared by every session."""
+    return KeyframeCache(KEYFRAME_CACHE_BYTES)
 
 
 def _default_state() -> None:
     defaults = {
         "grid": np.zeros((50, 50), dtype=DTYPE),
         "playing": False,
-        "speed_ms": 200,
+        "speed_gps": 5,
+        "redraw_ms": 200,
+        "step_size": 1,
         "generation": 0,
         "wrap": False,
         "cell_size": 8,
@@ -173,44 +95,194 @@ def _default_state() -> None:
         "cols": 50,
         "edit_mode": "Toggle",
         "brush_size": 1,
-        "last_tick": time.time(),
+        "brush_shape": BRUSHES[0],
+        "stamp_pattern": "Glider",
+        "stamp_rotate": 0,
+        "stamp_flip": False,
         "preset": "Blank",
         "density": 0.3,
+        "fit_view": True,
+        "view_row": 25,
+        "view_col": 25,
         "click_key": 0,
+        "transport": TRANSPORTS[0],
+        "canvas_click": 0,
+        "canvas_resync": 0,
+        "rule_name": next(iter(RULES)),
+        "custom_rule": CONWAY.rulestring,
     }
     for k, v in defaults.items():
         if k not in st.session_state:
             st.session_state[k] = v
-
-
-def _grid_to_image(grid: np.ndarray, cell_size: int) -> Image.Image:
-    expanded = np.repeat(np.repeat(grid, cell_size, axis=0), cell_size, axis=1)
-    img = np.where(expanded[:, :, None], (40, 40, 40), (255, 255, 255)).astype(np.uint8)
-    return Image.fromarray(img)
-
-
-def _apply_edit(grid: np.ndarray, row: int, col: int, mode: str, brush: int) -> None:
-    h, w = grid.shape
-    r0, r1 = max(0, row - brush), min(h, row + brush + 1)
-    c0, c1 = max(0, col - brush), min(w, col + brush + 1)
-    if mode == "Paint":
-        grid[r0:r1, c0:c1] = 1
-    elif mode == "Erase":
-        grid[r0:r1, c0:c1] = 0
-    else:
-        grid[r0:r1, c0:c1] = 1 - grid[r0:r1, c0:c1]
+    if "worker" not in st.session_state:
+        st.session_state.worker = SimulationWorker(
+            st.session_state.grid,
+            st.session_state.wrap,
+            rate=st.session_state.speed_gps,
+            metrics=MetricsRecorder(METRICS_WINDOW),
+            keyframes=_keyframe_cache(),
+            idle_timeout=WORKER_IDLE_SECONDS,
+        )
+
+
+def _sync_frame() -> Frame:
+    """Copy the worker's latest frame into session_state for this run."""
+    frame = st.session_state.worker.snapshot()
+    st.session_state.grid = frame.grid
+    st.session_state.generation = frame.generation
+    st.session_state.playing = frame.playing
+    return frame
+
+
+def _replace_grid(grid: np.ndarray) -> None:
+    """Hand a new board to the worker and restart the generation counter."""
+    st.session_state.worker.update(lambda _: grid, generation=0)
+    st.session_state.pop("history", None)
+
+
+def _current_rule() -> Rule:
+    """Rule selected in the sidebar; an invalid custom rulestring falls back to Conway."""
+    if st.session_state.rule_name in RULES:
+        return RULES[st.session_state.rule_name]
+    try:
+        return parse_rule(st.session_state.custom_rule)
+    except RuleError as exc:
+        st.session_state.rule_warning = str(exc)
+        return CONWAY
+
+
+def _renderer() -> ViewportRenderer:
+    """Session viewport renderer; it keeps the incremental frame between reruns."""
+    if "renderer" not in st.session_state:
+        st.session_state.renderer = ViewportRenderer()
+    return st.session_state.renderer
+
+
+def _viewport(shape: tuple[int, int]) -> Viewport:
+    """Whole board (zoomed out if needed) or a window at the chosen cell size."""
+    if st.session_state.fit_view:
+        return Viewport.fit(shape, VIEW_MAX_PX, st.session_state.cell_size)
+    center = (min(st.session_state.view_row, shape[0] - 1), min(st.session_state.view_col, shape[1] - 1))
+    return Viewport.window(shape, VIEW_MAX_PX, st.session_state.cell_size, center)
+
+
+def _encoder() -> DeltaEncoder:
+    """Session delta encoder; it remembers what the canvas currently shows."""
+    if "encoder" not in st.session_state:
+        st.session_state.encoder = DeltaEncoder()
+    return st.session_state.encoder
+
+
+def _canvas_event(viewport: Viewport) -> Optional[dict[str, Any]]:
+    """Send this frame to the canvas as a delta; returns a click not handled yet."""
+    encoder = _encoder()
+    # The canvas bumps `resync` when a delta does not follow what it holds.
+    value = st.session_state.get(CANVAS_KEY) or {}
+    if value.get("resync", 0) != st.session_state.canvas_resync:
+        st.session_state.canvas_resync = value["resync"]
+        encoder.request_keyframe()
+    levels = viewport_levels(st.session_state.grid, viewport)
+    scale = viewport.cell_px if viewport.block == 1 else 1
+    event = grid_canvas(encoder.encode(levels, scale, SHADES), key=CANVAS_KEY) or {}
+    if event.get("click", 0) == st.session_state.canvas_click or event.get("x") is None:
+        return None
+    st.session_state.canvas_click = event["click"]
+    return event
+
+
+def _history() -> EditHistory:
+    """Session undo history; diffs only fit the board they were made on, so stepping drops them."""
+    if "history" not in st.session_state:
+        st.session_state.history = EditHistory(UNDO_LIMIT)
+    history = st.session_state.history
+    if st.session_state.get("edit_generation") != st.session_state.generation:
+        history.clear()
+    return history
+
+
+def _edit(change: Callable[[EditHistory, np.ndarray], object]) -> None:
+    """Run change(history, board) on the worker's board in one update."""
+    history = _history()
+
+    def run(board: np.ndarray) -> np.ndarray:
+        change(history, board)
+        return board
+
+    frame = st.session_state.worker.update(run)
+    st.session_state.edit_generation = frame.generation
+
+
+def _click_edits(event: dict[str, Any], viewport: Viewport) -> list[Edit]:
+    """The edit batch for a click, or a drag's points, in image pixels."""
+    points = event.get("points") or [[event["x"], event["y"]]]
+    cells = [cell for x, y in points if (cell := viewport.cell_at(int(x), int(y))) is not None]
+    if not cells:
+        return []
+    if st.session_state.edit_mode == "Stamp":
+        pattern = load_stamp(st.session_state.stamp_pattern)
+        rotate, flip = st.session_state.stamp_rotate // 90, st.session_state.stamp_flip
+        height, width = transform(pattern, rotate, flip).shape
+        r, c = cells[-1]
+        return [Stamp(pattern, r - height // 2, c - width // 2, rotate, flip)]
+    return [
+        Stroke(
+            np.array(cells),
+            st.session_state.edit_mode.lower(),
+            st.session_state.brush_size,
+            st.session_state.brush_shape,
+            connected=True,
+        )
+    ]
+
+
+def _metrics_panel() -> None:
+    """Tick time and activity over the recent window of generations."""
+    recorder = st.session_state.worker.metrics
+    latest = recorder.latest() if recorder is not None else None
+    if latest is None:
+        return
+    with st.expander("Metrics"):
+        summary = recorder.summary()
+        a, b, c, d = st.columns(4)
+        a.metric("Tick (ms, p95)", f"{summary['p95_seconds'] * 1e3:.2f}")
+        b.metric("Population", latest.population)
+        c.metric("Births / deaths", f"{latest.births} / {latest.deaths}")
+        d.metric("Bounding box", f"{latest.rows}×{latest.cols}")
+        data = recorder.to_array()
+        st.line_chart({"population": data["population"], "births": data["births"], "deaths": data["deaths"]})
+        st.line_chart({"tick ms": data["seconds"] * 1e3})
 
 
 def main() -> None:
     st.set_page_config(page_title="Conway's Game of Life", layout="wide")
     _default_state()
+    report = _engine_self_test()
+    if not report.passed:
+        names = ", ".join(f.name for f in report.failures[:5])
+        st.error(f"Engine self-test failed ({len(report.failures)} checks: {names}). Results may be wrong.")
+    frame = _sync_frame()
 
     with st.sidebar:
         st.subheader("Grid size")
-        rows = st.number_input("Rows", min_value=5, max_value=200, value=st.session_state.rows, step=1)
-        cols = st.number_input("Columns", min_value=5, max_value=200, value=st.session_state.cols, step=1)
+        rows = st.number_input("Rows", min_value=5, max_value=MAX_BOARD_SIDE, value=st.session_state.rows, step=1)
+        cols = st.number_input("Columns", min_value=5, max_value=MAX_BOARD_SIDE, value=st.session_state.cols, step=1)
         cell_size = st.slider("Cell size (px)", 4, 24, st.session_state.cell_size, 2)
 
+        st.subheader("View")
+        st.session_state.fit_view = st.checkbox("Fit whole board", value=st.session_state.fit_view)
+        if not st.session_state.fit_view:
+            board_rows, board_cols = st.session_state.grid.shape
+            st.session_state.view_row = st.slider(
+                "Centre row", 0, board_rows - 1, min(st.session_state.view_row, board_rows - 1)
+            )
+            st.session_state.view_col = st.slider(
+                "Centre column", 0, board_cols - 1, min(st.session_state.view_col, board_cols - 1)
+            )
+
+        st.session_state.transport = st.radio(
+            "Transport", TRANSPORTS, index=TRANSPORTS.index(st.session_state.transport)
+        )
+
         st.subheader("Initial structure")
         preset = st.selectbox("Preset", list(PRESETS.keys()), index=list(PRESETS.keys()).index(st.session_state.preset))
         density = st.session_state.density
@@ -223,63 +295,109 @@ def main() -> None:
             if err:
                 st.session_state.preset_warning = err
             else:
-                st.session_state.grid = grid
+                _replace_grid(grid)
                 st.session_state.rows, st.session_state.cols = rows, cols
                 st.session_state.cell_size = cell_size
                 st.session_state.preset, st.session_state.density = preset, density
-                st.session_state.generation = 0
                 st.session_state.pop("preset_warning", None)
             st.rerun()
 
         st.subheader("Editing")
-        edit_mode = st.radio("Mode", ["Toggle", "Paint", "Erase"], index=["Toggle", "Paint", "Erase"].index(st.session_state.edit_mode))
+        edit_mode = st.radio("Mode", EDIT_MODES, index=EDIT_MODES.index(st.session_state.edit_mode))
         st.session_state.edit_mode = edit_mode
-        st.session_state.brush_size = st.slider("Brush size", 1, 5, st.session_state.brush_size, 1)
+        if edit_mode == "Stamp":
+            patterns = [name for name in PRESETS if name not in ("Blank", "Random")]
+            st.session_state.stamp_pattern = st.selectbox(
+                "Pattern", patterns, index=patterns.index(st.session_state.stamp_pattern)
+            )
+            st.session_state.stamp_rotate = st.select_slider(
+                "Rotate (degrees)", [0, 90, 180, 270], value=st.session_state.stamp_rotate
+            )
+            st.session_state.stamp_flip = st.checkbox("Mirror", value=st.session_state.stamp_flip)
+        else:
+            st.session_state.brush_size = st.slider("Brush size", 0, MAX_BRUSH, st.session_state.brush_size, 1)
+            st.session_state.brush_shape = st.radio(
+                "Brush shape", BRUSHES, index=BRUSHES.index(st.session_state.brush_shape), horizontal=True
+            )
+        history = _history()
+        undo, redo = st.columns(2)
+        if undo.button("Undo", disabled=not history.can_undo):
+            _edit(lambda h, board: h.undo(board))
+            st.rerun()
+        if redo.button("Redo", disabled=not history.can_redo):
+            _edit(lambda h, board: h.redo(board))
+            st.rerun()
         if st.button("Clear"):
-            st.session_state.grid = np.zeros((st.session_state.rows, st.session_state.cols), dtype=DTYPE)
-            st.session_state.generation = 0
+            _replace_grid(np.zeros((st.session_state.rows, st.session_state.cols), dtype=DTYPE))
             st.rerun()
 
         st.subheader("Simulation")
+        worker = st.session_state.worker
         if st.button("Pause" if st.session_state.playing else "Play"):
-            st.session_state.playing = not st.session_state.playing
-            st.session_state.last_tick = time.time()
+            if st.session_state.playing:
+                worker.pause()
+            else:
+                worker.play()
             st.rerun()
+        st.session_state.step_size = st.number_input(
+            "Generations per step", min_value=1, max_value=MAX_STEP, value=st.session_state.step_size, step=1
+        )
         if st.button("Step"):
-            st.session_state.grid = next_generation(st.session_state.grid, st.session_state.wrap)
-            st.session_state.generation += 1
+            worker.step(st.session_state.step_size)
             st.rerun()
 
-        st.session_state.speed_ms = st.slider("Speed (ms per tick)", 50, 1000, st.session_state.speed_ms, 50)
+        st.session_state.speed_gps = st.select_slider(
+            "Speed (generations/s)", SPEED_OPTIONS, value=st.session_state.speed_gps
+        )
+        worker.set_rate(None if st.session_state.speed_gps == "Max" else float(st.session_state.speed_gps))
+        st.session_state.redraw_ms = st.slider("Redraw every (ms)", 50, 1000, st.session_state.redraw_ms, 50)
         st.session_state.wrap = st.checkbox("Toroidal wrap", value=st.session_state.wrap)
 
+        rule_names = [*RULES, "Custom"]
+        st.session_state.rule_name = st.selectbox(
+            "Rule", rule_names, index=rule_names.index(st.session_state.rule_name)
+        )
+        if st.session_state.rule_name == "Custom":
+            st.session_state.custom_rule = st.text_input("Rulestring (B/S)", st.session_state.custom_rule)
+        st.session_state.pop("rule_warning", None)
+        rule = _current_rule()
+        worker.configure(wrap=st.session_state.wrap, rule=rule)
+
     if st.session_state.get("preset_warning"):
         st.warning(st.session_state.preset_warning)
+    if st.session_state.get("rule_warning"):
+        st.warning(st.session_state.rule_warning)
 
-    st.caption(f"Generation: {st.session_state.generation}  |  Wrap: {'On' if st.session_state.wrap else 'Off'}")
-
-    img = _grid_to_image(st.session_state.grid, st.session_state.cell_size)
-    event = streamlit_image_coordinates(img, key=f"grid_{st.session_state.click_key}")
+    st.caption(
+        f"Generation: {st.session_state.generation}  |  Wrap: {'On' if st.session_state.wrap else 'Off'}"
+        f"  |  Rule: {rule}"
+    )
+    cycle = frame.cycle
+    if cycle is not None:
+        st.info(
+            f"Board is still since generation {cycle.start}." if cycle.still
+            else f"Board repeats with period {cycle.period} since generation {cycle.start}."
+        )
+
+    viewport = _viewport(st.session_state.grid.shape)
+    if viewport.block > 1:
+        st.caption(f"Zoomed out: each pixel shades {viewport.block}×{viewport.block} cells by density.")
+    if st.session_state.transport == TRANSPORTS[1]:
+        event = _canvas_event(viewport)
+    else:
+        img = _renderer().render(st.session_state.grid, viewport)
+        event = streamlit_image_coordinates(img, key=f"grid_{st.session_state.click_key}")
     if event and event.get("x") is not None and event.get("y") is not None:
-        c = int(event["x"]) // st.session_state.cell_size
-        r = int(event["y"]) // st.session_state.cell_size
-        if 0 <= r < st.session_state.grid.shape[0] and 0 <= c < st.session_state.grid.shape[1]:
-            _apply_edit(st.session_state.grid, r, c, st.session_state.edit_mode, st.session_state.brush_size)
+        edits = _click_edits(event, viewport)
+        if edits:
+            _edit(lambda h, board: h.apply(board, edits))
             st.session_state.click_key += 1
             st.rerun()
-
-    try:
-        self_check_neighbors()
-        self_check_preset_bounds()
-    except Exception:
-        logger.exception("self_check_failed")
+    _metrics_panel()
 
     if st.session_state.playing:
-        if time.time() - st.session_state.last_tick >= st.session_state.speed_ms / 1000.0:
-            st.session_state.grid = next_generation(st.session_state.grid, st.session_state.wrap)
-            st.session_state.generation += 1
-            st.session_state.last_tick = time.time()
-        time.sleep(st.session_state.speed_ms / 1000.0)
+        # The worker keeps stepping meanwhile; this only sets how often the frame is redrawn.
+        time.sleep(st.session_state.redraw_ms / 1000.0)
         st.rerun()
 
 
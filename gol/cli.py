@@ -0,0 +1,255 @@
+"""
+Headless runner and benchmark harness for the Game of Life engines.
+
+    python cli.py run --preset Glider --rows 64 --cols 64 --generations 500 --wrap
+    python cli.py run --rle pattern.rle --engine bitpacked --population pop.csv
+    python cli.py run --rows 4096 --cols 4096 --generations 100000 --checkpoint-every 1000 --resume
+    python cli.py advance board.golb --generations 10 --band-rows 4096
+    python cli.py bench --sizes 64,256 --densities 0.1,0.3 --output bench.json
+
+`run` simulates one board, optionally writing .npy snapshots every N
+generations and a generation,population CSV, then prints gen/s and cells/s.
+With --checkpoint-every it also saves .golb board files (see storage.board);
+--resume continues from the newest one, with its rule and wrap mode, up to
+--generations in total. --metrics writes one JSON line of per-generation
+stats (tick time, population, births, deaths, bounding box) per generation.
+`advance` steps a .golb file in place band by band
+through np.memmap, for boards that do not fit in memory.
+`bench` runs every engine over a grid of board sizes and densities, saves
+the results as JSON and, given --baseline, exits 1 if any case slowed down by
+more than --tolerance.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import math
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+
+from common.logging import close_handlers, json_lines_logger
+from engine.benchmark import compare, environment, run_suite
+from engine.errors import EngineError
+from engine.metrics import InstrumentedStepper, MetricsRecorder
+from engine.presets import PRESETS, build_initial_grid, center_pattern
+from engine.registry import ENGINES, make_stepper
+from engine.rules import CONWAY, parse_rule
+from patterns.rle import read_rle
+from storage.board import advance_board_file, save_board
+from storage.checkpoint import Checkpointer, latest_checkpoint, resume
+
+__all__ = ["main"]
+
+
+def _int_list(text: str) -> list[int]:
+    return [int(v) for v in text.split(",") if v.strip()]
+
+
+def _float_list(text: str) -> list[float]:
+    return [float(v) for v in text.split(",") if v.strip()]
+
+
+def _engine_list(text: str) -> list[str]:
+    names = list(ENGINES) if text == "all" else [v.strip() for v in text.split(",") if v.strip()]
+    unknown = [n for n in names if n not in ENGINES]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown engine(s) {', '.join(unknown)}; choose from {', '.join(ENGINES)}")
+    return names
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="gol", description="Headless Game of Life runner and benchmarks.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Simulate one board.")
+    source = run.add_mutually_exclusive_group()
+    source.add_argument("--preset", default="Random", choices=list(PRESETS), help="Built-in preset (default Random).")
+    source.add_argument("--rle", type=Path, help="RLE pattern file, centred on the board.")
+    run.add_argument("--rows", type=int, default=64)
+    run.add_argument("--cols", type=int, default=64)
+    run.add_argument("--density", type=float, default=0.3, help="Live fraction for the Random preset.")
+    run.add_argument("--seed", type=int, default=None, help="Seed for the Random preset.")
+    run.add_argument("--generations", type=int, default=100)
+    run.add_argument("--rule", default=None, help="Rulestring, e.g. B36/S23 (default: RLE header rule or B3/S23).")
+    run.add_argument("--wrap", action="store_true", help="Toroidal board (default: dead border).")
+    run.add_argument("--engine", default="dense", choices=list(ENGINES))
+    run.add_argument("--snapshot-every", type=int, default=0, help="Save the board every N generations.")
+    run.add_argument("--snapshot-dir", type=Path, default=Path("snapshots"))
+    run.add_argument("--population", type=Path, help="Write a generation,population CSV here.")
+    run.add_argument("--checkpoint-every", type=int, default=0, help="Save a .golb checkpoint every N generations.")
+    run.add_argument("--checkpoint-dir", type=Path, default=Path("checkpoints"))
+    run.add_argument("--resume", action="store_true", help="Continue from the newest checkpoint, if any.")
+    run.add_argument("--save", type=Path, help="Write the final board as a .golb file.")
+    run.add_argument("--metrics", type=Path, help="Write per-generation stats here as JSON lines.")
+    run.add_argument("--metrics-every", type=int, default=1, help="Log every Nth generation's stats.")
+
+    advance = sub.add_parser("advance", help="Step a .golb board file in place, band by band.")
+    advance.add_argument("board", type=Path)
+    advance.add_argument("--generations", type=int, default=1)
+    advance.add_argument("--band-rows", type=int, default=None, help="Rows per band (default: about 64 MiB).")
+
+    bench = sub.add_parser("bench", help="Benchmark engines over sizes and densities.")
+    bench.add_argument("--engines", type=_engine_list, default=list(ENGINES), help="Comma list or 'all'.")
+    bench.add_argument("--sizes", type=_int_list, default=[64, 256, 512], help="Square board sizes, comma list.")
+    bench.add_argument("--densities", type=_float_list, default=[0.1, 0.3])
+    bench.add_argument("--generations", type=int, default=100)
+    bench.add_argument("--repeat", type=int, default=3, help="Best of N runs per case.")
+    bench.add_argument("--rule", default=CONWAY.rulestring)
+    bench.add_argument("--no-wrap", dest="wrap", action="store_false", help="Dead border instead of a torus.")
+    bench.add_argument("--seed", type=int, default=0)
+    bench.add_argument("--output", type=Path, help="Write results as JSON here.")
+    bench.add_argument("--baseline", type=Path, help="Earlier --output file to compare against.")
+    bench.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown vs baseline (0.2 = 20%%).")
+    return parser
+
+
+def _initial_board(args: argparse.Namespace) -> tuple[np.ndarray, Optional[str]]:
+    """Return (grid, header_rule); header_rule is the RLE file's rule, if any."""
+    if args.rle is not None:
+        pattern = read_rle(args.rle)
+        grid, err = center_pattern(args.rows, args.cols, pattern.cells)
+        header_rule = pattern.rule
+    else:
+        rng = np.random.default_rng(args.seed)
+        grid, err = build_initial_grid(args.rows, args.cols, args.preset, args.density, rng)
+        header_rule = None
+    if err:
+        raise EngineError(err)
+    return grid, header_rule
+
+
+def _run(args: argparse.Namespace) -> int:
+    if args.generations < 0 or args.snapshot_every < 0 or args.checkpoint_every < 0:
+        raise EngineError("--generations, --snapshot-every and --checkpoint-every must be non-negative.")
+    checkpoint = latest_checkpoint(args.checkpoint_dir) if args.resume else None
+    if checkpoint is not None:
+        header, grid = resume(args.checkpoint_dir)
+        rule, wrap, start = header.rule, header.wrap, header.generation
+    else:
+        grid, header_rule = _initial_board(args)
+        rule, wrap, start = parse_rule(args.rule or header_rule or CONWAY.rulestring), args.wrap, 0
+    if args.snapshot_every:
+        args.snapshot_dir.mkdir(parents=True, exist_ok=True)
+    checkpointer = Checkpointer(args.checkpoint_dir, args.checkpoint_every, rule, wrap) if args.checkpoint_every else None
+    series = [(start, int(grid.sum()))]
+    # Only step generation by generation when something has to be recorded.
+    intervals = [n for n in (args.snapshot_every, args.checkpoint_every) if n]
+    every = 1 if args.population else (math.gcd(*intervals) if intervals else max(args.generations, 1))
+
+    stepper = make_stepper(args.engine, grid, wrap, rule)
+    recorder = None
+    if args.metrics:
+        recorder = MetricsRecorder(logger=json_lines_logger("gol.metrics", args.metrics), log_every=args.metrics_every)
+        stepper = InstrumentedStepper(stepper, recorder, start)
+    elapsed = 0.0
+    try:
+        done = start
+        while done < args.generations:
+            n = min(every - done % every, args.generations - done)
+            t0 = time.perf_counter()
+            board = stepper.run(n)
+            elapsed += time.perf_counter() - t0
+            done += n
+            if args.population:
+                series.append((done, int(board.sum())))
+            if args.snapshot_every and done % args.snapshot_every == 0:
+                np.save(args.snapshot_dir / f"gen_{done:06d}.npy", board)
+            if checkpointer is not None:
+                checkpointer.maybe_save(board, done)
+        final = stepper.grid
+    finally:
+        stepper.close()
+        if recorder is not None:
+            close_handlers(recorder.logger)
+    if args.save:
+        save_board(args.save, final, rule, wrap, done)
+
+    if args.population:
+        with args.population.open("w", newline="") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["generation", "population"])
+            writer.writerows(series)
+
+    rows, cols = grid.shape
+    ran = max(args.generations - start, 0)
+    gens_per_sec = ran / elapsed if elapsed > 0 else float("inf")
+    resumed = f" (resumed at generation {start})" if checkpoint is not None else ""
+    print(
+        f"{args.engine} {rows}x{cols} {rule} wrap={'on' if wrap else 'off'}: "
+        f"{ran} generations in {elapsed:.3f} s{resumed}, "
+        f"{gens_per_sec:,.1f} gen/s, {gens_per_sec * rows * cols:,.0f} cells/s, "
+        f"final population {int(final.sum())}"
+    )
+    if recorder is not None and len(recorder):
+        summary = recorder.summary()
+        print(
+            f"tick mean {summary['mean_seconds'] * 1e3:.3f} ms, p95 {summary['p95_seconds'] * 1e3:.3f} ms, "
+            f"max {summary['max_seconds'] * 1e3:.3f} ms over the last {summary['generations']} generations"
+        )
+    return 0
+
+
+def _advance(args: argparse.Namespace) -> int:
+    start = time.perf_counter()
+    header = advance_board_file(args.board, args.generations, args.band_rows)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{args.board} {header.rows}x{header.cols} {header.rule} wrap={'on' if header.wrap else 'off'}: "
+        f"now at generation {header.generation}, {args.generations} generations in {elapsed:.3f} s"
+    )
+    return 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    rule = parse_rule(args.rule)
+    results = run_suite(
+        args.engines,
+        [(n, n) for n in args.sizes],
+        args.densities,
+        wrap=args.wrap,
+        generations=args.generations,
+        repeat=args.repeat,
+        rule=rule,
+        seed=args.seed,
+    )
+    for r in results:
+        print(
+            f"{r.engine:>10} {r.rows:>5}x{r.cols:<5} density={r.density:<4} "
+            f"{r.gens_per_sec:>12,.1f} gen/s {r.cells_per_sec:>16,.0f} cells/s"
+        )
+    if args.output:
+        report = {
+            "environment": environment(),
+            "rule": rule.rulestring,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "results": [r.as_dict() for r in results],
+        }
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    try:
+        commands = {"run": _run, "advance": _advance, "bench": _bench}
+        return commands[args.command](args)
+    except (EngineError, OSError) as exc:
+        parser.exit(2, f"gol: error: {exc}\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,15 @@
-"""Structured JSON logging; no PII."""
+"""Structured JSON logging; no PII.
+
+Pass structured values with `extra={"fields": {...}}`; they are merged into
+the JSON record under their own keys.
+"""
 import json
 import logging
 import sys
-from typing import Any
+from pathlib import Path
+from typing import Any, Union
 
-__all__ = ["get_logger"]
+__all__ = ["JsonFormatter", "close_handlers", "get_logger", "json_lines_logger"]
 
 
 class JsonFormatter(logging.Formatter):
@@ -15,9 +20,12 @@ class JsonFormatter(logging.Formatter):
             "logger": record.name,
             "message": record.getMessage(),
         }
+        fields = getattr(record, "fields", None)
+        if isinstance(fields, dict):
+            out.update({k: v for k, v in fields.items() if k not in out})
         if record.exc_info:
             out["exception"] = self.formatException(record.exc_info)
-        return json.dumps(out)
+        return json.dumps(out, default=str)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -28,3 +36,21 @@ def get_logger(name: str) -> logging.Logger:
         logger.addHandler(handler)
         logger.setLevel(logging.INFO)
     return logger
+
+
+def json_lines_logger(name: str, path: Union[str, Path]) -> logging.Logger:
+    """Logger that writes one JSON record per line to `path` only (no propagation)."""
+    logger = logging.getLogger(name)
+    close_handlers(logger)
+    handler = logging.FileHandler(path, mode="w", encoding="utf-8")
+    handler.setFormatter(JsonFormatter())
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+def close_handlers(logger: logging.Logger) -> None:
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
@@ -0,0 +1,21 @@
+__all__ = [
+    "active",
+    "batch",
+    "benchmark",
+    "bitpacked",
+    "buffered",
+    "cycles",
+    "dense",
+    "editing",
+    "errors",
+    "hashlife",
+    "keyframes",
+    "metrics",
+    "parallel",
+    "presets",
+    "registry",
+    "rules",
+    "runner",
+    "selftest",
+    "sparse",
+]
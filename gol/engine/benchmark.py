@@ -0,0 +1,138 @@
+"""
+Repeatable engine benchmarks: board sizes × densities × engines.
+
+Every case builds a seeded random soup, constructs the engine's stepper
+outside the timed region, then times `run(generations)` plus reading the
+final grid, keeping the best of `repeat` runs. Results are plain dicts so a
+suite serializes straight to JSON; compare() flags cases that got slower than
+a saved baseline by more than a tolerance.
+"""
+from __future__ import annotations
+
+import os
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+from engine.batch import random_soups
+from engine.errors import EngineError
+from engine.registry import make_stepper
+from engine.rules import Rule
+
+__all__ = ["BenchResult", "compare", "environment", "run_case", "run_suite", "time_engine"]
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    engine: str
+    rows: int
+    cols: int
+    density: float
+    wrap: bool
+    generations: int
+    seconds: float
+
+    @property
+    def key(self) -> tuple[str, int, int, float, bool]:
+        return (self.engine, self.rows, self.cols, self.density, self.wrap)
+
+    @property
+    def gens_per_sec(self) -> float:
+        return self.generations / self.seconds if self.seconds > 0 else float("inf")
+
+    @property
+    def cells_per_sec(self) -> float:
+        return self.gens_per_sec * self.rows * self.cols
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "gens_per_sec": self.gens_per_sec, "cells_per_sec": self.cells_per_sec}
+
+
+def time_engine(engine: str, grid: np.ndarray, wrap: bool, generations: int, rule: Optional[Rule] = None) -> float:
+    """Wall time of one `generations`-step run of `engine` from `grid`."""
+    stepper = make_stepper(engine, grid, wrap, rule)
+    try:
+        start = time.perf_counter()
+        stepper.run(generations)
+        _ = stepper.grid
+        return time.perf_counter() - start
+    finally:
+        stepper.close()
+
+
+def run_case(
+    engine: str,
+    rows: int,
+    cols: int,
+    density: float,
+    wrap: bool = True,
+    generations: int = 100,
+    repeat: int = 3,
+    rule: Optional[Rule] = None,
+    seed: int = 0,
+) -> BenchResult:
+    """Best-of-`repeat` timing of one engine on one seeded random board."""
+    if generations <= 0 or repeat <= 0:
+        raise EngineError("generations and repeat must be positive.")
+    grid = random_soups(1, rows, cols, density, np.random.default_rng(seed))[0]
+    best = min(time_engine(engine, grid, wrap, generations, rule) for _ in range(repeat))
+    return BenchResult(engine, rows, cols, density, wrap, generations, best)
+
+
+def run_suite(
+    engines: Iterable[str],
+    sizes: Iterable[tuple[int, int]],
+    densities: Iterable[float],
+    wrap: bool = True,
+    generations: int = 100,
+    repeat: int = 3,
+    rule: Optional[Rule] = None,
+    seed: int = 0,
+) -> list[BenchResult]:
+    """Every engine on every (size, density) combination, same seed per board."""
+    densities = list(densities)
+    engines = list(engines)
+    return [
+        run_case(engine, rows, cols, density, wrap, generations, repeat, rule, seed)
+        for rows, cols in sizes
+        for density in densities
+        for engine in engines
+    ]
+
+
+def environment() -> dict[str, Any]:
+    """Machine and library details recorded alongside benchmark results."""
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(
+    results: Iterable[BenchResult], baseline: Iterable[dict[str, Any]], tolerance: float = 0.2
+) -> list[str]:
+    """Describe each case more than `tolerance` slower than its baseline entry.
+
+    `baseline` is the "results" list of a saved suite; cases missing from it
+    are ignored.
+    """
+    previous = {
+        (b["engine"], b["rows"], b["cols"], b["density"], b["wrap"]): b["gens_per_sec"] for b in baseline
+    }
+    regressions = []
+    for r in results:
+        before = previous.get(r.key)
+        if before and r.gens_per_sec < before * (1 - tolerance):
+            regressions.append(
+                f"{r.engine} {r.rows}x{r.cols} density={r.density} wrap={r.wrap}: "
+                f"{r.gens_per_sec:.1f} gen/s vs baseline {before:.1f} gen/s"
+            )
+    return regressions
@@ -0,0 +1,77 @@
+"""
+Cycle and still-life detection from compact board hashes.
+
+Each observed board is reduced to a 16-byte BLAKE2b digest of its bit-packed
+cells (plus shape), so a window of thousands of generations costs a few
+hundred kilobytes. A repeated digest means the run has entered a cycle: the
+period is the distance between the two sightings, and the start is the first
+sighting. Extinction shows up as a period-1 cycle of the empty board.
+"""
+from __future__ import annotations
+
+import hashlib
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from engine.errors import EngineError
+
+__all__ = ["Cycle", "CycleDetector", "board_hash"]
+
+DEFAULT_WINDOW = 256
+
+
+def board_hash(grid: np.ndarray) -> bytes:
+    """Digest of the board's shape and packed cells."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.asarray(grid.shape, dtype=np.int64).tobytes())
+    h.update(np.packbits(grid != 0).tobytes())
+    return h.digest()
+
+
+@dataclass(frozen=True)
+class Cycle:
+    start: int
+    period: int
+
+    @property
+    def still(self) -> bool:
+        return self.period == 1
+
+
+class CycleDetector:
+    """Remembers the last `window` board hashes and reports the first repeat."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        if window <= 0:
+            raise EngineError("window must be positive.")
+        self.window = window
+        self.cycle: Optional[Cycle] = None
+        self._order: deque[tuple[int, bytes]] = deque()
+        self._seen: dict[bytes, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def reset(self) -> None:
+        self.cycle = None
+        self._order.clear()
+        self._seen.clear()
+
+    def observe(self, grid: np.ndarray, generation: int) -> Optional[Cycle]:
+        """Record the board at `generation`; return the cycle once one is found."""
+        if self.cycle is not None:
+            return self.cycle
+        digest = board_hash(grid)
+        first = self._seen.get(digest)
+        if first is not None:
+            self.cycle = Cycle(start=first, period=generation - first)
+            return self.cycle
+        self._seen[digest] = generation
+        self._order.append((generation, digest))
+        if len(self._order) > self.window:
+            _, old = self._order.popleft()
+            del self._seen[old]
+        return None
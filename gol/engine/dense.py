@@ -0,0 +1,61 @@
+"""
+Dense Life engine: one uint8 cell per array element, NumPy-vectorized.
+
+Wrap ON: the board is a torus; neighbors are gathered with np.roll, so the
+left edge sees the right edge and the top sees the bottom.
+Wrap OFF: cells beyond the board are dead; the grid is zero-padded by one
+cell and the eight shifted slices of the padded array are summed.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+from engine.rules import Rule, apply_rule
+
+__all__ = [
+    "DTYPE",
+    "count_neighbors_no_wrap",
+    "count_neighbors_wrap",
+    "next_generation",
+    "sum_padded_neighbors",
+]
+
+DTYPE = np.uint8
+
+
+def count_neighbors_wrap(grid: np.ndarray) -> np.ndarray:
+    """Count live neighbors with toroidal wrap via np.roll in 8 directions."""
+    out = np.zeros(grid.shape, dtype=DTYPE)
+    for dr in (-1, 0, 1):
+        for dc in (-1, 0, 1):
+            if dr == 0 and dc == 0:
+                continue
+            out += np.roll(np.roll(grid, dr, axis=0), dc, axis=1)
+    return out
+
+
+def sum_padded_neighbors(padded: np.ndarray) -> np.ndarray:
+    """Neighbor counts for the interior of an array that already carries a 1-cell halo.
+
+    Works on the last two axes, so a stack of padded tiles is counted in one call.
+    """
+    return (
+        padded[..., 0:-2, 0:-2] + padded[..., 0:-2, 1:-1] + padded[..., 0:-2, 2:]
+        + padded[..., 1:-1, 0:-2] + padded[..., 1:-1, 2:]
+        + padded[..., 2:, 0:-2] + padded[..., 2:, 1:-1] + padded[..., 2:, 2:]
+    )
+
+
+def count_neighbors_no_wrap(grid: np.ndarray) -> np.ndarray:
+    """Count live neighbors without wrap; outside = dead. Zero-pad and slice."""
+    padded = np.zeros((grid.shape[0] + 2, grid.shape[1] + 2), dtype=DTYPE)
+    padded[1:-1, 1:-1] = grid
+    return sum_padded_neighbors(padded)
+
+
+def next_generation(grid: np.ndarray, wrap: bool, rule: Optional[Rule] = None) -> np.ndarray:
+    """Apply `rule` (default Conway: survival 2–3, birth 3, else dead)."""
+    n = count_neighbors_wrap(grid) if wrap else count_neighbors_no_wrap(grid)
+    return apply_rule(grid, n, rule)
@@ -0,0 +1,325 @@
+"""
+Batched board editing: brush strokes, pattern stamps, undo and redo.
+
+An edit batch is a sequence of Stroke and Stamp values applied to a board in
+place by apply_edits. A Stroke paints, erases or toggles a brush (a square
+or round footprint of radius `brush`) at many points at once, optionally
+joined into a polyline for drag painting; the whole footprint is built as
+horizontal spans, turned into a mask with one difference array and one
+cumulative sum over the stroke's bounding box, and applied with a single
+masked assignment. A Stamp pastes a pattern (a preset, a pattern file or
+any 0/1 array), rotated by quarter turns and optionally mirrored, at a
+top-left offset; both are clipped to the board.
+
+apply_edits returns a Diff: the flat indices of every cell the batch
+flipped, found by XOR-ing the touched bounding box before and after. Since
+flipping the same cells again restores the board, one Diff serves for undo
+and redo alike, and EditHistory keeps bounded stacks of them. Diffs cost
+bytes per changed cell rather than a copy of the board; they describe a
+board at one generation, so a history is only valid until the board steps.
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from engine.dense import DTYPE
+from engine.errors import EngineError, GridShapeError
+from engine.presets import PRESETS
+from patterns.formats import read_pattern
+from patterns.model import Pattern
+
+__all__ = [
+    "BRUSHES",
+    "Diff",
+    "Edit",
+    "EditError",
+    "EditHistory",
+    "STAMP_MODES",
+    "STROKE_MODES",
+    "Stamp",
+    "Stroke",
+    "apply_edits",
+    "line_points",
+    "load_stamp",
+    "transform",
+]
+
+STROKE_MODES = ("paint", "erase", "toggle")
+STAMP_MODES = ("paste", "or", "xor")
+BRUSHES = ("square", "round")
+
+Edit = Union["Stroke", "Stamp"]
+
+
+class EditError(EngineError):
+    """Invalid edit, or a diff that does not belong to the board."""
+
+
+def _points(points: object) -> np.ndarray:
+    array = np.asarray(points)
+    if array.size == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    if array.ndim != 2 or array.shape[1] != 2 or not np.issubdtype(array.dtype, np.integer):
+        raise EditError(f"Expected (n, 2) integer (row, col) points, got {array.dtype} {array.shape}.")
+    return array.astype(np.int64)
+
+
+@dataclass(frozen=True)
+class Stroke:
+    """Brush dabs at `points` ((n, 2) rows and columns), joined by lines when `connected`.
+
+    `brush` is the footprint radius: 0 is one cell, 1 a 3x3 square (or
+    disc), and so on.
+    """
+
+    points: np.ndarray
+    mode: str = "paint"
+    brush: int = 0
+    shape: str = "square"
+    connected: bool = False
+
+    def __post_init__(self) -> None:
+        if self.mode not in STROKE_MODES:
+            raise EditError(f"Unknown stroke mode {self.mode!r}; choose from {', '.join(STROKE_MODES)}.")
+        if self.shape not in BRUSHES:
+            raise EditError(f"Unknown brush {self.shape!r}; choose from {', '.join(BRUSHES)}.")
+        if self.brush < 0:
+            raise EditError("brush must be non-negative.")
+        object.__setattr__(self, "points", _points(self.points))
+
+
+@dataclass(frozen=True)
+class Stamp:
+    """`cells` pasted with its (transformed) top-left corner at (row, col)."""
+
+    cells: np.ndarray
+    row: int
+    col: int
+    rotate: int = 0
+    flip: bool = False
+    mode: str = "or"
+    oriented: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.mode not in STAMP_MODES:
+            raise EditError(f"Unknown stamp mode {self.mode!r}; choose from {', '.join(STAMP_MODES)}.")
+        cells = np.asarray(self.cells)
+        if cells.ndim != 2 or cells.size == 0:
+            raise EditError(f"Expected a non-empty 2-D pattern, got shape {cells.shape}.")
+        object.__setattr__(self, "oriented", transform((cells != 0).view(DTYPE), self.rotate, self.flip))
+
+
+def transform(cells: np.ndarray, rotate: int = 0, flip: bool = False) -> np.ndarray:
+    """`cells` mirrored left-right if `flip`, then rotated `rotate` quarter turns anticlockwise (a view)."""
+    if flip:
+        cells = cells[:, ::-1]
+    return np.rot90(cells, rotate % 4)
+
+
+def load_stamp(source: Union[str, Path, Pattern, np.ndarray]) -> np.ndarray:
+    """Cells of a preset name, a pattern file (.rle, .lif, .life), a Pattern or an array."""
+    if isinstance(source, np.ndarray):
+        return source
+    if isinstance(source, Pattern):
+        return source.cells
+    if isinstance(source, str) and source in PRESETS:
+        cells = PRESETS[source]
+        if not isinstance(cells, np.ndarray):
+            raise EditError(f"Preset {source!r} is generated, not a pattern.")
+        return cells
+    return read_pattern(source).cells
+
+
+def line_points(points: np.ndarray) -> np.ndarray:
+    """Every cell on the polyline through `points`, one per step along the longer axis."""
+    points = _points(points)
+    if len(points) < 2:
+        return points
+    delta = np.diff(points, axis=0)
+    steps = np.abs(delta).max(axis=1)
+    segment = np.repeat(np.arange(len(delta)), steps)
+    k = np.arange(int(steps.sum())) - np.repeat(np.cumsum(steps) - steps, steps)
+    t = k / np.maximum(steps, 1)[segment]
+    line = points[segment] + np.rint(delta[segment] * t[:, None]).astype(np.int64)
+    return np.concatenate((line, points[-1:]))
+
+
+def _half_widths(brush: int, shape: str) -> np.ndarray:
+    """Half width of the footprint on each row offset -brush..brush."""
+    dy = np.arange(-brush, brush + 1)
+    if shape == "square":
+        return np.full(dy.size, brush)
+    return np.floor(np.sqrt((brush + 0.5) ** 2 - dy * dy)).astype(np.int64)
+
+
+def _stroke_mask(stroke: Stroke, shape: tuple[int, int]) -> Optional[tuple[int, int, np.ndarray]]:
+    """(row0, col0, mask) of the cells the stroke covers, clipped to the board; None if none."""
+    points = line_points(stroke.points) if stroke.connected else stroke.points
+    h, w = shape
+    half = _half_widths(stroke.brush, stroke.shape)
+    # One span [lo, hi) per point and row offset of the footprint.
+    rows = (points[:, :1] + np.arange(-stroke.brush, stroke.brush + 1)).ravel()
+    lo = np.clip((points[:, 1:] - half).ravel(), 0, w)
+    hi = np.clip((points[:, 1:] + half + 1).ravel(), 0, w)
+    keep = (rows >= 0) & (rows < h) & (lo < hi)
+    rows, lo, hi = rows[keep], lo[keep], hi[keep]
+    if not rows.size:
+        return None
+    r0, c0 = int(rows.min()), int(lo.min())
+    height, width = int(rows.max()) - r0 + 1, int(hi.max()) - c0
+    # +1 where a span starts, -1 past its end; a running sum > 0 is covered.
+    stride = width + 1
+    edges = np.bincount((rows - r0) * stride + (lo - c0), minlength=height * stride)
+    edges -= np.bincount((rows - r0) * stride + (hi - c0), minlength=height * stride)
+    mask = np.cumsum(edges.reshape(height, stride)[:, :width], axis=1) > 0
+    return r0, c0, mask
+
+
+def _stamp_region(stamp: Stamp, shape: tuple[int, int]) -> Optional[tuple[slice, slice, np.ndarray]]:
+    """(board rows, board cols, pattern part) of the stamp's overlap with the board."""
+    ph, pw = stamp.oriented.shape
+    r0, c0 = max(stamp.row, 0), max(stamp.col, 0)
+    r1, c1 = min(stamp.row + ph, shape[0]), min(stamp.col + pw, shape[1])
+    if r0 >= r1 or c0 >= c1:
+        return None
+    part = stamp.oriented[r0 - stamp.row : r1 - stamp.row, c0 - stamp.col : c1 - stamp.col]
+    return slice(r0, r1), slice(c0, c1), part
+
+
+def _regions(edits: Iterable[Edit], shape: tuple[int, int]) -> list[tuple[Edit, tuple[slice, slice], np.ndarray]]:
+    regions = []
+    for edit in edits:
+        if isinstance(edit, Stroke):
+            found = _stroke_mask(edit, shape)
+            if found is not None:
+                r0, c0, mask = found
+                regions.append((edit, (slice(r0, r0 + mask.shape[0]), slice(c0, c0 + mask.shape[1])), mask))
+        elif isinstance(edit, Stamp):
+            found = _stamp_region(edit, shape)
+            if found is not None:
+                rows, cols, part = found
+                regions.append((edit, (rows, cols), part))
+        else:
+            raise EditError(f"Expected Stroke or Stamp edits, got {type(edit).__name__}.")
+    return regions
+
+
+def _apply(region: np.ndarray, edit: Edit, cells: np.ndarray) -> None:
+    if isinstance(edit, Stamp):
+        if edit.mode == "paste":
+            region[...] = cells
+        elif edit.mode == "or":
+            region |= cells
+        else:
+            region ^= cells
+    elif edit.mode == "paint":
+        region[cells] = 1
+    elif edit.mode == "erase":
+        region[cells] = 0
+    else:
+        region ^= cells
+
+
+@dataclass(frozen=True)
+class Diff:
+    """Cells flipped by one edit batch, as flat indices into a board of `shape`."""
+
+    shape: tuple[int, int]
+    indices: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.indices.size)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.indices.nbytes)
+
+    def apply(self, grid: np.ndarray) -> None:
+        """Flip the cells in place; applying a diff twice restores the board."""
+        if grid.shape != self.shape:
+            raise EditError(f"Diff for a {self.shape} board cannot apply to shape {grid.shape}.")
+        rows, cols = np.divmod(self.indices, self.shape[1])
+        grid[rows, cols] ^= 1
+
+
+def _check_grid(grid: np.ndarray) -> None:
+    if grid.ndim != 2 or grid.size == 0 or grid.dtype != DTYPE:
+        raise GridShapeError(f"Expected a non-empty 2-D {np.dtype(DTYPE)} grid, got {grid.dtype} {grid.shape}.")
+
+
+def apply_edits(grid: np.ndarray, edits: Iterable[Edit]) -> Diff:
+    """Apply `edits` in order to `grid` in place; returns the cells that changed."""
+    _check_grid(grid)
+    shape = grid.shape
+    regions = _regions(edits, shape)
+    index_dtype = np.uint32 if grid.size <= np.iinfo(np.uint32).max else np.int64
+    if not regions:
+        return Diff(shape, np.empty(0, dtype=index_dtype))
+    # Keep only the bounding box of everything touched, to find what changed.
+    r0 = min(rows.start for _, (rows, _), _ in regions)
+    r1 = max(rows.stop for _, (rows, _), _ in regions)
+    c0 = min(cols.start for _, (_, cols), _ in regions)
+    c1 = max(cols.stop for _, (_, cols), _ in regions)
+    before = grid[r0:r1, c0:c1].copy()
+    for edit, (rows, cols), cells in regions:
+        _apply(grid[rows, cols], edit, cells)
+    changed_rows, changed_cols = np.nonzero(before ^ grid[r0:r1, c0:c1])
+    indices = (changed_rows + r0).astype(np.int64) * shape[1] + changed_cols + c0
+    return Diff(shape, indices.astype(index_dtype))
+
+
+class EditHistory:
+    """Undo and redo stacks of Diffs, the oldest dropped beyond `limit` entries."""
+
+    def __init__(self, limit: int = 100) -> None:
+        if limit <= 0:
+            raise EditError("limit must be positive.")
+        self.limit = limit
+        self._undo: deque[Diff] = deque(maxlen=limit)
+        self._redo: deque[Diff] = deque(maxlen=limit)
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the stored diffs."""
+        return sum(d.nbytes for d in self._undo) + sum(d.nbytes for d in self._redo)
+
+    def apply(self, grid: np.ndarray, edits: Iterable[Edit]) -> Diff:
+        """apply_edits, recorded for undo (an edit that changes nothing is not)."""
+        diff = apply_edits(grid, edits)
+        if len(diff):
+            self._undo.append(diff)
+            self._redo.clear()
+        return diff
+
+    def undo(self, grid: np.ndarray) -> bool:
+        """Revert the latest recorded batch in place; False if there is none."""
+        return self._move(grid, self._undo, self._redo)
+
+    def redo(self, grid: np.ndarray) -> bool:
+        """Re-apply the latest undone batch in place; False if there is none."""
+        return self._move(grid, self._redo, self._undo)
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+
+    @staticmethod
+    def _move(grid: np.ndarray, source: deque[Diff], target: deque[Diff]) -> bool:
+        if not source:
+            return False
+        source[-1].apply(grid)
+        target.append(source.pop())
+        return True
@@ -0,0 +1,11 @@
+"""Typed domain errors raised by the simulation engines."""
+
+__all__ = ["EngineError", "GridShapeError"]
+
+
+class EngineError(ValueError):
+    """Base class for invalid input to an engine."""
+
+
+class GridShapeError(EngineError):
+    """Grid is not a non-empty 2-D array of the expected layout."""
@@ -0,0 +1,308 @@
+"""
+HashLife engine: canonical quadtree with memoized successors.
+
+The board is embedded in an unbounded, initially dead plane. Every distinct
+square of cells is stored once (hash-consed on its four children), and the
+result of advancing a node 2^j generations is cached on the node, so regular
+patterns such as guns and spaceships are advanced in time logarithmic in the
+generation count.
+
+Boundary: HashLife has no edges. hashlife_advance returns the board's window
+of the unbounded plane, which equals next_generation(wrap=False) for as long
+as no live cell touches the border; toroidal boards are not supported.
+
+Eviction is generation-scoped: when the node table grows past max_nodes, the
+memoized results are dropped and only nodes reachable from the current root
+are kept.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+from engine.errors import EngineError, GridShapeError
+from engine.rules import CONWAY, Rule, RuleError
+
+__all__ = ["HashLife", "hashlife_advance"]
+
+DTYPE = np.uint8
+DEFAULT_MAX_NODES = 2_000_000
+
+
+class _Node:
+    """Square of 2^level × 2^level cells. Only built through HashLife._join."""
+
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population", "memo")
+
+    def __init__(
+        self,
+        nw: Optional[_Node],
+        ne: Optional[_Node],
+        sw: Optional[_Node],
+        se: Optional[_Node],
+        level: int,
+        population: int,
+    ) -> None:
+        self.nw, self.ne, self.sw, self.se = nw, ne, sw, se
+        self.level = level
+        self.population = population
+        self.memo: dict[int, _Node] = {}
+
+
+_OFF = _Node(None, None, None, None, 0, 0)
+_ON = _Node(None, None, None, None, 0, 1)
+
+
+class HashLife:
+    """Unbounded Life universe; (origin_row, origin_col) is the root's top-left cell."""
+
+    def __init__(self, max_nodes: int = DEFAULT_MAX_NODES, rule: Optional[Rule] = None) -> None:
+        if max_nodes <= 0:
+            raise EngineError("max_nodes must be positive.")
+        rule = rule or CONWAY
+        if 0 in rule.birth:
+            raise RuleError(f"{rule} births on empty space; an unbounded plane cannot represent it.")
+        self.max_nodes = max_nodes
+        self.rule = rule
+        self._table: dict[tuple[int, int, int, int], _Node] = {}
+        self._zeros: list[_Node] = [_OFF]
+        self.root = self._zero(3)
+        self.origin_row = 0
+        self.origin_col = 0
+        self.generation = 0
+
+    # -- construction ---------------------------------------------------------
+
+    @classmethod
+    def from_array(
+        cls, grid: np.ndarray, max_nodes: int = DEFAULT_MAX_NODES, rule: Optional[Rule] = None
+    ) -> HashLife:
+        """Load a 0/1 grid with its top-left cell at universe coordinate (0, 0)."""
+        if grid.ndim != 2 or grid.size == 0:
+            raise GridShapeError(f"Expected a non-empty 2-D grid, got shape {grid.shape}.")
+        life = cls(max_nodes=max_nodes, rule=rule)
+        level = max(3, int(np.ceil(np.log2(max(grid.shape)))))
+        size = 1 << level
+        square = np.zeros((size, size), dtype=bool)
+        square[: grid.shape[0], : grid.shape[1]] = grid != 0
+        life.root = life._build(square, 0, 0, level)
+        return life
+
+    def _build(self, square: np.ndarray, top: int, left: int, level: int) -> _Node:
+        if level == 0:
+            return _ON if square[top, left] else _OFF
+        size = 1 << level
+        if not square[top : top + size, left : left + size].any():
+            return self._zero(level)
+        half = size >> 1
+        return self._join(
+            self._build(square, top, left, level - 1),
+            self._build(square, top, left + half, level - 1),
+            self._build(square, top + half, left, level - 1),
+            self._build(square, top + half, left + half, level - 1),
+        )
+
+    def _join(self, nw: _Node, ne: _Node, sw: _Node, se: _Node) -> _Node:
+        key = (id(nw), id(ne), id(sw), id(se))
+        node = self._table.get(key)
+        if node is None:
+            population = nw.population + ne.population + sw.population + se.population
+            node = _Node(nw, ne, sw, se, nw.level + 1, population)
+            self._table[key] = node
+        return node
+
+    def _zero(self, level: int) -> _Node:
+        while len(self._zeros) <= level:
+            z = self._zeros[-1]
+            self._zeros.append(self._join(z, z, z, z))
+        return self._zeros[level]
+
+    def _centre(self, node: _Node) -> _Node:
+        """Same cells, one level up, with `node` in the middle."""
+        z = self._zero(node.level - 1)
+        return self._join(
+            self._join(z, z, z, node.nw),
+            self._join(z, z, node.ne, z),
+            self._join(z, node.sw, z, z),
+            self._join(node.se, z, z, z),
+        )
+
+    # -- evolution ------------------------------------------------------------
+
+    def _life_4x4(self, m: _Node) -> _Node:
+        """Base case: next generation of the centre 2×2 of a 4×4 node."""
+        cells = [
+            [m.nw.nw, m.nw.ne, m.ne.nw, m.ne.ne],
+            [m.nw.sw, m.nw.se, m.ne.sw, m.ne.se],
+            [m.sw.nw, m.sw.ne, m.se.nw, m.se.ne],
+            [m.sw.sw, m.sw.se, m.se.sw, m.se.se],
+        ]
+        bits = [[c.population for c in row] for row in cells]
+        birth, survival = self.rule.birth, self.rule.survival
+
+        def cell(r: int, c: int) -> _Node:
+            n = sum(bits[r + dr][c + dc] for dr in (-1, 0, 1) for dc in (-1, 0, 1)) - bits[r][c]
+            return _ON if n in (survival if bits[r][c] else birth) else _OFF
+
+        return self._join(cell(1, 1), cell(1, 2), cell(2, 1), cell(2, 2))
+
+    def _successor(self, m: _Node, j: int) -> _Node:
+        """Centre of `m` (one level down) advanced 2^j generations; j <= m.level - 2."""
+        if m.population == 0:
+            return m.nw
+        cached = m.memo.get(j)
+        if cached is not None:
+            return cached
+        if m.level == 2:
+            s = self._life_4x4(m)
+        else:
+            join, succ = self._join, self._successor
+            a, b, c, d = m.nw, m.ne, m.sw, m.se
+            jj = min(j, m.level - 3)
+            c1 = succ(join(a.nw, a.ne, a.sw, a.se), jj)
+            c2 = succ(join(a.ne, b.nw, a.se, b.sw), jj)
+            c3 = succ(join(b.nw, b.ne, b.sw, b.se), jj)
+            c4 = succ(join(a.sw, a.se, c.nw, c.ne), jj)
+            c5 = succ(join(a.se, b.sw, c.ne, d.nw), jj)
+            c6 = succ(join(b.sw, b.se, d.nw, d.ne), jj)
+            c7 = succ(join(c.nw, c.ne, c.sw, c.se), jj)
+            c8 = succ(join(c.ne, d.nw, c.se, d.sw), jj)
+            c9 = succ(join(d.nw, d.ne, d.sw, d.se), jj)
+            if j < m.level - 2:
+                # The nine sub-results already cover 2^j generations; stitch their centres.
+                s = join(
+                    join(c1.se, c2.sw, c4.ne, c5.nw),
+                    join(c2.se, c3.sw, c5.ne, c6.nw),
+                    join(c4.se, c5.sw, c7.ne, c8.nw),
+                    join(c5.se, c6.sw, c8.ne, c9.nw),
+                )
+            else:
+                # Full-speed step: a second half-step on the four overlapping quads.
+                s = join(
+                    succ(join(c1, c2, c4, c5), jj),
+                    succ(join(c2, c3, c5, c6), jj),
+                    succ(join(c4, c5, c7, c8), jj),
+                    succ(join(c5, c6, c8, c9), jj),
+                )
+        m.memo[j] = s
+        return s
+
+    def _is_padded(self, m: _Node) -> bool:
+        """True if every live cell lies in the central half of `m`."""
+        inner = m.nw.se.population + m.ne.sw.population + m.sw.ne.population + m.se.nw.population
+        return inner == m.population
+
+    def _grow(self) -> None:
+        half = 1 << (self.root.level - 1)
+        self.root = self._centre(self.root)
+        self.origin_row -= half
+        self.origin_col -= half
+
+    def _shrink(self) -> None:
+        """Drop empty outer rings so successors run on the smallest enclosing node."""
+        while self.root.level > 3 and self._is_padded(self.root):
+            quarter = 1 << (self.root.level - 2)
+            r = self.root
+            self.root = self._join(r.nw.se, r.ne.sw, r.sw.ne, r.se.nw)
+            self.origin_row += quarter
+            self.origin_col += quarter
+
+    def _advance_pow2(self, j: int) -> None:
+        while self.root.level < j + 2 or not self._is_padded(self.root):
+            self._grow()
+        # One more ring: live cells can travel at most 2^j <= width / 8 cells.
+        self._grow()
+        quarter = 1 << (self.root.level - 2)
+        self.root = self._successor(self.root, j)
+        self.origin_row += quarter
+        self.origin_col += quarter
+        self.generation += 1 << j
+
+    def advance(self, generations: int) -> None:
+        """Advance by an arbitrary number of generations (binary decomposition)."""
+        if generations < 0:
+            raise EngineError("generations must be non-negative.")
+        j = 0
+        while generations:
+            if generations & 1:
+                self._advance_pow2(j)
+                self._shrink()
+                self._collect_if_needed()
+            generations >>= 1
+            j += 1
+
+    def jump(self, k: int) -> None:
+        """Advance exactly 2^k generations in one call."""
+        if k < 0:
+            raise EngineError("k must be non-negative.")
+        self.advance(1 << k)
+
+    # -- memory ---------------------------------------------------------------
+
+    def _collect_if_needed(self) -> None:
+        if len(self._table) <= self.max_nodes:
+            return
+        self._table = {}
+        self._zeros = [_OFF]
+        seen: set[int] = set()
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.level == 0 or id(node) in seen:
+                continue
+            seen.add(id(node))
+            node.memo.clear()
+            self._table[(id(node.nw), id(node.ne), id(node.sw), id(node.se))] = node
+            stack.extend((node.nw, node.ne, node.sw, node.se))
+
+    @property
+    def node_count(self) -> int:
+        return len(self._table)
+
+    # -- output ---------------------------------------------------------------
+
+    @property
+    def population(self) -> int:
+        return self.root.population
+
+    def to_array(self, row0: int, col0: int, rows: int, cols: int) -> np.ndarray:
+        """Render the window [row0, row0+rows) × [col0, col0+cols) of the universe."""
+        out = np.zeros((rows, cols), dtype=DTYPE)
+        stack = [(self.root, self.origin_row, self.origin_col)]
+        while stack:
+            node, top, left = stack.pop()
+            size = 1 << node.level
+            if (
+                node.population == 0
+                or top >= row0 + rows
+                or left >= col0 + cols
+                or top + size <= row0
+                or left + size <= col0
+            ):
+                continue
+            if node.level == 0:
+                out[top - row0, left - col0] = 1
+                continue
+            half = size >> 1
+            stack.extend(
+                (
+                    (node.nw, top, left),
+                    (node.ne, top, left + half),
+                    (node.sw, top + half, left),
+                    (node.se, top + half, left + half),
+                )
+            )
+        return out
+
+
+def hashlife_advance(
+    grid: np.ndarray,
+    generations: int,
+    max_nodes: int = DEFAULT_MAX_NODES,
+    rule: Optional[Rule] = None,
+) -> np.ndarray:
+    """Return `grid` advanced `generations` steps, cropped back to the board's shape."""
+    life = HashLife.from_array(grid, max_nodes=max_nodes, rule=rule)
+    life.advance(generations)
+    return life.to_array(0, 0, grid.shape[0], grid.shape[1])
@@ -0,0 +1,107 @@
+"""
+Process-wide memo of computed generations, for fast-forwarding repeated runs.
+
+A run is identified by its starting board and how it evolves: the key is
+(board_hash of the start board, rulestring, wrap). While a run advances,
+every `interval`-th generation after its start is stored as a bit-packed
+keyframe (one bit per cell). A later run from the same board, rule and
+boundary can jump straight to the newest keyframe at or before the
+generation it wants and step only the rest.
+
+The cache is bounded in bytes with least-recently-used eviction of single
+keyframes, and guarded by a lock so one instance can be shared by every
+session of a Streamlit process (see app._keyframe_cache).
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+from engine.cycles import board_hash
+from engine.dense import DTYPE
+from engine.errors import EngineError
+from engine.rules import CONWAY, Rule
+
+__all__ = ["CacheKey", "KEYFRAME_INTERVAL", "KeyframeCache", "cache_key"]
+
+KEYFRAME_INTERVAL = 64
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+CacheKey = tuple[bytes, str, bool]
+
+
+def cache_key(grid: np.ndarray, rule: Optional[Rule], wrap: bool) -> CacheKey:
+    """Key of the run that starts from `grid` under `rule` (None is Conway) and `wrap`."""
+    return board_hash(grid), (rule or CONWAY).rulestring, bool(wrap)
+
+
+class KeyframeCache:
+    """LRU cache of every `interval`-th generation of runs, at most `max_bytes` of packed boards."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, interval: int = KEYFRAME_INTERVAL) -> None:
+        if max_bytes <= 0 or interval <= 0:
+            raise EngineError("max_bytes and interval must be positive.")
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.hits = 0
+        self.misses = 0
+        self._frames: OrderedDict[tuple[CacheKey, int], tuple[tuple[int, int], np.ndarray]] = OrderedDict()
+        self._generations: dict[CacheKey, set[int]] = {}
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def wants(self, generation: int) -> bool:
+        """Whether generation (counted from the run's start) is a keyframe."""
+        return generation > 0 and generation % self.interval == 0
+
+    def store(self, key: CacheKey, generation: int, grid: np.ndarray) -> None:
+        """Remember `grid` as the run's state `generation` steps after its start."""
+        if not self.wants(generation):
+            return
+        packed = np.packbits(grid != 0)
+        if packed.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if (key, generation) in self._frames:
+                self._frames.move_to_end((key, generation))
+                return
+            self._frames[(key, generation)] = (grid.shape, packed)
+            self._generations.setdefault(key, set()).add(generation)
+            self._nbytes += packed.nbytes
+            while self._nbytes > self.max_bytes:
+                (old_key, old_generation), (_, old) = self._frames.popitem(last=False)
+                self._nbytes -= old.nbytes
+                generations = self._generations[old_key]
+                generations.discard(old_generation)
+                if not generations:
+                    del self._generations[old_key]
+
+    def nearest(self, key: CacheKey, generation: int, after: int = 0) -> Optional[tuple[int, np.ndarray]]:
+        """(g, board) for the newest keyframe with after < g <= generation, or None."""
+        with self._lock:
+            candidates = [g for g in self._generations.get(key, ()) if after < g <= generation]
+            if not candidates:
+                self.misses += 1
+                return None
+            found = max(candidates)
+            self._frames.move_to_end((key, found))
+            shape, packed = self._frames[(key, found)]
+            self.hits += 1
+        cells = np.unpackbits(packed, count=shape[0] * shape[1]).reshape(shape)
+        return found, cells.astype(DTYPE, copy=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+            self._generations.clear()
+            self._nbytes = 0
@@ -0,0 +1,86 @@
+"""
+Built-in pattern presets and initial board setup.
+
+PRESETS maps a preset name to a pattern array; "Blank" and "Random" are
+special keys handled by build_initial_grid, which centres the pattern on a
+fresh board (or fills it at random). The named patterns are the .rle files
+bundled in patterns/data, read through a PatternLibrary only when a preset
+is first listed or used, so importing this module builds nothing.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+import numpy as np
+
+from engine.dense import DTYPE
+from patterns.library import PatternLibrary
+
+__all__ = ["PRESETS", "PRESET_ORDER", "PresetMapping", "build_initial_grid", "center_pattern"]
+
+# Special presets generated by build_initial_grid rather than read from a file.
+_SPECIAL: dict[str, Any] = {"Blank": None, "Random": "density"}
+# Menu order of the bundled patterns; any other library pattern follows, in file order.
+PRESET_ORDER = ("Glider", "Lightweight Spaceship", "Gosper Glider Gun", "Pulsar")
+
+
+class PresetMapping(Mapping[str, Any]):
+    """The "Blank" and "Random" presets followed by the patterns of a PatternLibrary, in PRESET_ORDER."""
+
+    def __init__(self, library: PatternLibrary, order: tuple[str, ...] = PRESET_ORDER) -> None:
+        self.library = library
+        self.order = order
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _SPECIAL:
+            return _SPECIAL[key]
+        return self.library[key]
+
+    def _names(self) -> list[str]:
+        listed = [name for name in self.order if name in self.library]
+        return listed + [name for name in self.library if name not in _SPECIAL and name not in self.order]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from _SPECIAL
+        yield from self._names()
+
+    def __len__(self) -> int:
+        return len(_SPECIAL) + len(self._names())
+
+
+PRESETS = PresetMapping(PatternLibrary())
+
+
+def build_initial_grid(
+    rows: int,
+    cols: int,
+    preset_key: str,
+    density: float = 0.3,
+    rng: np.random.Generator | None = None,
+) -> tuple[np.ndarray, str | None]:
+    """Return (grid, error_message). If preset too large, return warning and empty grid."""
+    if rows <= 0 or cols <= 0:
+        return np.zeros((max(1, rows), max(1, cols)), dtype=DTYPE), "Invalid grid size."
+    grid = np.zeros((rows, cols), dtype=DTYPE)
+    if preset_key == "Blank":
+        return grid, None
+    if preset_key == "Random":
+        rng = rng or np.random.default_rng()
+        grid[:, :] = (rng.random((rows, cols)) < density).astype(DTYPE)
+        return grid, None
+    pattern = PRESETS.get(preset_key)
+    if pattern is None or not isinstance(pattern, np.ndarray):
+        return grid, None
+    return center_pattern(rows, cols, pattern)
+
+
+def center_pattern(rows: int, cols: int, pattern: np.ndarray) -> tuple[np.ndarray, str | None]:
+    """Return (grid, error_message) with `pattern` centred on a blank rows×cols board."""
+    grid = np.zeros((rows, cols), dtype=DTYPE)
+    ph, pw = pattern.shape
+    if ph > rows or pw > cols:
+        return grid, f"Grid too small for preset. Needs at least {ph}×{pw}; grid is {rows}×{cols}."
+    r0, c0 = (rows - ph) // 2, (cols - pw) // 2
+    grid[r0 : r0 + ph, c0 : c0 + pw] = pattern
+    return grid, None
@@ -0,0 +1,109 @@
+"""
+Registry of interchangeable board engines behind a common stepper interface.
+
+Every entry builds a stepper that owns a copy of the board and exposes
+`grid`, `step()`, `run(generations)` and `close()`. All registered engines
+implement the same bounded-board semantics (torus with wrap ON, dead border
+with wrap OFF), so they can be swapped freely by the CLI and benchmarks.
+HashLife is not registered: it simulates an unbounded plane.
+"""
+from __future__ import annotations
+
+from typing import Callable, Optional, Protocol
+
+import numpy as np
+
+from engine.active import ActiveRegionStepper
+from engine.bitpacked import pack_grid, step_packed, unpack_grid
+from engine.buffered import PingPongStepper
+from engine.dense import DTYPE, next_generation
+from engine.errors import EngineError, GridShapeError
+from engine.parallel import ParallelStepper
+from engine.rules import Rule
+
+__all__ = ["ENGINES", "BitPackedStepper", "DenseStepper", "Stepper", "make_stepper"]
+
+
+class Stepper(Protocol):
+    generation: int
+
+    @property
+    def grid(self) -> np.ndarray: ...
+
+    def step(self) -> np.ndarray: ...
+
+    def run(self, generations: int) -> np.ndarray: ...
+
+    def close(self) -> None: ...
+
+
+class DenseStepper:
+    """next_generation applied repeatedly."""
+
+    def __init__(self, grid: np.ndarray, wrap: bool, rule: Optional[Rule] = None) -> None:
+        if grid.ndim != 2 or grid.size == 0:
+            raise GridShapeError(f"Expected a non-empty 2-D grid, got shape {grid.shape}.")
+        self.grid = np.array(grid, dtype=DTYPE, copy=True)
+        self.wrap = wrap
+        self.rule = rule
+        self.generation = 0
+
+    def step(self) -> np.ndarray:
+        self.grid = next_generation(self.grid, self.wrap, self.rule)
+        self.generation += 1
+        return self.grid
+
+    def run(self, generations: int) -> np.ndarray:
+        for _ in range(generations):
+            self.step()
+        return self.grid
+
+    def close(self) -> None:
+        pass
+
+
+class BitPackedStepper:
+    """Keeps the board packed between steps; unpacks only when `grid` is read."""
+
+    def __init__(self, grid: np.ndarray, wrap: bool, rule: Optional[Rule] = None) -> None:
+        self._words = pack_grid(grid)
+        self._cols = grid.shape[1]
+        self.wrap = wrap
+        self.rule = rule
+        self.generation = 0
+
+    @property
+    def grid(self) -> np.ndarray:
+        return unpack_grid(self._words, self._cols)
+
+    def step(self) -> np.ndarray:
+        self._words = step_packed(self._words, self._cols, self.wrap, self.rule)
+        self.generation += 1
+        return self.grid
+
+    def run(self, generations: int) -> np.ndarray:
+        for _ in range(generations):
+            self._words = step_packed(self._words, self._cols, self.wrap, self.rule)
+        self.generation += generations
+        return self.grid
+
+    def close(self) -> None:
+        pass
+
+
+ENGINES: dict[str, Callable[[np.ndarray, bool, Optional[Rule]], Stepper]] = {
+    "dense": DenseStepper,
+    "bitpacked": BitPackedStepper,
+    "buffered": PingPongStepper,
+    "active": lambda grid, wrap, rule=None: ActiveRegionStepper(grid, wrap, rule=rule),
+    "parallel": lambda grid, wrap, rule=None: ParallelStepper(grid, wrap, rule=rule),
+}
+
+
+def make_stepper(engine: str, grid: np.ndarray, wrap: bool, rule: Optional[Rule] = None) -> Stepper:
+    """Build the stepper registered as `engine`; call close() when done."""
+    try:
+        factory = ENGINES[engine]
+    except KeyError:
+        raise EngineError(f"Unknown engine {engine!r}; choose from {', '.join(ENGINES)}.") from None
+    return factory(grid, wrap, rule)
@@ -0,0 +1,108 @@
+"""
+Life-like rules in B/S notation, compiled once into a lookup table.
+
+A rule such as "B36/S23" (HighLife) lists the neighbor counts that give birth
+to a dead cell and those that keep a live cell alive. parse_rule compiles it
+into a (2, 9) table indexed by (state, neighbor count), so evaluating any rule
+is a single gather per generation. Conway's rule keeps its boolean fast path.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from engine.errors import EngineError
+
+__all__ = [
+    "CONWAY",
+    "RULES",
+    "Rule",
+    "RuleError",
+    "apply_rule",
+    "life_rule",
+    "parse_rule",
+]
+
+DTYPE = np.uint8
+
+_BS = re.compile(r"^B([0-8]*)/S([0-8]*)$")
+_SB = re.compile(r"^S([0-8]*)/B([0-8]*)$")
+_LEGACY = re.compile(r"^([0-8]*)/([0-8]*)$")
+
+CONWAY_BIRTH = frozenset({3})
+CONWAY_SURVIVAL = frozenset({2, 3})
+
+
+class RuleError(EngineError):
+    """Rulestring cannot be parsed."""
+
+
+@dataclass(frozen=True)
+class Rule:
+    birth: frozenset[int]
+    survival: frozenset[int]
+    table: np.ndarray = field(init=False, repr=False, compare=False)
+    entries: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        table = np.zeros((2, 9), dtype=DTYPE)
+        table[0, sorted(self.birth)] = 1
+        table[1, sorted(self.survival)] = 1
+        table.flags.writeable = False
+        object.__setattr__(self, "table", table)
+        # Flat indices (9 * state + count) that map to a live cell.
+        object.__setattr__(self, "entries", tuple(int(i) for i in np.flatnonzero(table)))
+
+    @property
+    def rulestring(self) -> str:
+        return "B" + "".join(map(str, sorted(self.birth))) + "/S" + "".join(map(str, sorted(self.survival)))
+
+    @property
+    def is_conway(self) -> bool:
+        return self.birth == CONWAY_BIRTH and self.survival == CONWAY_SURVIVAL
+
+    def __str__(self) -> str:
+        return self.rulestring
+
+
+def parse_rule(text: str) -> Rule:
+    """Parse "B3/S23", "S23/B3" or the legacy survival/birth form "23/3"."""
+    s = text.strip().upper().replace(" ", "")
+    if m := _BS.match(s):
+        birth, survival = m.group(1), m.group(2)
+    elif m := _SB.match(s):
+        survival, birth = m.group(1), m.group(2)
+    elif m := _LEGACY.match(s):
+        survival, birth = m.group(1), m.group(2)
+    else:
+        raise RuleError(f"Invalid rulestring {text!r}; expected e.g. 'B3/S23'.")
+    return Rule(birth=frozenset(map(int, birth)), survival=frozenset(map(int, survival)))
+
+
+CONWAY = Rule(birth=CONWAY_BIRTH, survival=CONWAY_SURVIVAL)
+
+RULES: dict[str, Rule] = {
+    "Conway's Life (B3/S23)": CONWAY,
+    "HighLife (B36/S23)": parse_rule("B36/S23"),
+    "Day & Night (B3678/S34678)": parse_rule("B3678/S34678"),
+    "Seeds (B2/S)": parse_rule("B2/S"),
+    "Life without Death (B3/S012345678)": parse_rule("B3/S012345678"),
+    "Maze (B3/S12345)": parse_rule("B3/S12345"),
+    "2x2 (B36/S125)": parse_rule("B36/S125"),
+}
+
+
+def life_rule(grid: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """Survival 2–3, birth 3, else dead; `n` holds the neighbor counts of `grid`."""
+    return ((grid == 1) & (n >= 2) & (n <= 3) | ((grid == 0) & (n == 3))).astype(DTYPE)
+
+
+def apply_rule(grid: np.ndarray, n: np.ndarray, rule: Optional[Rule] = None) -> np.ndarray:
+    """Next state of every cell under `rule` (Conway when None)."""
+    if rule is None or rule.is_conway:
+        return life_rule(grid, n)
+    # grid * 9 + n indexes the flattened (state, count) table; max 17 fits in uint8.
+    return rule.table.ravel()[grid * DTYPE(9) + n]
@@ -0,0 +1,317 @@
+"""
+Background simulation worker: a thread that owns the board and steps it at a target rate.
+
+The UI never steps the board itself. It reads the latest published Frame
+whenever it redraws, so generation throughput is independent of how often
+the page reruns. At each wake-up the worker runs every generation that is
+due at `rate` gen/s (or, with rate None, as many as fit in one frame
+interval, in STEP_SLICE slices with the lock released between them), then
+publishes one copy of the board. Redraws therefore skip
+frames instead of slowing the simulation down.
+
+All access to the stepper goes through one lock; edits from the UI are
+applied with update(), which runs the edit on the current board and
+restarts cycle detection. Detecting a cycle (including a still life or an
+empty board) pauses a playing worker once; Play again continues past it,
+and Step(n) always advances n generations.
+
+Given a MetricsRecorder, the stepper is wrapped in an InstrumentedStepper,
+so every generation the worker runs is timed and counted (see
+engine.metrics); the UI reads the recorder directly.
+
+Given an idle_timeout, a worker whose snapshot() has not been read for
+that many seconds pauses and its thread exits, so a session abandoned
+while playing stops using a CPU and its worker can be garbage collected;
+play() starts the thread again.
+
+Given a KeyframeCache, the worker stores every `interval`-th generation
+since the board was last set up (reset, edited or reconfigured) under that
+starting board, rule and wrap. Every advance (a Step or one batch of
+Play) whose target passes a keyframe generation first jumps to the newest
+cached keyframe at or before the target (restarting cycle detection
+there) and steps only the rest, so replaying a run after Reset reuses it.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+from engine.cycles import Cycle, CycleDetector
+from engine.errors import EngineError
+from engine.keyframes import CacheKey, KeyframeCache, cache_key
+from engine.metrics import InstrumentedStepper, MetricsRecorder
+from engine.registry import Stepper, make_stepper
+from engine.rules import Rule
+
+__all__ = ["Frame", "SimulationWorker"]
+
+DEFAULT_ENGINE = "buffered"
+# Publish at least this often while playing, and never run a batch longer than this.
+FRAME_INTERVAL = 1 / 30
+# Generations owed beyond this many frames' worth are dropped rather than replayed.
+MAX_LAG_FRAMES = 4
+# With rate None, step for at most this long per hold of the lock, so pause(),
+# update() and configure() do not wait behind a whole frame of stepping.
+STEP_SLICE = 0.002
+
+
+@dataclass(frozen=True)
+class Frame:
+    grid: np.ndarray
+    generation: int
+    cycle: Optional[Cycle]
+    playing: bool
+
+
+class SimulationWorker:
+    """Steps a board on a daemon thread; the UI samples snapshot()."""
+
+    def __init__(
+        self,
+        grid: np.ndarray,
+        wrap: bool,
+        rule: Optional[Rule] = None,
+        rate: Optional[float] = 5.0,
+        engine: str = DEFAULT_ENGINE,
+        metrics: Optional[MetricsRecorder] = None,
+        keyframes: Optional[KeyframeCache] = None,
+        idle_timeout: Optional[float] = None,
+    ) -> None:
+        self._check_rate(rate)
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise EngineError("idle_timeout must be positive (or None to never idle out).")
+        self.idle_timeout = idle_timeout
+        self.engine = engine
+        self.metrics = metrics
+        self.keyframes = keyframes
+        self._wrap = wrap
+        self._rule = rule
+        self._rate = rate
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._generation = 0
+        self._stepper: Stepper = self._make_stepper(grid)
+        self._set_origin(grid)
+        self._cycles = CycleDetector()
+        self._playing = False
+        self._closed = False
+        self._anchor = 0.0
+        self._since_anchor = 0
+        self._seen = time.monotonic()
+        self._publish()
+        self._start_thread()
+
+    @staticmethod
+    def _check_rate(rate: Optional[float]) -> None:
+        if rate is not None and rate <= 0:
+            raise EngineError("rate must be positive (or None for unthrottled).")
+
+    # -- UI side ---------------------------------------------------------------
+
+    @property
+    def playing(self) -> bool:
+        return self._playing
+
+    @property
+    def rate(self) -> Optional[float]:
+        return self._rate
+
+    def snapshot(self) -> Frame:
+        """Latest published frame; its grid is a private copy."""
+        self._seen = time.monotonic()
+        return self._frame
+
+    def play(self) -> None:
+        with self._wake:
+            self._seen = time.monotonic()
+            if not self._running and not self._closed:
+                self._start_thread()
+            self._playing = True
+            self._restart_clock()
+            self._publish()
+            self._wake.notify()
+
+    def pause(self) -> None:
+        with self._lock:
+            self._playing = False
+            self._publish()
+
+    def step(self, generations: int = 1) -> Frame:
+        """Advance synchronously (used while paused, e.g. the Step button)."""
+        with self._lock:
+            self._advance(generations)
+            self._publish()
+            return self._frame
+
+    def update(self, edit: Callable[[np.ndarray], np.ndarray], generation: Optional[int] = None) -> Frame:
+        """Replace the board with edit(current board copy); optionally reset the counter."""
+        with self._lock:
+            grid = edit(np.array(self._stepper.grid, copy=True))
+            if generation is not None:
+                self._generation = generation
+            self._rebuild(grid)
+            self._publish()
+            return self._frame
+
+    def configure(self, wrap: Optional[bool] = None, rule: Optional[Rule] = None) -> None:
+        """Change boundary or rule; either change restarts cycle detection."""
+        with self._lock:
+            wrap = self._wrap if wrap is None else wrap
+            rule = self._rule if rule is None else rule
+            if wrap != self._wrap or rule != self._rule:
+                self._wrap, self._rule = wrap, rule
+                self._rebuild(np.array(self._stepper.grid, copy=True))
+                self._publish()
+
+    def set_rate(self, rate: Optional[float]) -> None:
+        """Target generations per second; None runs as fast as the engine allows."""
+        self._check_rate(rate)
+        with self._wake:
+            if rate != self._rate:
+                self._rate = rate
+                self._restart_clock()
+                self._wake.notify()
+
+    def close(self) -> None:
+        with self._wake:
+            self._closed = True
+            self._playing = False
+            self._wake.notify()
+        self._thread.join()
+        self._stepper.close()
+
+    # -- worker side -----------------------------------------------------------
+
+    def _start_thread(self) -> None:
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, name="gol-sim", daemon=True)
+        self._thread.start()
+
+    def _idle(self) -> bool:
+        """Whether the UI has not sampled a frame for idle_timeout seconds."""
+        return self.idle_timeout is not None and time.monotonic() - self._seen > self.idle_timeout
+
+    def _restart_clock(self) -> None:
+        self._anchor = time.perf_counter()
+        self._since_anchor = 0
+
+    def _make_stepper(self, grid: np.ndarray) -> Stepper:
+        stepper = make_stepper(self.engine, grid, self._wrap, self._rule)
+        if self.metrics is not None:
+            stepper = InstrumentedStepper(stepper, self.metrics, self._generation)
+        return stepper
+
+    def _rebuild(self, grid: np.ndarray) -> None:
+        self._stepper.close()
+        self._stepper = self._make_stepper(grid)
+        self._cycles.reset()
+        self._set_origin(grid)
+
+    def _set_origin(self, grid: np.ndarray) -> None:
+        """Start a new run for the keyframe cache at the current board and generation."""
+        self._origin: Optional[CacheKey] = None
+        self._origin_generation = self._generation
+        if self.keyframes is not None:
+            self._origin = cache_key(grid, self._rule, self._wrap)
+
+    def _fast_forward(self, generations: int) -> int:
+        """Jump towards generation + `generations` through a cached keyframe; returns what is left to step."""
+        done = self._generation - self._origin_generation
+        interval = self.keyframes.interval
+        if (done + generations) // interval == done // interval:
+            # No keyframe generation lies ahead within this batch.
+            return generations
+        found = self.keyframes.nearest(self._origin, done + generations, after=done)
+        if found is None:
+            return generations
+        keyframe, grid = found
+        self._stepper.close()
+        self._generation = self._origin_generation + keyframe
+        self._stepper = self._make_stepper(grid)
+        self._cycles.reset()
+        return done + generations - keyframe
+
+    def _publish(self) -> None:
+        self._frame = Frame(
+            grid=np.array(self._stepper.grid, copy=True),
+            generation=self._generation,
+            cycle=self._cycles.cycle,
+            playing=self._playing,
+        )
+
+    def _advance(self, generations: int) -> None:
+        keyframes = self.keyframes
+        if keyframes is not None:
+            generations = self._fast_forward(generations)
+        cycles = self._cycles
+        if not len(cycles):
+            cycles.observe(self._stepper.grid, self._generation)
+        # Only a newly found cycle pauses playback; once one is known, Play runs on past it.
+        # A Step always runs every generation it asked for.
+        searching = cycles.cycle is None
+        for _ in range(generations):
+            board = self._stepper.step()
+            self._generation += 1
+            if keyframes is not None:
+                keyframes.store(self._origin, self._generation - self._origin_generation, board)
+            if searching and cycles.observe(board, self._generation):
+                searching = False
+                if self._playing:
+                    self._playing = False
+                    break
+
+    def _due(self, now: float) -> int:
+        """Generations owed at the target rate since the clock was (re)started."""
+        owed = int((now - self._anchor) * self._rate) - self._since_anchor
+        if owed > MAX_LAG_FRAMES * max(1.0, self._rate * FRAME_INTERVAL):
+            # Too far behind (slow engine or a long pause): drop the backlog.
+            self._restart_clock()
+            owed = 1
+        return max(owed, 0)
+
+    def _loop(self) -> None:
+        frame_due = None  # with rate None: when the frame being stepped is published
+        while True:
+            with self._wake:
+                while not (self._playing or self._closed or self._idle()):
+                    self._wake.wait(self.idle_timeout)
+                if self._closed:
+                    return
+                if self._idle():
+                    # Nobody is watching (e.g. the session ended): pause and let the thread end.
+                    # play() starts a new one.
+                    self._playing = False
+                    self._running = False
+                    self._publish()
+                    return
+                now = time.perf_counter()
+                if self._rate is None:
+                    if frame_due is None:
+                        frame_due = now + FRAME_INTERVAL
+                    slice_end = min(now + STEP_SLICE, frame_due)
+                    self._advance(1)
+                    while self._playing and time.perf_counter() < slice_end:
+                        self._advance(1)
+                    delay = 0.0
+                    # Between slices of a frame, only release the lock; publish once it is over.
+                    if not self._playing or time.perf_counter() >= frame_due:
+                        frame_due = None
+                else:
+                    frame_due = None
+                    owed = self._due(now)
+                    if owed:
+                        self._advance(owed)
+                        self._since_anchor += owed
+                    next_due = self._anchor + (self._since_anchor + 1) / self._rate
+                    delay = min(max(next_due - time.perf_counter(), 0.0), FRAME_INTERVAL)
+                if frame_due is None:
+                    self._publish()
+                # Sleep (or yield) outside the lock; wake early on pause/close/configure.
+                if delay:
+                    self._wake.wait(delay)
+            if not delay:
+                time.sleep(0)
@@ -0,0 +1,203 @@
+"""
+Startup self-test: verify every engine, rule and boundary mode once per process.
+
+The dense engine is first checked against known patterns (neighbor counts,
+blinker, block, glider, preset placement). Every registered engine and the
+batch stepper are then run from the same seeded soup and compared with the
+dense result for every named rule and both wrap modes. HashLife and the
+sparse engine simulate an unbounded plane, so they are checked on a bounded
+board with enough dead margin instead, skipping rules with B0. Each check is
+timed; run_self_test logs one JSON line per failure and a summary line.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import numpy as np
+
+from engine.batch import step_batch
+from engine.dense import DTYPE, count_neighbors_no_wrap, count_neighbors_wrap, next_generation
+from engine.errors import EngineError
+from engine.hashlife import hashlife_advance
+from engine.presets import build_initial_grid
+from engine.registry import ENGINES, make_stepper
+from engine.rules import RULES, Rule
+from engine.sparse import sparse_advance
+
+__all__ = [
+    "CheckResult",
+    "SelfTestError",
+    "SelfTestReport",
+    "run_self_test",
+    "self_check_neighbors",
+    "self_check_preset_bounds",
+]
+
+GENERATIONS = 8
+# 70 columns: more than one 64-bit word with a partial tail, so bit packing is exercised.
+SOUP_SHAPE = (24, 70)
+SOUP_SEED = 2024
+
+
+class SelfTestError(EngineError):
+    """An engine disagrees with the reference result."""
+
+
+@dataclass(frozen=True)
+class CheckResult:
+    name: str
+    passed: bool
+    seconds: float
+    detail: str = ""
+
+
+@dataclass
+class SelfTestReport:
+    results: list[CheckResult] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def passed(self) -> bool:
+        return all(r.passed for r in self.results)
+
+    @property
+    def failures(self) -> list[CheckResult]:
+        return [r for r in self.results if not r.passed]
+
+
+def self_check_neighbors() -> bool:
+    g = np.zeros((3, 3), dtype=DTYPE)
+    g[1, 1], g[0, 1] = 1, 1
+    nw = count_neighbors_wrap(g)
+    nn = count_neighbors_no_wrap(g)
+    assert nw[1, 1] == 1 and nn[1, 1] == 1
+    assert nw[0, 0] == 2 and nn[0, 0] == 2
+    return True
+
+
+def self_check_preset_bounds() -> bool:
+    _, err = build_initial_grid(2, 2, "Glider")
+    assert err is not None and "too small" in err.lower()
+    g, err = build_initial_grid(10, 10, "Glider")
+    # Glider has no cell at center (1,1); live cells include (0,1)->(3,4) and (2,2)->(5,5)
+    assert err is None and g[3, 4] == 1 and g.sum() == 5
+    return True
+
+
+def _expect_equal(actual: np.ndarray, expected: np.ndarray, what: str) -> None:
+    if actual.shape != expected.shape or not np.array_equal(actual, expected):
+        diff = int(np.count_nonzero(actual != expected)) if actual.shape == expected.shape else -1
+        raise SelfTestError(f"{what}: {diff} cells differ from the reference.")
+
+
+def _dense_run(grid: np.ndarray, wrap: bool, rule: Rule, generations: int) -> np.ndarray:
+    for _ in range(generations):
+        grid = next_generation(grid, wrap, rule)
+    return grid
+
+
+def _check_known_patterns() -> None:
+    blinker = np.zeros((5, 5), dtype=DTYPE)
+    blinker[2, 1:4] = 1
+    for wrap in (False, True):
+        _expect_equal(next_generation(blinker, wrap), blinker.T, "blinker phase")
+        _expect_equal(_dense_run(blinker, wrap, RULES["Conway's Life (B3/S23)"], 2), blinker, "blinker period")
+    block = np.zeros((4, 4), dtype=DTYPE)
+    block[1:3, 1:3] = 1
+    _expect_equal(next_generation(block, False), block, "block still life")
+    glider, _ = build_initial_grid(8, 8, "Glider")
+    # A glider moves one cell down and right every 4 generations.
+    moved = _dense_run(glider, True, RULES["Conway's Life (B3/S23)"], 4)
+    _expect_equal(moved, np.roll(glider, (1, 1), axis=(0, 1)), "glider translation")
+
+
+def _check_engine(engine: str, soup: np.ndarray, wrap: bool, rule: Rule, expected: np.ndarray) -> None:
+    stepper = make_stepper(engine, soup, wrap, rule)
+    try:
+        _expect_equal(stepper.run(GENERATIONS), expected, engine)
+    finally:
+        stepper.close()
+
+
+def _check_batch(soup: np.ndarray, wrap: bool, rule: Rule, expected: np.ndarray) -> None:
+    stack = np.stack([soup, soup[::-1]])
+    for _ in range(GENERATIONS):
+        stack = step_batch(stack, wrap, rule)
+    _expect_equal(stack[0], expected, "batch")
+    _expect_equal(stack[1], _dense_run(soup[::-1], wrap, rule, GENERATIONS), "batch (second board)")
+
+
+def _check_plane(name: str, advance: Callable[..., np.ndarray], soup: np.ndarray, rule: Rule) -> None:
+    # Pad by more than the light-speed reach so the dead border never matters.
+    margin = GENERATIONS + 1
+    board = np.pad(soup, margin)
+    expected = _dense_run(board, False, rule, GENERATIONS)
+    _expect_equal(advance(board, GENERATIONS, rule=rule), expected, name)
+
+
+def _timed(name: str, check: Callable[[], object], logger: Optional[logging.Logger] = None) -> CheckResult:
+    start = time.perf_counter()
+    try:
+        check()
+    except (AssertionError, EngineError) as exc:
+        return CheckResult(name, False, time.perf_counter() - start, str(exc) or type(exc).__name__)
+    except Exception as exc:
+        # A crashing engine is a failed check, never a crashed startup.
+        if logger is not None:
+            logger.exception("self_test_check_crashed", extra={"fields": {"check": name}})
+        return CheckResult(name, False, time.perf_counter() - start, f"{type(exc).__name__}: {exc}")
+    return CheckResult(name, True, time.perf_counter() - start)
+
+
+def run_self_test(logger: Optional[logging.Logger] = None) -> SelfTestReport:
+    """Run every check; log failures and a timing summary through `logger`."""
+    start = time.perf_counter()
+    report = SelfTestReport()
+    checks: list[tuple[str, Callable[[], object]]] = [
+        ("neighbors", self_check_neighbors),
+        ("preset_bounds", self_check_preset_bounds),
+        ("known_patterns", _check_known_patterns),
+    ]
+    soup = (np.random.default_rng(SOUP_SEED).random(SOUP_SHAPE) < 0.35).astype(DTYPE)
+    for rule in RULES.values():
+        for wrap in (False, True):
+            expected = _dense_run(soup, wrap, rule, GENERATIONS)
+            mode = "wrap" if wrap else "bounded"
+            for engine in ENGINES:
+                checks.append(
+                    (f"{engine}/{rule}/{mode}", lambda e=engine, w=wrap, r=rule, x=expected: _check_engine(e, soup, w, r, x))
+                )
+            checks.append((f"batch/{rule}/{mode}", lambda w=wrap, r=rule, x=expected: _check_batch(soup, w, r, x)))
+        if 0 not in rule.birth:
+            for name, advance in (("hashlife", hashlife_advance), ("sparse", sparse_advance)):
+                checks.append(
+                    (f"{name}/{rule}/plane", lambda n=name, a=advance, r=rule: _check_plane(n, a, soup, r))
+                )
+
+    report.results = [_timed(name, check, logger) for name, check in checks]
+    report.seconds = time.perf_counter() - start
+
+    if logger is not None:
+        for failure in report.failures:
+            logger.error(
+                "self_test_check_failed",
+                extra={"fields": {"check": failure.name, "detail": failure.detail, "seconds": round(failure.seconds, 6)}},
+            )
+        slowest = max(report.results, key=lambda r: r.seconds)
+        logger.info(
+            "self_test_finished",
+            extra={
+                "fields": {
+                    "passed": report.passed,
+                    "checks": len(report.results),
+                    "failures": len(report.failures),
+                    "seconds": round(report.seconds, 6),
+                    "slowest_check": slowest.name,
+                    "slowest_seconds": round(slowest.seconds, 6),
+                }
+            },
+        )
+    return report
@@ -0,0 +1,155 @@
+"""
+Sparse engine: an unbounded universe stored as the sorted set of live cells.
+
+Each live cell (row, col) is packed into one int64 key,
+((row + BIAS) << COL_BITS) | (col + BIAS), so the board is a sorted 1-D key
+array and memory is proportional to the population, not the bounding box.
+Neighbor offsets are plain integer deltas on packed keys, so a step is:
+add the eight deltas to every key, np.unique the result to get each
+candidate's neighbor count, look the candidate's own state up with
+np.searchsorted, and keep the candidates the rule maps to alive. Live cells
+with no live neighbor never appear among the candidates; they are kept
+separately when the rule survives on 0.
+
+Boundary: none. Patterns expand freely (gliders keep flying) within the
+±2^30 coordinate range; leaving it raises an EngineError. Rules with B0 are
+rejected because they would fill the infinite plane.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+from engine.errors import EngineError, GridShapeError
+from engine.rules import CONWAY, Rule, RuleError
+
+__all__ = ["SparseLife", "sparse_advance"]
+
+DTYPE = np.uint8
+KEY = np.int64
+COL_BITS = 31
+COL_MASK = (1 << COL_BITS) - 1
+BIAS = 1 << 30
+# Coordinates stay one cell inside the packable range so deltas never borrow across fields.
+LIMIT = BIAS - 1
+
+_DELTAS = np.array(
+    [(dr << COL_BITS) + dc for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc], dtype=KEY
+)
+
+
+def _pack(rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    rows, cols = np.asarray(rows, dtype=KEY), np.asarray(cols, dtype=KEY)
+    if rows.size and (np.abs(rows).max() >= LIMIT or np.abs(cols).max() >= LIMIT):
+        raise EngineError(f"Cell coordinates must stay within ±{LIMIT - 1}.")
+    return ((rows + BIAS) << COL_BITS) | (cols + BIAS)
+
+
+def _unpack(keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    return (keys >> COL_BITS) - BIAS, (keys & COL_MASK) - BIAS
+
+
+def _check_range(keys: np.ndarray) -> None:
+    if keys.size:
+        rows = (keys[[0, -1]] >> COL_BITS) - BIAS
+        cols = (keys & COL_MASK) - BIAS
+        if np.abs(rows).max() >= LIMIT or np.abs(cols).max() >= LIMIT:
+            raise EngineError(f"Pattern grew past the ±{LIMIT - 1} coordinate range.")
+
+
+class SparseLife:
+    """Unbounded Life universe holding only the coordinates of live cells."""
+
+    def __init__(self, rule: Optional[Rule] = None) -> None:
+        rule = rule or CONWAY
+        if 0 in rule.birth:
+            raise RuleError(f"{rule} births on empty space; an unbounded plane cannot represent it.")
+        self.rule = rule
+        self.generation = 0
+        self._keys = np.empty(0, dtype=KEY)
+        # Flat (state, count) table as bools, indexed by 9 * state + count.
+        self._table = rule.table.ravel().astype(bool)
+
+    # -- construction ---------------------------------------------------------
+
+    @classmethod
+    def from_array(cls, grid: np.ndarray, row0: int = 0, col0: int = 0, rule: Optional[Rule] = None) -> SparseLife:
+        """Load a 0/1 grid with its top-left cell at universe coordinate (row0, col0)."""
+        if grid.ndim != 2 or grid.size == 0:
+            raise GridShapeError(f"Expected a non-empty 2-D grid, got shape {grid.shape}.")
+        rows, cols = np.nonzero(grid)
+        return cls.from_coords(rows + row0, cols + col0, rule=rule)
+
+    @classmethod
+    def from_coords(cls, rows: np.ndarray, cols: np.ndarray, rule: Optional[Rule] = None) -> SparseLife:
+        """Load live cells from parallel row/column coordinate arrays (duplicates allowed)."""
+        life = cls(rule=rule)
+        life._keys = np.unique(_pack(rows, cols))
+        return life
+
+    # -- stepping -------------------------------------------------------------
+
+    def step(self) -> None:
+        keys = self._keys
+        if keys.size:
+            candidates, counts = np.unique((keys[:, None] + _DELTAS).ravel(), return_counts=True)
+            # State of each candidate: is it one of the (sorted) live keys?
+            pos = np.minimum(np.searchsorted(keys, candidates), keys.size - 1)
+            alive = keys[pos] == candidates
+            born = candidates[self._table[alive * 9 + counts]]
+            if self._table[9]:
+                # Live cells without live neighbors are not candidates; S0 keeps them.
+                lonely = keys[~np.isin(keys, candidates, assume_unique=True)]
+                born = np.union1d(born, lonely)
+            _check_range(born)
+            self._keys = born
+        self.generation += 1
+
+    def run(self, generations: int) -> None:
+        if generations < 0:
+            raise EngineError("generations must be non-negative.")
+        for done in range(generations):
+            if not self._keys.size:
+                # Nothing can be born on an empty plane; skip the remaining steps.
+                self.generation += generations - done
+                return
+            self.step()
+
+    # -- output ---------------------------------------------------------------
+
+    @property
+    def population(self) -> int:
+        return int(self._keys.size)
+
+    def coords(self) -> np.ndarray:
+        """(population, 2) int64 array of live (row, col), sorted row-major."""
+        rows, cols = _unpack(self._keys)
+        return np.column_stack((rows, cols))
+
+    def bounding_box(self) -> Optional[tuple[int, int, int, int]]:
+        """(row0, col0, rows, cols) of the live cells, or None when empty."""
+        if not self._keys.size:
+            return None
+        rows, cols = _unpack(self._keys)
+        r0, c0 = int(rows[0]), int(cols.min())
+        return r0, c0, int(rows[-1]) - r0 + 1, int(cols.max()) - c0 + 1
+
+    def to_array(self, row0: int, col0: int, rows: int, cols: int) -> np.ndarray:
+        """Render the window [row0, row0+rows) × [col0, col0+cols) of the universe."""
+        out = np.zeros((rows, cols), dtype=DTYPE)
+        # Keys are sorted row-major, so the window's rows are one contiguous slice.
+        bounds = (np.clip([row0, row0 + rows], -BIAS, BIAS) + BIAS) << COL_BITS
+        lo, hi = np.searchsorted(self._keys, bounds.astype(KEY))
+        r, c = _unpack(self._keys[lo:hi])
+        r, c = r - row0, c - col0
+        inside = (c >= 0) & (c < cols)
+        out[r[inside], c[inside]] = 1
+        return out
+
+
+def sparse_advance(grid: np.ndarray, generations: int, rule: Optional[Rule] = None) -> np.ndarray:
+    """Return `grid` advanced `generations` steps on the unbounded plane, cropped to its shape."""
+    life = SparseLife.from_array(grid, rule=rule)
+    life.run(generations)
+    return life.to_array(0, 0, grid.shape[0], grid.shape[1])
@@ -0,0 +1 @@
+__all__ = ["errors", "formats", "library", "life106", "model", "rle"]
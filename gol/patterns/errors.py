@@ -0,0 +1,8 @@
+"""Typed domain errors raised by the pattern readers."""
+from engine.errors import EngineError
+
+__all__ = ["PatternError"]
+
+
+class PatternError(EngineError):
+    """Pattern file is malformed or unsupported."""
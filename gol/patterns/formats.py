@@ -0,0 +1,61 @@
+"""
+Pick the pattern reader or writer for a file from its extension.
+
+.rle files use the RLE codec and .lif/.life files Life 1.06. Anything else
+is sniffed from its first bytes: "#Life 1.06" selects Life 1.06, otherwise
+the file is read as RLE.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+from patterns.errors import PatternError
+from patterns.life106 import MAGIC as LIFE106_MAGIC
+from patterns.life106 import read_life106, write_life106
+from patterns.model import Pattern
+from patterns.rle import read_rle, write_rle
+
+__all__ = ["PATTERN_SUFFIXES", "read_pattern", "write_pattern"]
+
+_READERS: dict[str, Callable[[Path], Pattern]] = {
+    ".rle": read_rle,
+    ".lif": read_life106,
+    ".life": read_life106,
+}
+PATTERN_SUFFIXES = tuple(_READERS)
+
+
+def _reader(path: Path) -> Callable[[Path], Pattern]:
+    reader = _READERS.get(path.suffix.lower())
+    if reader is not None:
+        return reader
+    with open(path, "rb") as fh:
+        head = fh.read(len(LIFE106_MAGIC))
+    return read_life106 if head.decode("utf-8", errors="replace") == LIFE106_MAGIC else read_rle
+
+
+def read_pattern(path: Union[str, Path]) -> Pattern:
+    """Read an RLE or Life 1.06 file into a uint8 grid."""
+    path = Path(path)
+    return _reader(path)(path)
+
+
+def write_pattern(
+    grid: np.ndarray,
+    path: Union[str, Path],
+    rule: Optional[str] = None,
+    name: Optional[str] = None,
+) -> None:
+    """Write `grid` in the format named by the file extension (.rle, .lif or .life)."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".rle":
+        write_rle(grid, path, rule=rule, name=name)
+    elif suffix in (".lif", ".life"):
+        # Life 1.06 has no rule field; the name goes in a description line.
+        write_life106(grid, path, comments=(name,) if name else ())
+    else:
+        raise PatternError(f"Unknown pattern format {path.suffix!r}; use one of {', '.join(PATTERN_SUFFIXES)}.")
@@ -0,0 +1,85 @@
+"""
+A directory of pattern files exposed as a lazy, cached name -> grid mapping.
+
+Nothing is read when the library is created. The first lookup scans the
+directory and reads only the header of each file to get its display name
+(the RLE #N line; otherwise the file name, title-cased). A pattern body is
+decoded the first time its name is looked up and then kept as a read-only
+array, so large catalogues cost one header read per file until used.
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from patterns.errors import PatternError
+from patterns.formats import PATTERN_SUFFIXES, read_pattern
+from patterns.model import Pattern
+from patterns.rle import read_rle_header
+
+__all__ = ["BUNDLED_DIR", "PatternLibrary"]
+
+BUNDLED_DIR = Path(__file__).with_name("data")
+
+
+def _display_name(path: Path) -> str:
+    if path.suffix.lower() == ".rle":
+        try:
+            with open(path, "rb") as fh:
+                name = read_rle_header(fh).name
+        except PatternError:
+            # A broken file keeps its place; the error surfaces when it is loaded.
+            name = None
+        if name:
+            return name
+    return path.stem.replace("_", " ").title()
+
+
+class PatternLibrary(Mapping[str, np.ndarray]):
+    """Pattern files under `directory`, keyed by display name, loaded on first access."""
+
+    def __init__(self, directory: Union[str, Path] = BUNDLED_DIR) -> None:
+        self.directory = Path(directory)
+        self._paths: Optional[dict[str, Path]] = None
+        self._loaded: dict[str, Pattern] = {}
+        self._lock = threading.Lock()
+
+    def _index(self) -> dict[str, Path]:
+        if self._paths is None:
+            with self._lock:
+                if self._paths is None:
+                    files = sorted(p for p in self.directory.iterdir() if p.suffix.lower() in PATTERN_SUFFIXES)
+                    self._paths = {_display_name(p): p for p in files}
+        return self._paths
+
+    def path(self, name: str) -> Path:
+        return self._index()[name]
+
+    def pattern(self, name: str) -> Pattern:
+        """The decoded pattern (grid plus rule, name and comments), cached after the first read."""
+        pattern = self._loaded.get(name)
+        if pattern is None:
+            path = self._index()[name]
+            with self._lock:
+                pattern = self._loaded.get(name)
+                if pattern is None:
+                    pattern = read_pattern(path)
+                    pattern.cells.setflags(write=False)
+                    self._loaded[name] = pattern
+        return pattern
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.pattern(name).cells
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index())
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index()
@@ -0,0 +1,174 @@
+"""
+Streaming reader and writer for the Life 1.06 pattern format.
+
+    #Life 1.06
+    0 -1
+    1 0
+    -1 1
+    0 1
+    1 1
+
+After the "#Life 1.06" line (and optional '#' description lines), every line
+holds the "x y" coordinates of one live cell; x is the column, y the row,
+and both may be negative. The file is read in byte chunks cut at a line
+break, and each chunk's integers are assembled from digit positions with
+array operations. Coordinates are shifted so the pattern's top-left live
+cell lands at (0, 0); the shift is kept as the pattern's (row0, col0).
+"""
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import BinaryIO, TextIO, Union
+
+import numpy as np
+
+from patterns.errors import PatternError
+from patterns.model import GridSink, PackedPattern, PackedSink, Pattern
+
+__all__ = [
+    "format_life106",
+    "parse_life106",
+    "read_life106",
+    "read_life106_coords",
+    "read_life106_packed",
+    "write_life106",
+]
+
+Source = Union[str, Path, BinaryIO]
+
+MAGIC = "#Life 1.06"
+# Rows of the grid whose live cells are written per pass.
+WRITE_ROWS = 1024
+CHUNK_BYTES = 1 << 20
+# Longest coordinate accepted; keeps the digit arithmetic exact in int64.
+MAX_DIGITS = 15
+
+_ZERO, _NINE, _MINUS, _PLUS = ord("0"), ord("9"), ord("-"), ord("+")
+_POW10 = 10 ** np.arange(MAX_DIGITS, dtype=np.int64)
+
+
+def _parse_ints(data: np.ndarray) -> np.ndarray:
+    """All whitespace-separated (optionally signed) integers in `data`, as int64."""
+    digit = (data >= _ZERO) & (data <= _NINE)
+    sign = (data == _MINUS) | (data == _PLUS)
+    token = digit | sign
+    if not (token | (data <= 32)).all():
+        bad = data[~(token | (data <= 32))][0]
+        raise PatternError(f"Unexpected Life 1.06 data {chr(bad)!r}.")
+    prev = np.concatenate(([False], token[:-1]))
+    nxt = np.concatenate((token[1:], [False]))
+    starts = token & ~prev
+    ends = np.flatnonzero(token & ~nxt)
+    # A sign must open its token and be followed by a digit.
+    if (sign & ~starts).any() or (sign & ~np.concatenate((digit[1:], [False]))).any():
+        raise PatternError("Malformed number in Life 1.06 data.")
+    token_id = np.cumsum(starts) - 1
+    digit_pos = np.flatnonzero(digit)
+    owner = token_id[digit_pos]
+    exponent = ends[owner] - digit_pos
+    if digit_pos.size and exponent.max() >= MAX_DIGITS:
+        raise PatternError("Life 1.06 coordinate too large.")
+    values = np.zeros(ends.size, dtype=np.int64)
+    np.add.at(values, owner, (data[digit_pos].astype(np.int64) - _ZERO) * _POW10[exponent])
+    negative = np.zeros(ends.size, dtype=bool)
+    negative[token_id[data == _MINUS]] = True
+    return np.where(negative, -values, values)
+
+
+def _open(source: Source) -> tuple[BinaryIO, bool]:
+    if isinstance(source, (str, Path)):
+        return open(source, "rb"), True
+    return source, False
+
+
+def read_life106_coords(source: Source, chunk_bytes: int = CHUNK_BYTES) -> tuple[np.ndarray, np.ndarray, tuple[str, ...]]:
+    """Return (rows, cols, description lines) of the live cells in file coordinates."""
+    stream, owned = _open(source)
+    try:
+        first = stream.readline().decode("utf-8", errors="replace").strip()
+        if first != MAGIC:
+            raise PatternError(f"Missing {MAGIC!r} header line, got {first!r}.")
+        comments: list[str] = []
+        parts: list[np.ndarray] = []
+        carry = b""
+        while True:
+            chunk = stream.read(chunk_bytes)
+            data = carry + chunk
+            if chunk:
+                cut = data.rfind(b"\n") + 1
+                carry, data = data[cut:], data[:cut]
+            # Description lines may only precede the coordinates.
+            while not parts and data.lstrip().startswith(b"#"):
+                line, _, data = data.lstrip().partition(b"\n")
+                comments.append(line[2:].decode("utf-8", errors="replace").strip())
+            if data:
+                parts.append(_parse_ints(np.frombuffer(data, dtype=np.uint8)))
+            if not chunk:
+                break
+    finally:
+        if owned:
+            stream.close()
+    values = np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+    if values.size % 2:
+        raise PatternError("Life 1.06 data must hold x y pairs.")
+    xy = values.reshape(-1, 2)
+    return xy[:, 1], xy[:, 0], tuple(comments)
+
+
+def _decode(source: Source, packed: bool) -> Union[Pattern, PackedPattern]:
+    rows, cols, comments = read_life106_coords(source)
+    row0 = int(rows.min()) if rows.size else 0
+    col0 = int(cols.min()) if cols.size else 0
+    height = int(rows.max()) - row0 + 1 if rows.size else 1
+    width = int(cols.max()) - col0 + 1 if cols.size else 1
+    sink = PackedSink(height, width) if packed else GridSink(height, width)
+    sink.add_runs(rows - row0, cols - col0, np.ones(rows.size, dtype=np.int64))
+    name = comments[0] if comments else None
+    if packed:
+        return PackedPattern(words=sink.words, cols=width, name=name, comments=comments, row0=row0, col0=col0)
+    return Pattern(cells=sink.grid, name=name, comments=comments, row0=row0, col0=col0)
+
+
+def read_life106(source: Source) -> Pattern:
+    """Read a Life 1.06 file (path or binary stream) into a uint8 grid."""
+    return _decode(source, packed=False)
+
+
+def read_life106_packed(source: Source) -> PackedPattern:
+    """Read a Life 1.06 file straight into bit-packed uint64 rows."""
+    return _decode(source, packed=True)
+
+
+def parse_life106(text: str) -> Pattern:
+    return read_life106(io.BytesIO(text.encode("utf-8")))
+
+
+def write_life106(
+    grid: np.ndarray,
+    dest: Union[str, Path, TextIO],
+    row0: int = 0,
+    col0: int = 0,
+    comments: tuple[str, ...] = (),
+) -> None:
+    """Write the live cells of `grid` as "x y" lines, offset by (row0, col0)."""
+    if grid.ndim != 2:
+        raise PatternError(f"Expected a 2-D grid, got shape {grid.shape}.")
+    if isinstance(dest, (str, Path)):
+        with open(dest, "w", encoding="utf-8", newline="\n") as fh:
+            write_life106(grid, fh, row0, col0, comments)
+        return
+    dest.write(MAGIC + "\n")
+    for comment in comments:
+        dest.write(f"#D {comment}\n")
+    # Row bands bound the coordinate arrays; savetxt formats and writes each line directly.
+    for start in range(0, grid.shape[0], WRITE_ROWS):
+        rows, cols = np.nonzero(grid[start : start + WRITE_ROWS])
+        if rows.size:
+            np.savetxt(dest, np.column_stack((cols + col0, rows + (start + row0))), fmt="%d %d")
+
+
+def format_life106(grid: np.ndarray, row0: int = 0, col0: int = 0, comments: tuple[str, ...] = ()) -> str:
+    out = io.StringIO()
+    write_life106(grid, out, row0, col0, comments)
+    return out.getvalue()
@@ -0,0 +1,89 @@
+"""
+Decoded patterns and the sinks that decoders write live-cell runs into.
+
+Decoders never build per-cell Python objects: they produce NumPy arrays of
+runs (row, col, length) chunk by chunk, and a sink scatters each batch
+straight into the final storage, either a uint8 grid or the bit-packed
+uint64 rows used by engine.bitpacked (bit c % 64 of word c // 64).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from engine.bitpacked import WORD_BITS
+from engine.dense import DTYPE
+from patterns.errors import PatternError
+
+__all__ = ["GridSink", "PackedPattern", "PackedSink", "Pattern", "run_cells"]
+
+
+@dataclass(frozen=True)
+class Pattern:
+    """A pattern as a uint8 grid; (row0, col0) is its top-left cell in file coordinates."""
+
+    cells: np.ndarray
+    rule: Optional[str] = None
+    name: Optional[str] = None
+    comments: tuple[str, ...] = field(default=())
+    row0: int = 0
+    col0: int = 0
+
+
+@dataclass(frozen=True)
+class PackedPattern:
+    """A pattern as (rows, ceil(cols / 64)) uint64 words in the engine.bitpacked layout."""
+
+    words: np.ndarray
+    cols: int
+    rule: Optional[str] = None
+    name: Optional[str] = None
+    comments: tuple[str, ...] = field(default=())
+    row0: int = 0
+    col0: int = 0
+
+
+def run_cells(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Flat indices covered by runs [start, start + length), without a Python loop."""
+    lengths = lengths.astype(np.int64, copy=False)
+    total = int(lengths.sum())
+    offsets = np.cumsum(lengths) - lengths
+    return np.repeat(starts.astype(np.int64, copy=False) - offsets, lengths) + np.arange(total, dtype=np.int64)
+
+
+def _check_runs(rows: np.ndarray, cols: np.ndarray, lengths: np.ndarray, shape: tuple[int, int]) -> None:
+    if rows.size and (
+        rows.min() < 0 or cols.min() < 0 or rows.max() >= shape[0] or (cols + lengths).max() > shape[1]
+    ):
+        raise PatternError(f"Live cells fall outside the {shape[1]}x{shape[0]} bounding box.")
+
+
+class GridSink:
+    """Writes runs into a preallocated (rows, cols) uint8 grid."""
+
+    def __init__(self, rows: int, cols: int) -> None:
+        self.grid = np.zeros((rows, cols), dtype=DTYPE)
+
+    def add_runs(self, rows: np.ndarray, cols: np.ndarray, lengths: np.ndarray) -> None:
+        _check_runs(rows, cols, lengths, self.grid.shape)
+        self.grid.ravel()[run_cells(rows * self.grid.shape[1] + cols, lengths)] = 1
+
+
+class PackedSink:
+    """Sets run bits directly in (rows, ceil(cols / 64)) uint64 words."""
+
+    def __init__(self, rows: int, cols: int) -> None:
+        self.cols = cols
+        self.words = np.zeros((rows, -(-cols // WORD_BITS)), dtype=np.uint64)
+
+    def add_runs(self, rows: np.ndarray, cols: np.ndarray, lengths: np.ndarray) -> None:
+        _check_runs(rows, cols, lengths, (self.words.shape[0], self.cols))
+        width = self.words.shape[1] * WORD_BITS
+        bits = run_cells(rows * width + cols, lengths)
+        np.bitwise_or.at(
+            self.words.ravel(),
+            bits // WORD_BITS,
+            np.left_shift(np.uint64(1), (bits % WORD_BITS).astype(np.uint64)),
+        )
@@ -0,0 +1,278 @@
+"""
+Streaming reader and writer for the RLE pattern format (two-state patterns).
+
+    #N Glider
+    x = 3, y = 3, rule = B3/S23
+    bob$2bo$3o!
+
+Lines starting with '#' are comments (#N names the pattern). The header gives
+the bounding box and optionally the rule. The body is a run-length encoded
+sequence of 'b' (dead), 'o' (alive; any other letter is also read as alive),
+'$' (end of row) and '!' (end of pattern); a count before a tag repeats it.
+
+The body is read in fixed-size byte chunks. Each chunk is cut after its last
+tag and decoded with array operations only: counts are assembled from digit
+positions, rows and columns from cumulative sums of the tags, and the live
+runs are handed to a GridSink or PackedSink. Memory is bounded by the chunk
+size plus the output, so megabyte-scale catalogues load quickly.
+"""
+from __future__ import annotations
+
+import bisect
+import io
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, TextIO, Union
+
+import numpy as np
+
+from patterns.errors import PatternError
+from patterns.model import GridSink, PackedPattern, PackedSink, Pattern
+
+__all__ = [
+    "RleHeader",
+    "format_rle",
+    "iter_rle_runs",
+    "parse_rle",
+    "read_rle",
+    "read_rle_header",
+    "read_rle_packed",
+    "write_rle",
+]
+
+Source = Union[str, Path, BinaryIO]
+
+CHUNK_BYTES = 1 << 20
+LINE_WIDTH = 70
+# Longest run count accepted; keeps the digit arithmetic exact in int64.
+MAX_COUNT_DIGITS = 15
+
+_HEADER = re.compile(r"^x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)(?:\s*,\s*rule\s*=\s*([^\s,]+))?", re.IGNORECASE)
+
+_DOLLAR, _BANG, _DEAD = ord("$"), ord("!"), ord("b")
+_ZERO, _NINE = ord("0"), ord("9")
+_POW10 = 10 ** np.arange(MAX_COUNT_DIGITS, dtype=np.int64)
+
+
+@dataclass(frozen=True)
+class RleHeader:
+    cols: int
+    rows: int
+    rule: Optional[str] = None
+    name: Optional[str] = None
+    comments: tuple[str, ...] = ()
+
+
+def _open(source: Source) -> tuple[BinaryIO, bool]:
+    if isinstance(source, (str, Path)):
+        return open(source, "rb"), True
+    return source, False
+
+
+def read_rle_header(stream: BinaryIO) -> RleHeader:
+    """Consume comment lines and the header line; the stream is left at the body."""
+    name: Optional[str] = None
+    comments: list[str] = []
+    for raw in stream:
+        line = raw.decode("utf-8", errors="replace").strip()
+        if not line:
+            continue
+        if line.startswith("#"):
+            if line[1:2] == "N" and name is None:
+                name = line[2:].strip() or None
+            elif line[1:2] in ("C", "c"):
+                comments.append(line[2:].strip())
+            continue
+        m = _HEADER.match(line)
+        if m is None:
+            raise PatternError(f"Missing RLE header line, got {line!r}.")
+        return RleHeader(int(m.group(1)), int(m.group(2)), m.group(3), name, tuple(comments))
+    raise PatternError("Missing RLE header line.")
+
+
+def _decode_chunk(
+    data: np.ndarray, row: int, col: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, int, int, bool]:
+    """Decode whitespace-free body bytes ending in a tag.
+
+    Returns the live runs (rows, cols, lengths), the (row, col) cursor after
+    the chunk, and whether '!' was reached.
+    """
+    digit = (data >= _ZERO) & (data <= _NINE)
+    tag_pos = np.flatnonzero(~digit)
+    tags = data[tag_pos]
+    bang = np.flatnonzero(tags == _BANG)
+    done = bang.size > 0
+    if done:
+        tag_pos, tags = tag_pos[: bang[0]], tags[: bang[0]]
+        digit[tag_pos[-1] + 1 if tag_pos.size else 0 :] = False
+    letter = ((tags | 0x20) >= ord("a")) & ((tags | 0x20) <= ord("z"))
+    dollar = tags == _DOLLAR
+    if not (letter | dollar).all():
+        bad = tags[~(letter | dollar)][0]
+        raise PatternError(f"Unexpected RLE data {chr(bad)!r}.")
+
+    # Each digit belongs to the next tag; its weight is 10 ** (digits left before that tag).
+    digit_pos = np.flatnonzero(digit)
+    owner = np.searchsorted(tag_pos, digit_pos)
+    exponent = tag_pos[owner] - digit_pos - 1 if digit_pos.size else digit_pos
+    if digit_pos.size and exponent.max() >= MAX_COUNT_DIGITS:
+        raise PatternError("RLE run count too large.")
+    counts = np.zeros(tag_pos.size, dtype=np.int64)
+    np.add.at(counts, owner, (data[digit_pos].astype(np.int64) - _ZERO) * _POW10[exponent])
+    has_count = np.zeros(tag_pos.size, dtype=bool)
+    has_count[owner] = True
+    counts[~has_count] = 1
+
+    cell_len = np.where(letter, counts, 0)
+    cum = np.cumsum(cell_len) - cell_len
+    rows = row + np.cumsum(np.where(dollar, counts, 0)) - np.where(dollar, counts, 0)
+    last_dollar = np.maximum.accumulate(np.where(dollar, np.arange(tag_pos.size), -1))
+    after_dollar = last_dollar >= 0
+    cols = np.where(after_dollar, cum - cum[np.maximum(last_dollar, 0)], col + cum)
+
+    if tag_pos.size:
+        end_row = int(rows[-1] + (counts[-1] if dollar[-1] else 0))
+        end_col = int(cols[-1] + cell_len[-1]) if not dollar[-1] else 0
+    else:
+        end_row, end_col = row, col
+    live = letter & (tags != _DEAD) & (counts > 0)
+    return rows[live], cols[live], counts[live], end_row, end_col, done
+
+
+def iter_rle_runs(
+    stream: BinaryIO, chunk_bytes: int = CHUNK_BYTES
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Yield (rows, cols, lengths) arrays of live runs from an RLE body, chunk by chunk."""
+    row = col = 0
+    carry = b""
+    while True:
+        chunk = stream.read(chunk_bytes)
+        data = np.frombuffer(carry + chunk, dtype=np.uint8)
+        data = data[data > 32]
+        if chunk:
+            # Keep a trailing partial count for the next chunk.
+            tags = np.flatnonzero((data < _ZERO) | (data > _NINE))
+            cut = int(tags[-1]) + 1 if tags.size else 0
+            carry, data = data[cut:].tobytes(), data[:cut]
+        elif data.size:
+            raise PatternError("RLE body ends inside a run count.")
+        if data.size:
+            rows, cols, lengths, row, col, done = _decode_chunk(data, row, col)
+            if rows.size:
+                yield rows, cols, lengths
+            if done:
+                return
+        if not chunk:
+            return
+
+
+def _decode(source: Source, packed: bool) -> Union[Pattern, PackedPattern]:
+    stream, owned = _open(source)
+    try:
+        header = read_rle_header(stream)
+        sink = PackedSink(header.rows, header.cols) if packed else GridSink(header.rows, header.cols)
+        for rows, cols, lengths in iter_rle_runs(stream):
+            sink.add_runs(rows, cols, lengths)
+    finally:
+        if owned:
+            stream.close()
+    meta = dict(rule=header.rule, name=header.name, comments=header.comments)
+    if packed:
+        return PackedPattern(words=sink.words, cols=header.cols, **meta)
+    return Pattern(cells=sink.grid, **meta)
+
+
+def read_rle(source: Source) -> Pattern:
+    """Read an .rle file (path or binary stream) into a uint8 grid."""
+    return _decode(source, packed=False)
+
+
+def read_rle_packed(source: Source) -> PackedPattern:
+    """Read an .rle file straight into bit-packed uint64 rows."""
+    return _decode(source, packed=True)
+
+
+def parse_rle(text: str) -> Pattern:
+    """Parse RLE text into a uint8 grid plus the header rule and #N name."""
+    return read_rle(io.BytesIO(text.encode("utf-8")))
+
+
+def _body_tokens(grid: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(counts, tags) of the RLE body; trailing dead cells and rows are omitted."""
+    live = np.diff(np.pad((grid != 0).astype(np.int8), ((0, 0), (1, 1))), axis=1)
+    run_rows, starts = np.nonzero(live == 1)
+    _, ends = np.nonzero(live == -1)
+    first_in_row = np.ones(run_rows.size, dtype=bool)
+    first_in_row[1:] = run_rows[1:] != run_rows[:-1]
+    prev_end = np.concatenate(([0], ends[:-1]))
+    # Per run: '$' tokens to reach its row, the dead gap before it, then the run itself.
+    counts = np.stack(
+        (
+            np.where(first_in_row, np.diff(np.concatenate(([0], run_rows))), 0),
+            np.where(first_in_row, starts, starts - prev_end),
+            ends - starts,
+        ),
+        axis=1,
+    ).ravel()
+    tags = np.tile(np.array([_DOLLAR, _DEAD, ord("o")], dtype=np.uint8), run_rows.size)
+    keep = counts > 0
+    return np.append(counts[keep], 1), np.append(tags[keep], np.uint8(_BANG))
+
+
+def _encode_body(grid: np.ndarray) -> bytes:
+    """RLE body bytes, built with array writes and wrapped at LINE_WIDTH without splitting tokens."""
+    counts, tags = _body_tokens(grid)
+    ndigits = np.where(counts > 1, np.floor(np.log10(np.maximum(counts, 1))).astype(np.int64) + 1, 0)
+    lengths = ndigits + 1
+    ends = np.cumsum(lengths)
+    offsets = ends - lengths
+    buf = np.empty(int(ends[-1]), dtype=np.uint8)
+    for j in range(int(ndigits.max())):
+        has = ndigits > j
+        place = _POW10[ndigits[has] - 1 - j]
+        buf[offsets[has] + j] = _ZERO + (counts[has] // place) % 10
+    buf[offsets + ndigits] = tags
+
+    # Greedy wrap: one bisect per output line, not per token.
+    token_ends = ends.tolist()
+    breaks = []
+    i, start = 0, 0
+    while i < len(token_ends):
+        i = max(bisect.bisect_right(token_ends, start + LINE_WIDTH), i + 1)
+        start = token_ends[i - 1]
+        breaks.append(start)
+    return np.insert(buf, breaks, ord("\n")).tobytes()
+
+
+def write_rle(
+    grid: np.ndarray,
+    dest: Union[str, Path, TextIO],
+    rule: Optional[str] = None,
+    name: Optional[str] = None,
+    comments: tuple[str, ...] = (),
+) -> None:
+    """Write `grid` as RLE, wrapping body lines at 70 characters."""
+    if grid.ndim != 2:
+        raise PatternError(f"Expected a 2-D grid, got shape {grid.shape}.")
+    if isinstance(dest, (str, Path)):
+        with open(dest, "w", encoding="utf-8", newline="\n") as fh:
+            write_rle(grid, fh, rule, name, comments)
+        return
+    if name:
+        dest.write(f"#N {name}\n")
+    for comment in comments:
+        dest.write(f"#C {comment}\n")
+    rows, cols = grid.shape
+    dest.write(f"x = {cols}, y = {rows}" + (f", rule = {rule}" if rule else "") + "\n")
+    dest.write(_encode_body(grid).decode("ascii"))
+
+
+def format_rle(
+    grid: np.ndarray, rule: Optional[str] = None, name: Optional[str] = None, comments: tuple[str, ...] = ()
+) -> str:
+    """RLE text for `grid` (see write_rle)."""
+    out = io.StringIO()
+    write_rle(grid, out, rule, name, comments)
+    return out.getvalue()
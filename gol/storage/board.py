@@ -0,0 +1,229 @@
+"""
+Compact on-disk board format, read and written through np.memmap.
+
+A board file is a 64-byte little-endian header followed by the cells in the
+engine.bitpacked layout: one row of ceil(cols / 64) uint64 words per board
+row, bit c % 64 of word c // 64 holding cell (r, c).
+
+    offset  size  field
+    0       4     magic b"GOLB"
+    4       2     format version (1)
+    6       2     flags (bit 0: wrap)
+    8       2     birth counts as a bitmask (bit k: born on k neighbors)
+    10      2     survival counts as a bitmask
+    12      4     reserved (0)
+    16      8     rows
+    24      8     cols
+    32      8     generation
+    40      24    reserved (0)
+
+The cell data is 8-byte aligned, so open_board maps it directly as a
+(rows, words) uint64 array without reading it. step_board_file advances a
+board one generation band by band: each band of rows is read from the mapped
+source together with one halo row on either side, stepped in memory and
+written to the mapped destination, so boards larger than RAM can be run.
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from engine.bitpacked import WORD_BITS, pack_grid, step_packed, unpack_grid
+from engine.rules import Rule
+from storage.errors import BoardFileError
+
+__all__ = [
+    "BoardHeader",
+    "advance_board_file",
+    "create_board",
+    "load_board",
+    "open_board",
+    "read_header",
+    "save_board",
+    "step_board_file",
+    "write_generation",
+]
+
+PathLike = Union[str, Path]
+
+MAGIC = b"GOLB"
+VERSION = 1
+HEADER_BYTES = 64
+FLAG_WRAP = 1
+# Default band size for out-of-core stepping.
+BAND_BYTES = 64 << 20
+
+_HEADER = np.dtype(
+    [
+        ("magic", "S4"),
+        ("version", "<u2"),
+        ("flags", "<u2"),
+        ("birth", "<u2"),
+        ("survival", "<u2"),
+        ("reserved", "<u4"),
+        ("rows", "<u8"),
+        ("cols", "<u8"),
+        ("generation", "<u8"),
+        ("padding", "V24"),
+    ]
+)
+_WORD = np.dtype("<u8")
+
+
+def _mask(counts: frozenset[int]) -> int:
+    return sum(1 << k for k in counts)
+
+
+def _counts(mask: int) -> frozenset[int]:
+    return frozenset(k for k in range(9) if mask >> k & 1)
+
+
+@dataclass(frozen=True)
+class BoardHeader:
+    rows: int
+    cols: int
+    rule: Rule
+    wrap: bool
+    generation: int = 0
+
+    @property
+    def words_per_row(self) -> int:
+        return -(-self.cols // WORD_BITS)
+
+    @property
+    def file_bytes(self) -> int:
+        return HEADER_BYTES + self.rows * self.words_per_row * _WORD.itemsize
+
+    def to_bytes(self) -> bytes:
+        if self.rows <= 0 or self.cols <= 0:
+            raise BoardFileError(f"Board dimensions must be positive, got {self.rows}x{self.cols}.")
+        header = np.zeros((), dtype=_HEADER)
+        header["magic"], header["version"] = MAGIC, VERSION
+        header["flags"] = FLAG_WRAP if self.wrap else 0
+        header["birth"], header["survival"] = _mask(self.rule.birth), _mask(self.rule.survival)
+        header["rows"], header["cols"], header["generation"] = self.rows, self.cols, self.generation
+        return header.tobytes()
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> BoardHeader:
+        if len(raw) < HEADER_BYTES:
+            raise BoardFileError("Board file is shorter than its header.")
+        header = np.frombuffer(raw[:HEADER_BYTES], dtype=_HEADER)[0]
+        if header["magic"] != MAGIC:
+            raise BoardFileError(f"Not a board file (magic {bytes(header['magic'])!r}).")
+        if header["version"] != VERSION:
+            raise BoardFileError(f"Unsupported board file version {int(header['version'])}.")
+        rule = Rule(_counts(int(header["birth"])), _counts(int(header["survival"])))
+        return cls(
+            rows=int(header["rows"]),
+            cols=int(header["cols"]),
+            rule=rule,
+            wrap=bool(header["flags"] & FLAG_WRAP),
+            generation=int(header["generation"]),
+        )
+
+
+def read_header(path: PathLike) -> BoardHeader:
+    """Read and validate the header, checking the file holds all of the cell data."""
+    with open(path, "rb") as fh:
+        header = BoardHeader.from_bytes(fh.read(HEADER_BYTES))
+    size = os.path.getsize(path)
+    if size != header.file_bytes:
+        raise BoardFileError(f"{path}: expected {header.file_bytes} bytes for a {header.rows}x{header.cols} board, found {size}.")
+    return header
+
+
+def open_board(path: PathLike, mode: str = "r") -> tuple[BoardHeader, np.memmap]:
+    """Map the cell words of a board file; mode "r" is read-only, "r+" writable."""
+    if mode not in ("r", "r+"):
+        raise BoardFileError(f"mode must be 'r' or 'r+', got {mode!r}.")
+    header = read_header(path)
+    words = np.memmap(path, dtype=_WORD, mode=mode, offset=HEADER_BYTES, shape=(header.rows, header.words_per_row))
+    return header, words
+
+
+def create_board(path: PathLike, header: BoardHeader) -> np.memmap:
+    """Create a zero-filled board file of the header's size and map it writable."""
+    with open(path, "wb") as fh:
+        fh.write(header.to_bytes())
+        fh.truncate(header.file_bytes)
+    return open_board(path, "r+")[1]
+
+
+def write_generation(path: PathLike, generation: int) -> None:
+    """Update the generation counter in place."""
+    header = read_header(path)
+    with open(path, "r+b") as fh:
+        fh.write(BoardHeader(header.rows, header.cols, header.rule, header.wrap, generation).to_bytes())
+
+
+def save_board(path: PathLike, grid: np.ndarray, rule: Rule, wrap: bool, generation: int = 0) -> BoardHeader:
+    """Write a 0/1 grid as a board file; the file is replaced atomically."""
+    path = Path(path)
+    header = BoardHeader(grid.shape[0], grid.shape[1], rule, wrap, generation)
+    words = pack_grid(grid).astype(_WORD, copy=False)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(header.to_bytes())
+        fh.write(words.tobytes())
+    os.replace(tmp, path)
+    return header
+
+
+def load_board(path: PathLike) -> tuple[BoardHeader, np.ndarray]:
+    """Read a board file back into (header, uint8 grid)."""
+    header, words = open_board(path)
+    return header, unpack_grid(words, header.cols)
+
+
+def _band_rows(header: BoardHeader, band_rows: Optional[int]) -> int:
+    if band_rows is None:
+        band_rows = BAND_BYTES // (header.words_per_row * _WORD.itemsize)
+    if band_rows <= 0:
+        raise BoardFileError("band_rows must be positive.")
+    return max(1, min(band_rows, header.rows))
+
+
+def _read_band(words: np.ndarray, row0: int, row1: int, wrap: bool) -> np.ndarray:
+    """Rows [row0 - 1, row1 + 1) of the board; halo rows wrap or are dead."""
+    index = np.arange(row0 - 1, row1 + 1)
+    rows = words.shape[0]
+    if wrap:
+        return words[index % rows]
+    band = np.zeros((index.size, words.shape[1]), dtype=_WORD)
+    inside = (index >= 0) & (index < rows)
+    band[inside] = words[index[inside]]
+    return band
+
+
+def step_board_file(src: PathLike, dst: PathLike, band_rows: Optional[int] = None) -> BoardHeader:
+    """Write the next generation of board file `src` to `dst`, one band of rows at a time."""
+    header, words = open_board(src)
+    step = _band_rows(header, band_rows)
+    out = BoardHeader(header.rows, header.cols, header.rule, header.wrap, header.generation + 1)
+    target = create_board(dst, out)
+    for row0 in range(0, header.rows, step):
+        row1 = min(row0 + step, header.rows)
+        band = _read_band(words, row0, row1, header.wrap)
+        # Column wrap is per row, so stepping the band with halos gives exact interior rows.
+        target[row0:row1] = step_packed(band, header.cols, header.wrap, header.rule)[1:-1]
+    target.flush()
+    del target, words
+    return out
+
+
+def advance_board_file(path: PathLike, generations: int, band_rows: Optional[int] = None) -> BoardHeader:
+    """Advance a board file in place by `generations`, ping-ponging through a scratch file."""
+    if generations < 0:
+        raise BoardFileError("generations must be non-negative.")
+    path = Path(path)
+    header = read_header(path)
+    scratch = path.with_name(path.name + ".next")
+    for _ in range(generations):
+        header = step_board_file(path, scratch, band_rows)
+        os.replace(scratch, path)
+    return header
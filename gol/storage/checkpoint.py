@@ -0,0 +1,76 @@
+"""
+Periodic checkpoints of a long run, and resuming from the latest one.
+
+A Checkpointer saves the board as ckpt_<generation>.golb in its directory
+whenever the generation reaches a multiple of `every`, keeping only the
+newest `keep` files. Each file is written to a temporary name and renamed,
+so an interrupted run always leaves complete checkpoints behind.
+"""
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from engine.rules import Rule
+from storage.board import BoardHeader, load_board, save_board
+from storage.errors import BoardFileError
+
+__all__ = ["Checkpointer", "latest_checkpoint", "resume"]
+
+SUFFIX = ".golb"
+_NAME = re.compile(r"^ckpt_(\d+)\.golb$")
+
+
+def _checkpoints(directory: Path) -> list[tuple[int, Path]]:
+    if not directory.is_dir():
+        return []
+    found = [(int(m.group(1)), p) for p in directory.iterdir() if (m := _NAME.match(p.name))]
+    return sorted(found)
+
+
+def latest_checkpoint(directory: Union[str, Path]) -> Optional[Path]:
+    """Path of the highest-generation checkpoint in `directory`, or None."""
+    found = _checkpoints(Path(directory))
+    return found[-1][1] if found else None
+
+
+def resume(directory: Union[str, Path]) -> tuple[BoardHeader, np.ndarray]:
+    """Load the latest checkpoint in `directory` as (header, grid)."""
+    path = latest_checkpoint(directory)
+    if path is None:
+        raise BoardFileError(f"No checkpoints in {directory}.")
+    return load_board(path)
+
+
+class Checkpointer:
+    """Saves every `every` generations into `directory`, keeping the newest `keep` files."""
+
+    def __init__(self, directory: Union[str, Path], every: int, rule: Rule, wrap: bool, keep: int = 3) -> None:
+        if every <= 0 or keep <= 0:
+            raise BoardFileError("every and keep must be positive.")
+        self.directory = Path(directory)
+        self.every = every
+        self.rule = rule
+        self.wrap = wrap
+        self.keep = keep
+
+    def path_for(self, generation: int) -> Path:
+        return self.directory / f"ckpt_{generation:09d}{SUFFIX}"
+
+    def due(self, generation: int) -> bool:
+        return generation > 0 and generation % self.every == 0
+
+    def save(self, grid: np.ndarray, generation: int) -> Path:
+        """Write a checkpoint for `generation` unconditionally and prune old ones."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(generation)
+        save_board(path, grid, self.rule, self.wrap, generation)
+        for _, old in _checkpoints(self.directory)[: -self.keep]:
+            old.unlink()
+        return path
+
+    def maybe_save(self, grid: np.ndarray, generation: int) -> Optional[Path]:
+        return self.save(grid, generation) if self.due(generation) else None
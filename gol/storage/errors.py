@@ -0,0 +1,8 @@
+"""Typed domain errors raised by the board file format."""
+from engine.errors import EngineError
+
+__all__ = ["BoardFileError"]
+
+
+class BoardFileError(EngineError):
+    """Board file is missing, truncated or not in the expected format."""
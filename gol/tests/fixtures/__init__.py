@@ -3,7 +3,10 @@ from tests.fixtures.grid_builders import (
     blank_grid,
     blinker_horizontal,
     glider_grid,
+    gosper_gun_pattern,
     grid_with_live_cell,
+    lwss_pattern,
+    random_grid,
     single_live_center,
 )
 
@@ -11,6 +14,9 @@ __all__ = [
     "blank_grid",
     "blinker_horizontal",
     "glider_grid",
+    "gosper_gun_pattern",
     "grid_with_live_cell",
+    "lwss_pattern",
+    "random_grid",
     "single_live_center",
 ]
@@ -38,3 +38,36 @@ def glider_grid(rows: int = 10, cols: int = 10) -> np.ndarray:
     g[r0 + 1, c0 + 2] = 1
     g[r0 + 2, c0], g[r0 + 2, c0 + 1], g[r0 + 2, c0 + 2] = 1, 1, 1
     return g
+
+
+def random_grid(rows: int = 10, cols: int = 10, density: float = 0.3, seed: int = 0) -> np.ndarray:
+    """Deterministic random soup for parity tests between engines."""
+    rng = np.random.default_rng(seed)
+    return (rng.random((rows, cols)) < density).astype(DTYPE)
+
+
+def lwss_pattern() -> np.ndarray:
+    """Lightweight spaceship (5×4 bounding box, travels west at c/2)."""
+    g = np.zeros((4, 5), dtype=DTYPE)
+    for r, c in [(0, 1), (0, 4), (1, 0), (2, 0), (2, 4), (3, 0), (3, 1), (3, 2), (3, 3)]:
+        g[r, c] = 1
+    return g
+
+
+def gosper_gun_pattern() -> np.ndarray:
+    """Gosper glider gun (36×9 bounding box, one glider every 30 generations)."""
+    g = np.zeros((9, 36), dtype=DTYPE)
+    cells = {
+        0: (24,),
+        1: (22, 24),
+        2: (12, 13, 20, 21, 34, 35),
+        3: (11, 15, 20, 21, 34, 35),
+        4: (0, 1, 10, 16, 20, 21),
+        5: (0, 1, 10, 14, 16, 17, 22, 24),
+        6: (10, 16, 24),
+        7: (11, 15),
+        8: (12, 13),
+    }
+    for r, cols in cells.items():
+        g[r, list(cols)] = 1
+    return g
@@ -0,0 +1,74 @@
+"""Tests for active-region (tiled) stepping."""
+import numpy as np
+import pytest
+
+from app import next_generation
+from engine.active import ActiveRegionStepper
+from engine.errors import EngineError, GridShapeError
+from tests.fixtures import blinker_horizontal, glider_grid, gosper_gun_pattern, random_grid
+
+
+class TestActiveRegionParity:
+    @pytest.mark.parametrize("wrap", [False, True])
+    @pytest.mark.parametrize("shape,tile", [((30, 30), 8), ((37, 53), 8), ((5, 7), 4), ((1, 9), 2), ((64, 64), 16)])
+    def test_random_soup_matches_dense(self, shape: tuple[int, int], tile: int, wrap: bool) -> None:
+        g = random_grid(*shape, density=0.35, seed=shape[0] + shape[1])
+        stepper = ActiveRegionStepper(g, wrap, tile=tile)
+        expected = g
+        for _ in range(25):
+            expected = next_generation(expected, wrap)
+            np.testing.assert_array_equal(stepper.step(), expected)
+
+    @pytest.mark.parametrize("wrap", [False, True])
+    def test_glider_crosses_tile_and_board_edges(self, wrap: bool) -> None:
+        g = np.zeros((24, 24), dtype=np.uint8)
+        g[14:24, 14:24] = glider_grid(10, 10)
+        stepper = ActiveRegionStepper(g, wrap, tile=6)
+        expected = g
+        for _ in range(60):
+            expected = next_generation(expected, wrap)
+            np.testing.assert_array_equal(stepper.step(), expected)
+
+    def test_gun_on_large_board_matches_dense(self) -> None:
+        g = np.zeros((96, 96), dtype=np.uint8)
+        g[10:19, 10:46] = gosper_gun_pattern()
+        stepper = ActiveRegionStepper(g, wrap=False, tile=16)
+        expected = g
+        for _ in range(120):
+            expected = next_generation(expected, False)
+        np.testing.assert_array_equal(stepper.run(120), expected)
+
+
+class TestActiveRegionTracking:
+    def test_still_board_goes_fully_inactive(self) -> None:
+        g = np.zeros((64, 64), dtype=np.uint8)
+        g[10:12, 10:12] = 1  # block
+        stepper = ActiveRegionStepper(g, wrap=False, tile=8)
+        stepper.run(2)
+        assert not stepper.active.any()
+
+    def test_blinker_keeps_only_local_tiles_active(self) -> None:
+        g = np.zeros((64, 64), dtype=np.uint8)
+        g[34:39, 34:39] = blinker_horizontal(5, 5)
+        stepper = ActiveRegionStepper(g, wrap=False, tile=8)
+        stepper.run(3)
+        assert stepper.active.sum() == 9
+
+    def test_mark_dirty_reactivates_after_external_edit(self) -> None:
+        g = np.zeros((32, 32), dtype=np.uint8)
+        stepper = ActiveRegionStepper(g, wrap=False, tile=8)
+        stepper.step()
+        assert not stepper.active.any()
+        stepper.grid[20, 5:8] = 1
+        stepper.mark_dirty(20, 21, 5, 8)
+        np.testing.assert_array_equal(stepper.step()[19:22, 6], [1, 1, 1])
+
+
+class TestActiveRegionValidation:
+    def test_rejects_bad_grid(self) -> None:
+        with pytest.raises(GridShapeError):
+            ActiveRegionStepper(np.zeros(4, dtype=np.uint8), wrap=False)
+
+    def test_rejects_bad_tile(self) -> None:
+        with pytest.raises(EngineError):
+            ActiveRegionStepper(np.zeros((4, 4), dtype=np.uint8), wrap=False, tile=0)
@@ -0,0 +1,77 @@
+"""Tests for batched multi-board simulation."""
+import numpy as np
+import pytest
+
+from app import next_generation
+from engine.batch import count_neighbors_batch, random_soups, run_batch, step_batch
+from engine.errors import EngineError, GridShapeError
+from engine.rules import parse_rule
+from tests.fixtures import blank_grid, blinker_horizontal, glider_grid, random_grid
+
+
+def _stack(*grids: np.ndarray) -> np.ndarray:
+    return np.stack(grids).astype(np.uint8)
+
+
+class TestStepBatch:
+    @pytest.mark.parametrize("wrap", [False, True])
+    def test_each_board_matches_dense(self, wrap: bool) -> None:
+        boards = random_soups(6, 13, 17, density=0.4, rng=np.random.default_rng(0))
+        out = step_batch(boards, wrap)
+        for i in range(len(boards)):
+            np.testing.assert_array_equal(out[i], next_generation(boards[i], wrap))
+
+    def test_boards_do_not_leak_into_each_other(self) -> None:
+        boards = _stack(blank_grid(5, 5), np.ones((5, 5)))
+        counts = count_neighbors_batch(boards, wrap=True)
+        np.testing.assert_array_equal(counts[0], 0)
+        np.testing.assert_array_equal(counts[1], 8)
+
+    def test_rule_is_applied(self) -> None:
+        rule = parse_rule("B36/S23")
+        boards = random_soups(3, 10, 10, rng=np.random.default_rng(1))
+        out = step_batch(boards, False, rule)
+        np.testing.assert_array_equal(out[2], next_generation(boards[2], False, rule))
+
+    def test_rejects_2d_input(self) -> None:
+        with pytest.raises(GridShapeError):
+            step_batch(blank_grid(), wrap=False)
+
+
+class TestRunBatch:
+    def test_reports_population_and_status(self) -> None:
+        g = np.zeros((10, 10), dtype=np.uint8)
+        g[4:6, 4:6] = 1  # block: still life
+        boards = _stack(blank_grid(10, 10), g, blinker_horizontal(10, 10, 4, 3), glider_grid(10, 10))
+        result = run_batch(boards, wrap=True, generations=20)
+        np.testing.assert_array_equal(result.finished, [True, True, True, False])
+        np.testing.assert_array_equal(result.finished_at, [1, 1, 2, -1])
+        np.testing.assert_array_equal(result.populations, [0, 4, 3, 5])
+        np.testing.assert_array_equal(result.extinct, [True, False, False, False])
+
+    @pytest.mark.parametrize("drop_finished", [True, False])
+    def test_running_boards_match_dense(self, drop_finished: bool) -> None:
+        boards = random_soups(8, 16, 16, density=0.35, rng=np.random.default_rng(2))
+        result = run_batch(boards, wrap=False, generations=30, drop_finished=drop_finished)
+        for i in np.flatnonzero(~result.finished):
+            expected = boards[i]
+            for _ in range(30):
+                expected = next_generation(expected, False)
+            np.testing.assert_array_equal(result.boards[i], expected)
+
+    def test_finished_board_keeps_its_settled_state(self) -> None:
+        boards = _stack(blinker_horizontal(5, 5), random_grid(5, 5, seed=3))
+        result = run_batch(boards, wrap=False, generations=11)
+        # Period 2 is recognised at generation 2, which is the starting phase again.
+        assert result.finished_at[0] == 2
+        np.testing.assert_array_equal(result.boards[0], blinker_horizontal(5, 5))
+
+    def test_zero_generations_returns_input(self) -> None:
+        boards = random_soups(2, 4, 4, rng=np.random.default_rng(4))
+        result = run_batch(boards, wrap=False, generations=0)
+        np.testing.assert_array_equal(result.boards, boards)
+        assert not result.finished.any()
+
+    def test_rejects_negative_generations(self) -> None:
+        with pytest.raises(EngineError):
+            run_batch(random_soups(1, 4, 4), wrap=False, generations=-1)
@@ -0,0 +1,58 @@
+"""Tests for the engine registry and benchmark harness."""
+import numpy as np
+import pytest
+
+from app import next_generation
+from engine.benchmark import BenchResult, compare, run_case, run_suite
+from engine.errors import EngineError
+from engine.registry import ENGINES, make_stepper
+from engine.rules import parse_rule
+from tests.fixtures import random_grid
+
+
+class TestRegistry:
+    @pytest.mark.parametrize("wrap", [False, True])
+    @pytest.mark.parametrize("engine", list(ENGINES))
+    def test_engines_agree_with_dense(self, engine: str, wrap: bool) -> None:
+        rule = parse_rule("B36/S23")
+        g = random_grid(21, 70, seed=3)
+        expected = g
+        for _ in range(12):
+            expected = next_generation(expected, wrap, rule)
+        stepper = make_stepper(engine, g, wrap, rule)
+        try:
+            stepper.step()
+            np.testing.assert_array_equal(stepper.run(11), expected)
+            assert stepper.generation == 12
+        finally:
+            stepper.close()
+
+    def test_unknown_engine(self) -> None:
+        with pytest.raises(EngineError, match="Unknown engine"):
+            make_stepper("gpu", random_grid(4, 4), False)
+
+
+class TestBenchmark:
+    def test_suite_covers_every_case(self) -> None:
+        results = run_suite(["dense", "bitpacked"], [(16, 16), (8, 24)], [0.2, 0.5], generations=3, repeat=1)
+        assert len(results) == 8
+        assert {r.key for r in results} == {
+            (e, rows, cols, d, True) for e in ("dense", "bitpacked") for rows, cols in ((16, 16), (8, 24)) for d in (0.2, 0.5)
+        }
+        r = results[0].as_dict()
+        assert r["cells_per_sec"] == pytest.approx(r["gens_per_sec"] * 16 * 16)
+
+    def test_rejects_bad_counts(self) -> None:
+        with pytest.raises(EngineError):
+            run_case("dense", 8, 8, 0.3, generations=0)
+
+    def test_compare_flags_slowdowns_only(self) -> None:
+        fast = BenchResult("dense", 8, 8, 0.3, True, 100, 1.0)
+        slow = BenchResult("bitpacked", 8, 8, 0.3, True, 100, 2.0)
+        new = BenchResult("buffered", 8, 8, 0.3, True, 100, 9.0)
+        baseline = [
+            {**fast.as_dict(), "gens_per_sec": 110.0},
+            {**slow.as_dict(), "gens_per_sec": 100.0},
+        ]
+        regressions = compare([fast, slow, new], baseline, tolerance=0.2)
+        assert len(regressions) == 1 and regressions[0].startswith("bitpacked")
@@ -0,0 +1,73 @@
+"""Tests for the bit-packed engine (parity with next_generation)."""
+import numpy as np
+import pytest
+
+from app import next_generation
+from engine.bitpacked import (
+    next_generation_bitpacked,
+    pack_grid,
+    run_bitpacked,
+    step_packed,
+    unpack_grid,
+)
+from engine.errors import GridShapeError
+from tests.fixtures import blinker_horizontal, glider_grid, random_grid
+
+SHAPES = [(1, 1), (1, 5), (3, 1), (2, 2), (7, 63), (8, 64), (9, 65), (16, 130), (33, 200)]
+
+
+class TestPacking:
+    @pytest.mark.parametrize("shape", SHAPES)
+    def test_round_trip(self, shape: tuple[int, int]) -> None:
+        g = random_grid(*shape, density=0.5, seed=1)
+        np.testing.assert_array_equal(unpack_grid(pack_grid(g), shape[1]), g)
+
+    def test_packs_64_cells_per_word(self) -> None:
+        words = pack_grid(random_grid(4, 129))
+        assert words.dtype == np.uint64
+        assert words.shape == (4, 3)
+
+    def test_bit_order_is_little_endian_per_word(self) -> None:
+        g = np.zeros((1, 70), dtype=np.uint8)
+        g[0, 0], g[0, 65] = 1, 1
+        words = pack_grid(g)
+        assert int(words[0, 0]) == 1 and int(words[0, 1]) == 2
+
+    def test_rejects_non_2d(self) -> None:
+        with pytest.raises(GridShapeError):
+            pack_grid(np.zeros(5, dtype=np.uint8))
+
+    def test_unpack_rejects_mismatched_cols(self) -> None:
+        with pytest.raises(GridShapeError):
+            unpack_grid(pack_grid(random_grid(3, 10)), 100)
+
+
+class TestParityWithDense:
+    @pytest.mark.parametrize("wrap", [False, True])
+    @pytest.mark.parametrize("shape", SHAPES)
+    def test_random_soups_match_for_several_generations(self, shape: tuple[int, int], wrap: bool) -> None:
+        g = random_grid(*shape, density=0.4, seed=shape[0] * 1000 + shape[1])
+        expected = g
+        words = pack_grid(g)
+        for _ in range(12):
+            expected = next_generation(expected, wrap)
+            words = step_packed(words, shape[1], wrap)
+            np.testing.assert_array_equal(unpack_grid(words, shape[1]), expected)
+
+    @pytest.mark.parametrize("wrap", [False, True])
+    def test_glider_crossing_word_boundary(self, wrap: bool) -> None:
+        g = np.zeros((12, 140), dtype=np.uint8)
+        g[:10, 58:68] = glider_grid(10, 10)
+        expected = g
+        for _ in range(40):
+            expected = next_generation(expected, wrap)
+        np.testing.assert_array_equal(run_bitpacked(g, wrap, 40), expected)
+
+    def test_single_step_helper(self) -> None:
+        g = blinker_horizontal(5, 5)
+        np.testing.assert_array_equal(next_generation_bitpacked(g, False), next_generation(g, False))
+
+    def test_padding_bits_stay_clear(self) -> None:
+        g = np.ones((4, 70), dtype=np.uint8)
+        words = step_packed(pack_grid(g), 70, wrap=True)
+        assert int(words[0, -1]) >> 6 == 0
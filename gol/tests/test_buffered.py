@@ -0,0 +1,83 @@
+"""Tests for the allocation-free ping-pong stepper."""
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from app import next_generation
+from engine.buffered import PingPongStepper, StepScratch, fill_halo, step_padded
+from engine.errors import GridShapeError
+from engine.rules import parse_rule
+from tests.fixtures import glider_grid, random_grid
+
+
+class TestPingPongParity:
+    @pytest.mark.parametrize("wrap", [False, True])
+    @pytest.mark.parametrize("shape", [(1, 1), (1, 7), (6, 1), (2, 3), (25, 40)])
+    def test_matches_dense(self, shape: tuple[int, int], wrap: bool) -> None:
+        g = random_grid(*shape, density=0.45, seed=sum(shape))
+        stepper = PingPongStepper(g, wrap)
+        expected = g
+        for _ in range(15):
+            expected = next_generation(expected, wrap)
+            np.testing.assert_array_equal(stepper.step(), expected)
+
+    @pytest.mark.parametrize("wrap", [False, True])
+    @pytest.mark.parametrize("rulestring", ["B36/S23", "B3678/S34678", "B0123/S8"])
+    def test_lookup_rules_match_dense(self, rulestring: str, wrap: bool) -> None:
+        rule = parse_rule(rulestring)
+        g = random_grid(18, 22, seed=11)
+        expected = g
+        for _ in range(8):
+            expected = next_generation(expected, wrap, rule)
+        np.testing.assert_array_equal(PingPongStepper(g, wrap, rule).run(8), expected)
+
+    def test_glider_wraps_around(self) -> None:
+        g = glider_grid(8, 8)
+        expected = g
+        for _ in range(32):
+            expected = next_generation(expected, True)
+        np.testing.assert_array_equal(PingPongStepper(g, True).run(32), expected)
+
+
+class TestBuffers:
+    def test_step_padded_writes_into_caller_buffer(self) -> None:
+        g = random_grid(10, 10, seed=12)
+        padded = np.zeros((12, 12), dtype=np.uint8)
+        padded[1:-1, 1:-1] = g
+        fill_halo(padded, wrap=True)
+        out = np.zeros((12, 12), dtype=np.uint8)
+        result = step_padded(padded, out, StepScratch.allocate(padded.shape))
+        assert result is out
+        np.testing.assert_array_equal(out[1:-1, 1:-1], next_generation(g, True))
+
+    def test_fill_halo_no_wrap_clears_edges(self) -> None:
+        padded = np.ones((5, 6), dtype=np.uint8)
+        fill_halo(padded, wrap=False)
+        assert padded[0].sum() == padded[-1].sum() == padded[:, 0].sum() == padded[:, -1].sum() == 0
+
+    def test_grid_buffers_are_reused(self) -> None:
+        stepper = PingPongStepper(random_grid(16, 16, seed=13), wrap=False)
+        a = stepper.step().base
+        stepper.step()
+        assert stepper.step().base is a
+
+    @pytest.mark.parametrize("rulestring", ["B3/S23", "B36/S23"])
+    def test_long_run_makes_no_per_generation_allocations(self, rulestring: str) -> None:
+        g = random_grid(128, 128, seed=14)
+        stepper = PingPongStepper(g, wrap=True, rule=parse_rule(rulestring))
+        stepper.step()
+        tracemalloc.start()
+        try:
+            base, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            stepper.run(1000)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # Only transient view objects, never a board-sized (16 KiB) array.
+        assert peak - base < 4096
+
+    def test_rejects_bad_grid(self) -> None:
+        with pytest.raises(GridShapeError):
+            PingPongStepper(np.zeros((3,), dtype=np.uint8), wrap=False)
@@ -0,0 +1,62 @@
+"""Tests for the headless CLI runner."""
+import csv
+import json
+
+import numpy as np
+import pytest
+
+from app import next_generation
+from cli import main
+
+
+class TestRunCommand:
+    def test_population_series_and_snapshots(self, tmp_path, capsys) -> None:
+        pop, snaps = tmp_path / "pop.csv", tmp_path / "snaps"
+        argv = ["run", "--preset", "Glider", "--rows", "10", "--cols", "10", "--generations", "8", "--wrap",
+                "--engine", "bitpacked", "--population", str(pop), "--snapshot-every", "4", "--snapshot-dir", str(snaps)]
+        assert main(argv) == 0
+        assert "gen/s" in capsys.readouterr().out
+        with pop.open() as fh:
+            rows = list(csv.reader(fh))
+        assert rows[0] == ["generation", "population"] and len(rows) == 10
+        assert all(int(p) == 5 for _, p in rows[1:])
+        assert sorted(f.name for f in snaps.iterdir()) == ["gen_000004.npy", "gen_000008.npy"]
+
+    def test_rle_file_with_header_rule(self, tmp_path) -> None:
+        rle = tmp_path / "glider.rle"
+        rle.write_text("x = 3, y = 3, rule = B3/S23\nbob$2bo$3o!\n")
+        snaps = tmp_path / "snaps"
+        argv = ["run", "--rle", str(rle), "--rows", "10", "--cols", "10", "--generations", "4",
+                "--snapshot-every", "4", "--snapshot-dir", str(snaps)]
+        assert main(argv) == 0
+        board = np.zeros((10, 10), dtype=np.uint8)
+        board[3:6, 3:6] = [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+        for _ in range(4):
+            board = next_generation(board, False)
+        np.testing.assert_array_equal(np.load(snaps / "gen_000004.npy"), board)
+
+    def test_errors_exit_with_status_2(self, capsys) -> None:
+        with pytest.raises(SystemExit) as exc:
+            main(["run", "--preset", "Pulsar", "--rows", "5", "--cols", "5"])
+        assert exc.value.code == 2
+        assert "too small" in capsys.readouterr().err
+
+
+class TestBenchCommand:
+    def test_writes_json_and_detects_regression(self, tmp_path) -> None:
+        out = tmp_path / "bench.json"
+        argv = ["bench", "--engines", "dense,buffered", "--sizes", "16", "--densities", "0.3",
+                "--generations", "2", "--repeat", "1"]
+        assert main(argv + ["--output", str(out)]) == 0
+        report = json.loads(out.read_text())
+        assert {r["engine"] for r in report["results"]} == {"dense", "buffered"}
+        assert "numpy" in report["environment"]
+
+        for r in report["results"]:
+            r["gens_per_sec"] *= 1e6
+        out.write_text(json.dumps(report))
+        assert main(argv + ["--baseline", str(out)]) == 1
+
+    def test_rejects_unknown_engine(self) -> None:
+        with pytest.raises(SystemExit):
+            main(["bench", "--engines", "dense,gpu"])
@@ -0,0 +1,63 @@
+"""Tests for board hashing and cycle detection."""
+import numpy as np
+import pytest
+
+from app import next_generation
+from engine.cycles import Cycle, CycleDetector, board_hash
+from engine.errors import EngineError
+from tests.fixtures import blank_grid, blinker_horizontal, glider_grid, grid_with_live_cell
+
+
+def _run_until_cycle(grid: np.ndarray, wrap: bool, detector: CycleDetector, limit: int = 200) -> Cycle | None:
+    for gen in range(limit):
+        cycle = detector.observe(grid, gen)
+        if cycle:
+            return cycle
+        grid = next_generation(grid, wrap)
+    return None
+
+
+class TestBoardHash:
+    def test_equal_boards_hash_equal(self) -> None:
+        assert board_hash(glider_grid()) == board_hash(glider_grid())
+
+    def test_single_cell_change_changes_hash(self) -> None:
+        assert board_hash(blank_grid(8, 8)) != board_hash(grid_with_live_cell(3, 3, 8, 8))
+
+    def test_shape_is_part_of_hash(self) -> None:
+        assert board_hash(blank_grid(4, 6)) != board_hash(blank_grid(6, 4))
+
+    def test_hash_is_compact(self) -> None:
+        assert len(board_hash(np.ones((500, 500), dtype=np.uint8))) == 16
+
+
+class TestCycleDetector:
+    def test_blinker_has_period_two(self) -> None:
+        cycle = _run_until_cycle(blinker_horizontal(), False, CycleDetector())
+        assert cycle == Cycle(start=0, period=2)
+
+    def test_dying_board_is_still_after_extinction(self) -> None:
+        cycle = _run_until_cycle(grid_with_live_cell(2, 2), False, CycleDetector())
+        assert cycle == Cycle(start=1, period=1)
+        assert cycle.still
+
+    def test_glider_on_torus_has_period_four_times_size(self) -> None:
+        cycle = _run_until_cycle(glider_grid(8, 8), True, CycleDetector(window=64))
+        assert cycle is not None and cycle.period == 32
+
+    def test_window_bounds_memory_and_misses_longer_periods(self) -> None:
+        detector = CycleDetector(window=16)
+        assert _run_until_cycle(glider_grid(8, 8), True, detector, limit=100) is None
+        assert len(detector) == 16
+
+    def test_result_is_sticky_until_reset(self) -> None:
+        detector = CycleDetector()
+        cycle = _run_until_cycle(blinker_horizontal(), False, detector)
+        assert detector.observe(glider_grid(), 99) == cycle
+        detector.reset()
+        assert detector.cycle is None
+        assert detector.observe(glider_grid(), 0) is None
+
+    def test_rejects_bad_window(self) -> None:
+        with pytest.raises(EngineError):
+            CycleDetector(window=0)
@@ -0,0 +1,118 @@
+"""Tests for the delta transport encoder/decoder and viewport levels."""
+import json
+
+import numpy as np
+import pytest
+
+from engine.dense import next_generation
+from engine.errors import EngineError
+from tests.fixtures import glider_grid, random_grid
+from ui.delta import DeltaDecoder, DeltaEncoder
+from ui.renderer import DEFAULT_PALETTE
+from ui.viewport import Viewport, block_reduce, shade_palette, viewport_levels
+
+SHADES = shade_palette(DEFAULT_PALETTE)
+
+
+def _levels(grid: np.ndarray) -> np.ndarray:
+    return viewport_levels(grid, Viewport(0, 0, *grid.shape))
+
+
+class TestViewportLevels:
+    def test_zoomed_in_is_one_level_per_cell(self) -> None:
+        grid = glider_grid()
+        np.testing.assert_array_equal(viewport_levels(grid, Viewport(0, 0, 10, 10, cell_px=8)), grid * 255)
+
+    def test_zoomed_out_matches_block_reduce(self) -> None:
+        grid = random_grid(64, 96, seed=1)
+        viewport = Viewport(0, 0, 64, 96, block=4)
+        np.testing.assert_array_equal(viewport_levels(grid, viewport), block_reduce(grid, 4))
+
+    def test_crops_to_window(self) -> None:
+        grid = random_grid(40, 40, seed=2)
+        levels = viewport_levels(grid, Viewport(5, 7, 10, 12, cell_px=4))
+        np.testing.assert_array_equal(levels, grid[5:15, 7:19] * 255)
+
+
+class TestDeltaEncoder:
+    def test_round_trip_over_many_generations(self) -> None:
+        grid = random_grid(60, 80, seed=3)
+        encoder, decoder = DeltaEncoder(), DeltaDecoder()
+        for _ in range(40):
+            # Messages must survive JSON, as they do on their way to the browser.
+            assert decoder.apply(json.loads(json.dumps(encoder.encode(_levels(grid), 4, SHADES))))
+            np.testing.assert_array_equal(decoder.levels, _levels(grid))
+            grid = next_generation(grid, True)
+        assert decoder.scale == 4
+        np.testing.assert_array_equal(decoder.palette, SHADES)
+
+    def test_first_message_is_key_then_small_deltas(self) -> None:
+        grid = np.zeros((256, 256), dtype=np.uint8)
+        grid[:10, :10] = glider_grid()
+        encoder = DeltaEncoder()
+        key = encoder.encode(_levels(grid), 2, SHADES)
+        delta = encoder.encode(_levels(next_generation(grid, False)), 2, SHADES)
+        assert key["type"] == "key" and delta["type"] == "delta"
+        assert delta["base"] == key["seq"] and delta["seq"] == key["seq"] + 1
+        assert len(json.dumps(delta)) < 200
+
+    def test_unchanged_frame_is_empty_delta(self) -> None:
+        encoder = DeltaEncoder()
+        levels = _levels(random_grid(30, 30, seed=4))
+        encoder.encode(levels, 1, SHADES)
+        message = encoder.encode(levels, 1, SHADES)
+        assert message["type"] == "delta" and message["starts"] == "" and message["values"] == ""
+
+    @pytest.mark.parametrize("change", ["shape", "scale", "palette"])
+    def test_layout_change_sends_key(self, change: str) -> None:
+        encoder = DeltaEncoder()
+        levels = _levels(glider_grid())
+        encoder.encode(levels, 4, SHADES)
+        if change == "shape":
+            message = encoder.encode(_levels(glider_grid(12, 10)), 4, SHADES)
+        elif change == "scale":
+            message = encoder.encode(levels, 8, SHADES)
+        else:
+            message = encoder.encode(levels, 4, SHADES[::-1])
+        assert message["type"] == "key"
+
+    def test_request_keyframe(self) -> None:
+        encoder = DeltaEncoder()
+        levels = _levels(glider_grid())
+        encoder.encode(levels, 4, SHADES)
+        encoder.request_keyframe()
+        assert encoder.encode(levels, 4, SHADES)["type"] == "key"
+
+    def test_large_change_falls_back_to_key(self) -> None:
+        encoder = DeltaEncoder()
+        encoder.encode(_levels(random_grid(128, 128, seed=5)), 1, SHADES)
+        # A random board replaced by a blank one: the key frame is a single run.
+        message = encoder.encode(np.zeros((128, 128), dtype=np.uint8), 1, SHADES)
+        assert message["type"] == "key"
+
+    def test_rejects_bad_input(self) -> None:
+        encoder = DeltaEncoder()
+        with pytest.raises(EngineError):
+            encoder.encode(np.zeros((4, 4), dtype=np.int32), 1, SHADES)
+        with pytest.raises(EngineError):
+            encoder.encode(np.zeros((4, 4), dtype=np.uint8), 0, SHADES)
+        with pytest.raises(EngineError):
+            encoder.encode(np.zeros((4, 4), dtype=np.uint8), 1, DEFAULT_PALETTE)
+
+
+class TestDeltaDecoder:
+    def test_rejects_delta_after_gap(self) -> None:
+        grid = random_grid(20, 20, seed=6)
+        encoder, decoder = DeltaEncoder(), DeltaDecoder()
+        decoder.apply(encoder.encode(_levels(grid), 1, SHADES))
+        encoder.encode(_levels(next_generation(grid, True)), 1, SHADES)  # lost on the way
+        grid = next_generation(next_generation(grid, True), True)
+        assert not decoder.apply(encoder.encode(_levels(grid), 1, SHADES))
+        encoder.request_keyframe()
+        assert decoder.apply(encoder.encode(_levels(grid), 1, SHADES))
+        np.testing.assert_array_equal(decoder.levels, _levels(grid))
+
+    def test_rejects_delta_before_key(self) -> None:
+        encoder = DeltaEncoder()
+        encoder.encode(_levels(glider_grid()), 1, SHADES)
+        assert not DeltaDecoder().apply(encoder.encode(_levels(glider_grid()), 1, SHADES))
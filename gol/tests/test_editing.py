@@ -0,0 +1,163 @@
+"""Tests for batched strokes, stamps and undo/redo diffs."""
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from engine.editing import (
+    EditError,
+    EditHistory,
+    Stamp,
+    Stroke,
+    apply_edits,
+    line_points,
+    load_stamp,
+    transform,
+)
+from engine.errors import GridShapeError
+from engine.presets import PRESETS
+from patterns.rle import write_rle
+from tests.fixtures import blank_grid, glider_grid, random_grid
+
+
+def _reference_stroke(grid: np.ndarray, points: list[tuple[int, int]], mode: str, brush: int, shape: str) -> np.ndarray:
+    out = grid.copy()
+    covered = np.zeros(grid.shape, dtype=bool)
+    rr, cc = np.indices(grid.shape)
+    for r, c in points:
+        if shape == "square":
+            covered |= (np.abs(rr - r) <= brush) & (np.abs(cc - c) <= brush)
+        else:
+            covered |= (rr - r) ** 2 + (cc - c) ** 2 <= (brush + 0.5) ** 2
+    if mode == "paint":
+        out[covered] = 1
+    elif mode == "erase":
+        out[covered] = 0
+    else:
+        out[covered] ^= 1
+    return out
+
+
+class TestStroke:
+    @pytest.mark.parametrize("mode", ["paint", "erase", "toggle"])
+    @pytest.mark.parametrize("shape", ["square", "round"])
+    @pytest.mark.parametrize("brush", [0, 1, 3])
+    def test_matches_reference(self, mode: str, shape: str, brush: int) -> None:
+        grid = random_grid(30, 40, seed=brush)
+        points = [(0, 0), (5, 7), (6, 8), (29, 39), (15, 20), (15, 21)]
+        expected = _reference_stroke(grid, points, mode, brush, shape)
+        apply_edits(grid, [Stroke(np.array(points), mode, brush, shape)])
+        np.testing.assert_array_equal(grid, expected)
+
+    def test_toggle_flips_overlapping_dabs_once(self) -> None:
+        grid = blank_grid(10, 10)
+        apply_edits(grid, [Stroke(np.array([[4, 4], [4, 5]]), "toggle", brush=1)])
+        assert grid.sum() == 12
+
+    def test_points_off_board_are_clipped(self) -> None:
+        grid = blank_grid(5, 5)
+        diff = apply_edits(grid, [Stroke(np.array([[-1, -1], [10, 10]]), brush=1)])
+        assert grid[0, 0] == 1 and grid.sum() == 1 and len(diff) == 1
+
+    def test_connected_stroke_fills_gaps(self) -> None:
+        grid = blank_grid(10, 10)
+        apply_edits(grid, [Stroke(np.array([[0, 0], [0, 9], [9, 9]]), connected=True)])
+        assert grid[0].all() and grid[:, 9].all() and grid.sum() == 19
+
+    def test_line_points_are_contiguous(self) -> None:
+        line = line_points(np.array([[0, 0], [3, 10], [-4, 2]]))
+        assert np.abs(np.diff(line, axis=0)).max() == 1
+        np.testing.assert_array_equal(line[[0, -1]], [[0, 0], [-4, 2]])
+
+    def test_rejects_bad_input(self) -> None:
+        with pytest.raises(EditError):
+            Stroke(np.array([[0, 0]]), mode="smudge")
+        with pytest.raises(EditError):
+            Stroke(np.array([[0, 0]]), shape="star")
+        with pytest.raises(EditError):
+            Stroke(np.array([[0.5, 1.0]]))
+        with pytest.raises(GridShapeError):
+            apply_edits(np.zeros((4, 4), dtype=np.int64), [])
+
+
+class TestStamp:
+    @pytest.mark.parametrize("rotate", [0, 1, 2, 3])
+    @pytest.mark.parametrize("flip", [False, True])
+    def test_transforms(self, rotate: int, flip: bool) -> None:
+        glider = PRESETS["Glider"]
+        grid = blank_grid(12, 12)
+        apply_edits(grid, [Stamp(glider, 4, 5, rotate=rotate, flip=flip)])
+        expected = np.rot90(glider[:, ::-1] if flip else glider, rotate)
+        np.testing.assert_array_equal(grid[4 : 4 + expected.shape[0], 5 : 5 + expected.shape[1]], expected)
+        assert grid.sum() == glider.sum()
+
+    def test_modes(self) -> None:
+        pattern = np.array([[1, 0], [0, 1]], dtype=np.uint8)
+        grid = np.ones((2, 2), dtype=np.uint8)
+        apply_edits(grid, [Stamp(pattern, 0, 0, mode="paste")])
+        np.testing.assert_array_equal(grid, pattern)
+        apply_edits(grid, [Stamp(pattern[::-1], 0, 0, mode="or")])
+        assert grid.all()
+        apply_edits(grid, [Stamp(pattern, 0, 0, mode="xor")])
+        np.testing.assert_array_equal(grid, pattern[::-1])
+
+    def test_clipped_at_edges(self) -> None:
+        grid = blank_grid(5, 5)
+        apply_edits(grid, [Stamp(np.ones((3, 3), dtype=np.uint8), -1, 3)])
+        assert grid.sum() == 4 and grid[:2, 3:].all()
+        assert not len(apply_edits(grid, [Stamp(np.ones((3, 3), dtype=np.uint8), 9, 9)]))
+
+    def test_load_stamp_sources(self, tmp_path: Path) -> None:
+        glider = PRESETS["Glider"]
+        path = tmp_path / "glider.rle"
+        write_rle(glider, path)
+        np.testing.assert_array_equal(load_stamp(path), glider)
+        np.testing.assert_array_equal(load_stamp("Glider"), glider)
+        with pytest.raises(EditError):
+            load_stamp("Random")
+
+    def test_transform_is_view(self) -> None:
+        cells = glider_grid()
+        assert np.shares_memory(transform(cells, 1, True), cells)
+
+
+class TestHistory:
+    def test_batch_is_one_undo_step(self) -> None:
+        grid = random_grid(40, 40, seed=9)
+        original = grid.copy()
+        history = EditHistory()
+        history.apply(grid, [Stroke(np.array([[3, 3], [30, 30]]), "toggle", 2), Stamp(PRESETS["Glider"], 10, 10)])
+        edited = grid.copy()
+        assert history.undo(grid) and not history.can_undo
+        np.testing.assert_array_equal(grid, original)
+        assert history.redo(grid) and not history.can_redo
+        np.testing.assert_array_equal(grid, edited)
+
+    def test_diff_is_compact(self) -> None:
+        grid = blank_grid(1000, 1000)
+        diff = EditHistory().apply(grid, [Stroke(np.array([[500, 500]]), brush=2)])
+        assert len(diff) == 25 and diff.nbytes == 100
+
+    def test_new_edit_clears_redo_and_noop_is_not_recorded(self) -> None:
+        grid = blank_grid(10, 10)
+        history = EditHistory()
+        history.apply(grid, [Stroke(np.array([[1, 1]]))])
+        history.undo(grid)
+        history.apply(grid, [Stroke(np.array([[2, 2]]))])
+        assert not history.can_redo
+        history.apply(grid, [Stroke(np.array([[2, 2]]))])
+        assert history.undo(grid) and not history.can_undo
+
+    def test_limit_drops_oldest(self) -> None:
+        grid = blank_grid(10, 10)
+        history = EditHistory(limit=2)
+        for c in range(3):
+            history.apply(grid, [Stroke(np.array([[0, c]]))])
+        assert history.undo(grid) and history.undo(grid) and not history.undo(grid)
+        assert grid[0, 0] == 1 and grid.sum() == 1
+
+    def test_diff_rejects_other_shape(self) -> None:
+        history = EditHistory()
+        history.apply(blank_grid(5, 5), [Stroke(np.array([[0, 0]]))])
+        with pytest.raises(EditError):
+            history.undo(blank_grid(6, 6))
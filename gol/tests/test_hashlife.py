@@ -0,0 +1,87 @@
+"""Tests for the HashLife engine (unbounded plane, long-horizon jumps)."""
+import numpy as np
+import pytest
+
+from app import next_generation
+from engine.errors import EngineError, GridShapeError
+from engine.hashlife import HashLife, hashlife_advance
+from tests.fixtures import (
+    blinker_horizontal,
+    glider_grid,
+    gosper_gun_pattern,
+    lwss_pattern,
+    random_grid,
+)
+
+
+def _dense_on_plane(grid: np.ndarray, generations: int) -> np.ndarray:
+    """Reference: dense no-wrap run on a board padded beyond light-speed reach."""
+    pad = generations + 2
+    big = np.zeros((grid.shape[0] + 2 * pad, grid.shape[1] + 2 * pad), dtype=np.uint8)
+    big[pad:-pad, pad:-pad] = grid
+    for _ in range(generations):
+        big = next_generation(big, wrap=False)
+    return big[pad:-pad, pad:-pad]
+
+
+class TestHashLifeParity:
+    @pytest.mark.parametrize("generations", [0, 1, 2, 3, 7, 16, 37])
+    def test_random_soup_matches_dense(self, generations: int) -> None:
+        soup = np.zeros((40, 40), dtype=np.uint8)
+        soup[12:28, 12:28] = random_grid(16, 16, density=0.4, seed=generations)
+        np.testing.assert_array_equal(hashlife_advance(soup, generations), _dense_on_plane(soup, generations))
+
+    def test_blinker_period_two(self) -> None:
+        g = blinker_horizontal(5, 5)
+        np.testing.assert_array_equal(hashlife_advance(g, 1), next_generation(g, wrap=False))
+        np.testing.assert_array_equal(hashlife_advance(g, 1000), g)
+
+    def test_glider_leaves_board_window(self) -> None:
+        g = glider_grid(10, 10)
+        assert hashlife_advance(g, 200).sum() == 0
+
+    def test_gosper_gun_matches_dense(self) -> None:
+        grid = np.zeros((40, 60), dtype=np.uint8)
+        grid[15:24, 12:48] = gosper_gun_pattern()
+        np.testing.assert_array_equal(hashlife_advance(grid, 90), _dense_on_plane(grid, 90))
+
+
+class TestHashLifeJumps:
+    def test_jump_advances_power_of_two(self) -> None:
+        life = HashLife.from_array(glider_grid(8, 8))
+        life.jump(10)
+        assert life.generation == 1024
+        assert life.population == 5
+
+    def test_gun_generation_one_million(self) -> None:
+        life = HashLife.from_array(gosper_gun_pattern())
+        life.advance(1_000_000)
+        # One glider (5 cells) per 30 generations on top of the gun's own cells.
+        assert life.generation == 1_000_000
+        assert abs(life.population - 5 * (1_000_000 // 30)) < 100
+
+    def test_lwss_translates_by_half_speed(self) -> None:
+        lwss = lwss_pattern()
+        life = HashLife.from_array(lwss)
+        life.advance(4096)
+        window = life.to_array(0, -2048, lwss.shape[0], lwss.shape[1])
+        np.testing.assert_array_equal(window, lwss)
+
+    def test_eviction_keeps_results_correct(self) -> None:
+        soup = np.zeros((48, 48), dtype=np.uint8)
+        soup[16:32, 16:32] = random_grid(16, 16, density=0.5, seed=3)
+        life = HashLife.from_array(soup, max_nodes=500)
+        for _ in range(4):
+            life.advance(8)
+        np.testing.assert_array_equal(life.to_array(0, 0, 48, 48), _dense_on_plane(soup, 32))
+        assert life.node_count < 5_000
+
+
+class TestHashLifeValidation:
+    def test_rejects_bad_grid(self) -> None:
+        with pytest.raises(GridShapeError):
+            HashLife.from_array(np.zeros((0, 3), dtype=np.uint8))
+
+    def test_rejects_negative_generations(self) -> None:
+        with pytest.raises(EngineError):
+            HashLife().advance(-1)
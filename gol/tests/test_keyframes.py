@@ -0,0 +1,151 @@
+"""Tests for the keyframe cache and worker fast-forwarding."""
+import time
+
+import numpy as np
+import pytest
+
+from app import next_generation
+from engine.errors import EngineError
+from engine.keyframes import KeyframeCache, cache_key
+from engine.metrics import MetricsRecorder
+from engine.rules import parse_rule
+from engine.runner import SimulationWorker
+from tests.fixtures import glider_grid, random_grid
+
+
+def _evolve(grid: np.ndarray, generations: int, wrap: bool) -> np.ndarray:
+    for _ in range(generations):
+        grid = next_generation(grid, wrap)
+    return grid
+
+
+class TestKeyframeCache:
+    def test_key_depends_on_board_rule_and_wrap(self) -> None:
+        g = glider_grid()
+        assert cache_key(g, None, True) == cache_key(g.astype(bool), parse_rule("B3/S23"), True)
+        assert cache_key(g, None, True) != cache_key(g, None, False)
+        assert cache_key(g, None, True) != cache_key(g, parse_rule("B36/S23"), True)
+        assert cache_key(g, None, True) != cache_key(glider_grid(10, 11), None, True)
+
+    def test_stores_only_keyframes(self) -> None:
+        cache = KeyframeCache(interval=8)
+        key = cache_key(glider_grid(), None, True)
+        for generation in range(0, 20):
+            cache.store(key, generation, glider_grid())
+        assert len(cache) == 2 and cache.nbytes == 2 * 13
+
+    def test_nearest(self) -> None:
+        cache = KeyframeCache(interval=8)
+        key = cache_key(glider_grid(), None, True)
+        boards = {g: random_grid(10, 10, seed=g) for g in (8, 16, 24)}
+        for g, board in boards.items():
+            cache.store(key, g, board)
+        found, board = cache.nearest(key, 23)
+        assert found == 16
+        np.testing.assert_array_equal(board, boards[16])
+        assert cache.nearest(key, 23, after=16) is None
+        assert cache.nearest(cache_key(random_grid(10, 10), None, True), 100) is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = KeyframeCache(max_bytes=3 * 13, interval=1)
+        key = cache_key(glider_grid(), None, True)
+        for g in (1, 2, 3):
+            cache.store(key, g, glider_grid())
+        cache.nearest(key, 1)
+        cache.store(key, 4, glider_grid())
+        assert len(cache) == 3 and cache.nbytes == 3 * 13
+        assert cache.nearest(key, 2, after=1) is None
+        assert cache.nearest(key, 1)[0] == 1
+
+    def test_rejects_bad_limits(self) -> None:
+        with pytest.raises(EngineError):
+            KeyframeCache(max_bytes=0)
+        with pytest.raises(EngineError):
+            KeyframeCache(interval=0)
+
+
+class TestWorkerFastForward:
+    def test_second_run_jumps_and_matches_dense(self) -> None:
+        cache = KeyframeCache(interval=16)
+        g = random_grid(48, 48, density=0.35, seed=11)
+        first = SimulationWorker(g, False, keyframes=cache)
+        try:
+            first.step(100)
+        finally:
+            first.close()
+        assert len(cache) == 6
+        second = SimulationWorker(g, False, keyframes=cache)
+        try:
+            frame = second.step(90)
+        finally:
+            second.close()
+        assert cache.hits == 1 and frame.generation == 90
+        np.testing.assert_array_equal(frame.grid, _evolve(g, 90, False))
+
+    def test_short_steps_replay_through_keyframes(self) -> None:
+        cache = KeyframeCache(interval=16)
+        g = random_grid(32, 32, seed=12)
+        worker = SimulationWorker(g, True, keyframes=cache)
+        try:
+            worker.step(40)
+            worker.update(lambda board: g.copy(), generation=0)
+            for _ in range(5):
+                frame = worker.step(8)
+            assert cache.hits == 2 and frame.generation == 40
+            np.testing.assert_array_equal(frame.grid, _evolve(g, 40, True))
+        finally:
+            worker.close()
+
+    def test_other_runs_do_not_jump(self) -> None:
+        cache = KeyframeCache(interval=16)
+        g = random_grid(32, 32, seed=12)
+        worker = SimulationWorker(g, True, keyframes=cache)
+        try:
+            worker.step(40)
+            worker.configure(rule=parse_rule("B36/S23"))
+            worker.step(40)
+            assert cache.hits == 0 and len(cache) == 4
+        finally:
+            worker.close()
+
+    def test_play_after_reset_reuses_keyframes(self) -> None:
+        cache = KeyframeCache(interval=16)
+        metrics = MetricsRecorder()
+        g = random_grid(32, 32, density=0.35, seed=14)
+        worker = SimulationWorker(g, True, rate=None, metrics=metrics, keyframes=cache)
+        try:
+            worker.step(100)
+            worker.update(lambda board: g.copy(), generation=0)
+            worker.play()
+            deadline = time.monotonic() + 5.0
+            while worker.snapshot().generation < 64:
+                assert time.monotonic() < deadline, "play did not reach generation 64"
+                time.sleep(0.005)
+            worker.pause()
+            frame = worker.snapshot()
+        finally:
+            worker.close()
+        # Each keyframe passed was loaded from the cache, not stepped.
+        assert cache.hits >= 4 and metrics.total - 100 == frame.generation - cache.hits
+        np.testing.assert_array_equal(frame.grid, _evolve(g, frame.generation, True))
+
+    def test_edits_start_a_new_run(self) -> None:
+        cache = KeyframeCache(interval=16)
+        g = random_grid(32, 32, seed=13)
+        worker = SimulationWorker(g, True, keyframes=cache)
+        try:
+            middle = worker.step(32).grid
+            worker.update(lambda board: board)
+            worker.step(32)
+            assert cache.hits == 0 and len(cache) == 4
+        finally:
+            worker.close()
+        # The edited board's run is cached under that board.
+        restart = SimulationWorker(middle, True, keyframes=cache)
+        try:
+            frame = restart.step(32)
+        finally:
+            restart.close()
+        assert cache.hits == 1
+        np.testing.assert_array_equal(frame.grid, _evolve(g, 64, True))
@@ -0,0 +1,69 @@
+"""Tests for the Life 1.06 reader and writer."""
+import io
+
+import numpy as np
+import pytest
+
+from engine.bitpacked import pack_grid
+from patterns.errors import PatternError
+from patterns.life106 import format_life106, parse_life106, read_life106_coords, read_life106_packed, write_life106
+from tests.fixtures import random_grid
+
+GLIDER_106 = "#Life 1.06\n#D Glider\n0 -1\n1 0\n-1 1\n0 1\n1 1\n"
+
+
+class TestParseLife106:
+    def test_glider_with_negative_coordinates(self) -> None:
+        p = parse_life106(GLIDER_106)
+        assert p.cells.tolist() == [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+        assert (p.row0, p.col0) == (-1, -1)
+        assert p.name == "Glider" and p.comments == ("Glider",)
+
+    def test_duplicate_cells_and_extra_whitespace(self) -> None:
+        p = parse_life106("#Life 1.06\n  3   4\r\n3 4\n+5 4\n")
+        assert p.cells.tolist() == [[1, 0, 1]]
+        assert (p.row0, p.col0) == (4, 3)
+
+    def test_empty_pattern(self) -> None:
+        p = parse_life106("#Life 1.06\n")
+        assert p.cells.shape == (1, 1) and p.cells.sum() == 0
+
+    @pytest.mark.parametrize(
+        "text",
+        ["0 0\n", "#Life 1.06\n1 2 3\n", "#Life 1.06\n1 x\n", "#Life 1.06\n1-2 3\n", "#Life 1.06\n0 0\n#D late\n"],
+    )
+    def test_rejects_malformed(self, text: str) -> None:
+        with pytest.raises(PatternError):
+            parse_life106(text)
+
+    @pytest.mark.parametrize("chunk_bytes", [1, 4, 1 << 20])
+    def test_chunked_read(self, chunk_bytes: int) -> None:
+        rows, cols, _ = read_life106_coords(io.BytesIO(GLIDER_106.encode()), chunk_bytes=chunk_bytes)
+        assert sorted(zip(rows.tolist(), cols.tolist())) == [(-1, 0), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+class TestWriteLife106:
+    def test_round_trip_keeps_offset(self) -> None:
+        grid = random_grid(30, 80, seed=6)
+        grid[0, 0] = grid[-1, -1] = 1
+        p = parse_life106(format_life106(grid, row0=-12, col0=7, comments=("soup",)))
+        np.testing.assert_array_equal(p.cells, grid)
+        assert (p.row0, p.col0, p.comments) == (-12, 7, ("soup",))
+
+    def test_large_sparse_round_trip_through_string_io(self) -> None:
+        grid = random_grid(3000, 2000, density=0.01, seed=8)
+        grid[0, 0] = grid[-1, -1] = 1
+        out = io.StringIO()
+        write_life106(grid, out, row0=-5000, col0=3)
+        text = out.getvalue()
+        assert text.count("\n") == 1 + int(grid.sum())
+        p = parse_life106(text)
+        np.testing.assert_array_equal(p.cells, grid)
+        assert (p.row0, p.col0) == (-5000, 3)
+
+    def test_packed_matches_pack_of_grid(self, tmp_path) -> None:
+        grid = random_grid(5, 100, seed=2)
+        grid[0, 0] = grid[-1, -1] = 1
+        path = tmp_path / "soup.lif"
+        write_life106(grid, path)
+        np.testing.assert_array_equal(read_life106_packed(path).words, pack_grid(grid))
@@ -0,0 +1,98 @@
+"""Tests for per-generation metrics and their JSON-lines output."""
+import json
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from app import next_generation
+from cli import main
+from engine.errors import EngineError
+from engine.metrics import GenerationStats, InstrumentedStepper, MetricsRecorder, measure_step
+from engine.registry import ENGINES, make_stepper
+from engine.runner import SimulationWorker
+from tests.fixtures import blinker_horizontal, glider_grid, random_grid
+
+
+class TestMeasureStep:
+    def test_blinker_births_deaths_and_box(self) -> None:
+        prev = blinker_horizontal()
+        new = next_generation(prev, False)
+        stats = measure_step(prev, new, 1, 0.001)
+        assert (stats.population, stats.births, stats.deaths) == (3, 2, 2)
+        assert (stats.row0, stats.col0, stats.rows, stats.cols) == (1, 2, 3, 1)
+
+    def test_empty_board_has_empty_box(self) -> None:
+        g = np.zeros((4, 4), dtype=np.uint8)
+        stats = measure_step(g, g, 1, 0.0)
+        assert (stats.population, stats.rows, stats.cols) == (0, 0, 0)
+
+
+class TestMetricsRecorder:
+    def test_ring_keeps_newest_in_order(self) -> None:
+        rec = MetricsRecorder(capacity=4)
+        for gen in range(1, 11):
+            rec.record(GenerationStats(gen, 0.001 * gen, gen, 0, 0))
+        assert len(rec) == 4 and rec.total == 10
+        assert rec.to_array()["generation"].tolist() == [7, 8, 9, 10]
+        assert rec.latest() == GenerationStats(10, 0.01, 10, 0, 0)
+        assert rec.summary()["max_seconds"] == pytest.approx(0.01)
+
+    def test_rejects_bad_capacity(self) -> None:
+        with pytest.raises(EngineError):
+            MetricsRecorder(capacity=0)
+
+
+class TestInstrumentedStepper:
+    @pytest.mark.parametrize("engine", list(ENGINES))
+    def test_counts_match_dense_for_every_engine(self, engine: str) -> None:
+        g = random_grid(24, 70, seed=3)
+        rec = MetricsRecorder()
+        stepper = InstrumentedStepper(make_stepper(engine, g, True), rec, generation=10)
+        try:
+            stepper.run(5)
+        finally:
+            stepper.close()
+        expected, prev = [], g
+        for _ in range(5):
+            new = next_generation(prev, True)
+            expected.append((int(new.sum()), int(((new == 1) & (prev == 0)).sum()), int(((new == 0) & (prev == 1)).sum())))
+            prev = new
+        data = rec.to_array()
+        assert data["generation"].tolist() == [11, 12, 13, 14, 15]
+        assert list(zip(data["population"].tolist(), data["births"].tolist(), data["deaths"].tolist())) == expected
+        assert (data["seconds"] > 0).all() and (data["alloc_peak_bytes"] == -1).all()
+
+    def test_records_allocations_while_tracing(self) -> None:
+        rec = MetricsRecorder()
+        stepper = InstrumentedStepper(make_stepper("dense", random_grid(64, 64), True), rec)
+        tracemalloc.start()
+        try:
+            stepper.step()
+        finally:
+            tracemalloc.stop()
+        assert rec.latest().alloc_peak_bytes > 64 * 64
+
+    def test_worker_records_every_generation(self) -> None:
+        rec = MetricsRecorder()
+        worker = SimulationWorker(glider_grid(16, 16), True, metrics=rec)
+        try:
+            worker.step(3)
+            worker.update(lambda board: board, generation=100)
+            worker.step(2)
+        finally:
+            worker.close()
+        assert rec.to_array()["generation"].tolist() == [1, 2, 3, 101, 102]
+        assert (rec.to_array()["population"] == 5).all()
+
+
+class TestMetricsJsonLines:
+    def test_cli_writes_one_line_per_logged_generation(self, tmp_path, capsys) -> None:
+        path = tmp_path / "metrics.jsonl"
+        argv = ["run", "--preset", "Glider", "--rows", "12", "--cols", "12", "--generations", "6", "--wrap",
+                "--metrics", str(path), "--metrics-every", "2"]
+        assert main(argv) == 0
+        assert "p95" in capsys.readouterr().out
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["generation"] for line in lines] == [2, 4, 6]
+        assert all(line["message"] == "generation_stats" and line["population"] == 5 for line in lines)
@@ -0,0 +1,48 @@
+"""Tests for the multi-core banded stepper."""
+import numpy as np
+import pytest
+
+from app import next_generation
+from engine.errors import EngineError, GridShapeError
+from engine.parallel import ParallelStepper
+from tests.fixtures import glider_grid, random_grid
+
+
+class TestParallelParity:
+    @pytest.mark.parametrize("wrap", [False, True])
+    @pytest.mark.parametrize("shape,bands", [((40, 40), 4), ((37, 23), 5), ((3, 9), 3), ((1, 6), 4), ((9, 1), 2)])
+    def test_random_soup_matches_dense(self, shape: tuple[int, int], bands: int, wrap: bool) -> None:
+        g = random_grid(*shape, density=0.4, seed=shape[0] * shape[1])
+        expected = g
+        with ParallelStepper(g, wrap, workers=2, bands=bands) as stepper:
+            for _ in range(20):
+                expected = next_generation(expected, wrap)
+                np.testing.assert_array_equal(stepper.step(), expected)
+            assert stepper.generation == 20
+
+    @pytest.mark.parametrize("wrap", [False, True])
+    def test_glider_crosses_band_halos(self, wrap: bool) -> None:
+        g = np.zeros((20, 20), dtype=np.uint8)
+        g[10:20, 10:20] = glider_grid(10, 10)
+        expected = g
+        for _ in range(50):
+            expected = next_generation(expected, wrap)
+        with ParallelStepper(g, wrap, workers=3, bands=6) as stepper:
+            np.testing.assert_array_equal(stepper.run(50), expected)
+
+    def test_input_grid_is_not_mutated(self) -> None:
+        g = random_grid(16, 16, seed=4)
+        before = g.copy()
+        with ParallelStepper(g, wrap=False, workers=2) as stepper:
+            stepper.run(3)
+        np.testing.assert_array_equal(g, before)
+
+
+class TestParallelValidation:
+    def test_rejects_bad_grid(self) -> None:
+        with pytest.raises(GridShapeError):
+            ParallelStepper(np.zeros((0, 4), dtype=np.uint8), wrap=False)
+
+    def test_rejects_non_positive_workers(self) -> None:
+        with pytest.raises(EngineError):
+            ParallelStepper(random_grid(4, 4), wrap=False, workers=0)
@@ -0,0 +1,87 @@
+"""Tests for the lazy pattern library and the presets built on it."""
+import numpy as np
+import pytest
+
+from engine.dense import next_generation
+from engine.presets import PRESETS, PresetMapping, build_initial_grid
+from patterns.errors import PatternError
+from patterns.formats import read_pattern, write_pattern
+from patterns.library import PatternLibrary
+from tests.fixtures import gosper_gun_pattern, lwss_pattern
+
+
+class TestPatternLibrary:
+    def test_names_from_header_or_file_name(self, tmp_path) -> None:
+        (tmp_path / "glider.rle").write_text("#N Glider\nx = 3, y = 3\nbo$2bo$3o!\n")
+        (tmp_path / "big_block.lif").write_text("#Life 1.06\n0 0\n0 1\n1 0\n1 1\n")
+        (tmp_path / "notes.txt").write_text("not a pattern")
+        library = PatternLibrary(tmp_path)
+        assert sorted(library) == ["Big Block", "Glider"]
+        assert library["Big Block"].sum() == 4
+
+    def test_loads_on_first_access_and_caches(self, tmp_path) -> None:
+        path = tmp_path / "dot.rle"
+        path.write_text("x = 1, y = 1\no!\n")
+        library = PatternLibrary(tmp_path)
+        assert list(library) == ["Dot"]
+        first = library["Dot"]
+        path.write_text("x = 2, y = 1\n2o!\n")
+        assert library["Dot"] is first
+        assert not first.flags.writeable
+
+    def test_broken_file_fails_on_load_only(self, tmp_path) -> None:
+        (tmp_path / "bad.rle").write_text("x = 1, y = 1\no?!\n")
+        library = PatternLibrary(tmp_path)
+        assert "Bad" in library
+        with pytest.raises(PatternError):
+            library["Bad"]
+
+    def test_missing_name_raises_key_error(self, tmp_path) -> None:
+        with pytest.raises(KeyError):
+            PatternLibrary(tmp_path)["Glider"]
+
+
+class TestFormats:
+    @pytest.mark.parametrize("suffix", [".rle", ".lif"])
+    def test_write_then_read(self, tmp_path, suffix: str) -> None:
+        path = tmp_path / f"gun{suffix}"
+        write_pattern(gosper_gun_pattern(), path, rule="B3/S23", name="Gun")
+        p = read_pattern(path)
+        np.testing.assert_array_equal(p.cells, gosper_gun_pattern())
+        assert p.name == "Gun"
+
+    def test_sniffs_life106_without_suffix(self, tmp_path) -> None:
+        path = tmp_path / "pattern.txt"
+        path.write_text("#Life 1.06\n0 0\n")
+        assert read_pattern(path).cells.tolist() == [[1]]
+
+    def test_unknown_suffix_on_write(self, tmp_path) -> None:
+        with pytest.raises(PatternError):
+            write_pattern(np.ones((1, 1), dtype=np.uint8), tmp_path / "x.png")
+
+
+class TestBundledPresets:
+    def test_special_presets_come_first(self) -> None:
+        assert list(PRESETS)[:2] == ["Blank", "Random"]
+        assert {"Glider", "Lightweight Spaceship", "Gosper Glider Gun", "Pulsar"} <= set(PRESETS)
+
+    def test_menu_order_does_not_follow_file_names(self) -> None:
+        assert list(PRESETS) == ["Blank", "Random", "Glider", "Lightweight Spaceship", "Gosper Glider Gun", "Pulsar"]
+        assert len(PRESETS) == 6
+
+    def test_unlisted_patterns_follow_the_listed_ones(self, tmp_path) -> None:
+        (tmp_path / "a_dot.rle").write_text("x = 1, y = 1\no!\n")
+        (tmp_path / "glider.rle").write_text("#N Glider\nx = 3, y = 3\nbo$2bo$3o!\n")
+        assert list(PresetMapping(PatternLibrary(tmp_path))) == ["Blank", "Random", "Glider", "A Dot"]
+
+    def test_presets_match_fixtures(self) -> None:
+        np.testing.assert_array_equal(PRESETS["Lightweight Spaceship"], lwss_pattern())
+        np.testing.assert_array_equal(PRESETS["Gosper Glider Gun"], gosper_gun_pattern())
+
+    def test_pulsar_has_period_three(self) -> None:
+        grid, err = build_initial_grid(17, 17, "Pulsar")
+        assert err is None
+        out = grid
+        for _ in range(3):
+            out = next_generation(out, False)
+        np.testing.assert_array_equal(out, grid)
@@ -0,0 +1,59 @@
+"""Tests for the incremental frame renderer."""
+import numpy as np
+import pytest
+
+from engine.errors import EngineError, GridShapeError
+from tests.fixtures import blank_grid, glider_grid, grid_with_live_cell, random_grid
+from ui.renderer import DEFAULT_PALETTE, FrameRenderer
+
+
+def _rgb(img) -> np.ndarray:
+    return np.asarray(img.convert("RGB"))
+
+
+def _reference(grid: np.ndarray, cell_size: int) -> np.ndarray:
+    expanded = np.repeat(np.repeat(grid, cell_size, axis=0), cell_size, axis=1)
+    return np.where(expanded[:, :, None], DEFAULT_PALETTE[1], DEFAULT_PALETTE[0]).astype(np.uint8)
+
+
+class TestFrameRenderer:
+    def test_first_frame_matches_reference(self) -> None:
+        g = random_grid(7, 9, seed=1)
+        img = FrameRenderer(4).render(g)
+        assert img.size == (36, 28) and img.mode == "P"
+        np.testing.assert_array_equal(_rgb(img), _reference(g, 4))
+
+    def test_incremental_frames_match_reference(self) -> None:
+        renderer = FrameRenderer(3)
+        for seed in range(5):
+            g = random_grid(12, 12, density=0.1 * seed, seed=seed)
+            np.testing.assert_array_equal(_rgb(renderer.render(g)), _reference(g, 3))
+
+    def test_only_changed_cells_are_repainted(self) -> None:
+        renderer = FrameRenderer(5)
+        renderer.render(blank_grid(20, 20))
+        assert renderer.last_repainted == 400
+        renderer.render(grid_with_live_cell(3, 4, 20, 20))
+        assert renderer.last_repainted == 1
+        renderer.render(grid_with_live_cell(3, 4, 20, 20))
+        assert renderer.last_repainted == 0
+
+    def test_shape_change_reallocates(self) -> None:
+        renderer = FrameRenderer(2)
+        renderer.render(glider_grid(10, 10))
+        img = renderer.render(glider_grid(6, 8))
+        assert img.size == (16, 12)
+        np.testing.assert_array_equal(_rgb(img), _reference(glider_grid(6, 8), 2))
+
+    def test_custom_palette(self) -> None:
+        palette = np.array([[0, 0, 0], [0, 255, 0]], dtype=np.uint8)
+        img = FrameRenderer(1, palette).render(grid_with_live_cell(0, 1, 1, 2))
+        assert _rgb(img).tolist() == [[[0, 0, 0], [0, 255, 0]]]
+
+    def test_rejects_bad_input(self) -> None:
+        with pytest.raises(EngineError):
+            FrameRenderer(0)
+        with pytest.raises(EngineError):
+            FrameRenderer(2, np.zeros((3, 3), dtype=np.uint8))
+        with pytest.raises(GridShapeError):
+            FrameRenderer(2).render(np.zeros(4, dtype=np.uint8))
@@ -0,0 +1,102 @@
+"""Tests for the RLE pattern reader and writer."""
+import io
+
+import numpy as np
+import pytest
+
+from patterns.errors import PatternError
+from engine.bitpacked import pack_grid
+from patterns.rle import format_rle, iter_rle_runs, parse_rle, read_rle, read_rle_header, read_rle_packed, write_rle
+from tests.fixtures import gosper_gun_pattern, random_grid
+
+GLIDER_RLE = "#N Glider\n#C a comment\nx = 3, y = 3, rule = B3/S23\nbob$2bo$3o!\n"
+
+GUN_RLE = """#N Gosper glider gun
+x = 36, y = 9, rule = B3/S23
+24bo$22bobo$12b2o6b2o12b2o$11bo3bo4b2o12b2o$2o8bo5bo3b2o$2o8bo3bob2o4b
+obo$10bo5bo7bo$11bo3bo$12b2o!
+"""
+
+
+class TestParseRle:
+    def test_glider(self) -> None:
+        p = parse_rle(GLIDER_RLE)
+        assert p.name == "Glider" and p.rule == "B3/S23"
+        assert p.cells.tolist() == [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+
+    def test_multiline_body_matches_fixture(self) -> None:
+        np.testing.assert_array_equal(parse_rle(GUN_RLE).cells, gosper_gun_pattern())
+
+    def test_header_without_rule_and_trailing_blank_rows(self) -> None:
+        p = parse_rle("x = 2, y = 3\n2o2$bo!")
+        assert p.rule is None
+        assert p.cells.tolist() == [[1, 1], [0, 0], [0, 1]]
+
+    def test_ignores_text_after_bang(self) -> None:
+        assert parse_rle("x = 1, y = 1\no! trailing notes").cells.tolist() == [[1]]
+
+    @pytest.mark.parametrize(
+        "text",
+        ["bo$ob!", "x = 2, y = 1\n3o!", "x = 2, y = 1\no?o!", "#N only a comment"],
+    )
+    def test_rejects_malformed(self, text: str) -> None:
+        with pytest.raises(PatternError):
+            parse_rle(text)
+
+    def test_read_rle(self, tmp_path) -> None:
+        path = tmp_path / "glider.rle"
+        path.write_text(GLIDER_RLE)
+        assert read_rle(path).cells.sum() == 5
+
+
+class TestStreaming:
+    @pytest.mark.parametrize("chunk_bytes", [1, 2, 3, 7, 64])
+    def test_chunk_boundaries_do_not_change_result(self, chunk_bytes: int) -> None:
+        stream = io.BytesIO(GUN_RLE.encode())
+        header = read_rle_header(stream)
+        grid = np.zeros((header.rows, header.cols), dtype=np.uint8)
+        for rows, cols, lengths in iter_rle_runs(stream, chunk_bytes=chunk_bytes):
+            for r, c, n in zip(rows, cols, lengths):
+                grid[r, c : c + n] = 1
+        np.testing.assert_array_equal(grid, gosper_gun_pattern())
+
+    def test_packed_matches_pack_of_grid(self) -> None:
+        grid = random_grid(9, 130, seed=4)
+        packed = read_rle_packed(io.BytesIO(format_rle(grid).encode()))
+        assert packed.cols == 130
+        np.testing.assert_array_equal(packed.words, pack_grid(grid))
+
+    def test_rejects_cells_outside_header_box(self) -> None:
+        with pytest.raises(PatternError):
+            parse_rle("x = 2, y = 1\n2b3o!")
+
+    def test_rejects_truncated_count(self) -> None:
+        with pytest.raises(PatternError):
+            parse_rle("x = 3, y = 1\n3")
+
+
+class TestWriteRle:
+    @pytest.mark.parametrize("shape", [(1, 1), (9, 36), (40, 150)])
+    def test_round_trip(self, shape: tuple[int, int]) -> None:
+        grid = random_grid(*shape, density=0.4, seed=sum(shape))
+        p = parse_rle(format_rle(grid, rule="B36/S23", name="Soup", comments=("seeded",)))
+        np.testing.assert_array_equal(p.cells, grid)
+        assert (p.rule, p.name, p.comments) == ("B36/S23", "Soup", ("seeded",))
+
+    def test_lines_stay_within_70_characters(self) -> None:
+        text = format_rle(random_grid(60, 200, density=0.5, seed=1))
+        assert max(len(line) for line in text.splitlines()) <= 70
+
+    def test_glider_body(self) -> None:
+        assert format_rle(parse_rle(GLIDER_RLE).cells).splitlines()[1] == "bo$2bo$3o!"
+
+    def test_omits_trailing_dead_cells_but_keeps_box(self) -> None:
+        grid = np.zeros((4, 6), dtype=np.uint8)
+        grid[1, 1] = 1
+        assert format_rle(grid) == "x = 6, y = 4\n$bo!\n"
+        np.testing.assert_array_equal(parse_rle(format_rle(grid)).cells, grid)
+
+    def test_write_to_path(self, tmp_path) -> None:
+        path = tmp_path / "gun.rle"
+        write_rle(gosper_gun_pattern(), path, rule="B3/S23")
+        np.testing.assert_array_equal(read_rle(path).cells, gosper_gun_pattern())
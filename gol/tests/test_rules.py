@@ -0,0 +1,129 @@
+"""Tests for B/S rule parsing and rule-aware engines."""
+import numpy as np
+import pytest
+
+from app import PRESETS, build_initial_grid, next_generation
+from engine.active import ActiveRegionStepper
+from engine.bitpacked import run_bitpacked
+from engine.hashlife import HashLife, hashlife_advance
+from engine.parallel import ParallelStepper
+from engine.rules import CONWAY, RULES, Rule, RuleError, apply_rule, parse_rule
+from tests.fixtures import random_grid
+
+HIGHLIFE = parse_rule("B36/S23")
+DAY_NIGHT = parse_rule("B3678/S34678")
+SEEDS = parse_rule("B2/S")
+B0_RULE = parse_rule("B0123/S8")
+
+
+class TestParseRule:
+    @pytest.mark.parametrize("text", ["B3/S23", "b3/s23", " B3 / S23 ", "S23/B3", "23/3"])
+    def test_conway_spellings(self, text: str) -> None:
+        assert parse_rule(text) == CONWAY
+
+    def test_highlife(self) -> None:
+        rule = parse_rule("B36/S23")
+        assert rule.birth == {3, 6} and rule.survival == {2, 3}
+        assert rule.rulestring == "B36/S23"
+        assert not rule.is_conway
+
+    def test_empty_survival(self) -> None:
+        assert parse_rule("B2/S").survival == frozenset()
+
+    @pytest.mark.parametrize("text", ["", "B9/S23", "Conway", "B3S23", "B3/S2/3"])
+    def test_invalid_raises(self, text: str) -> None:
+        with pytest.raises(RuleError):
+            parse_rule(text)
+
+    def test_named_rules_round_trip(self) -> None:
+        for name, rule in RULES.items():
+            assert rule.rulestring in name
+            assert parse_rule(rule.rulestring) == rule
+
+
+class TestLookupTable:
+    def test_table_shape_and_values(self) -> None:
+        table = HIGHLIFE.table
+        assert table.shape == (2, 9)
+        assert list(np.nonzero(table[0])[0]) == [3, 6]
+        assert list(np.nonzero(table[1])[0]) == [2, 3]
+
+    def test_table_is_read_only(self) -> None:
+        with pytest.raises(ValueError):
+            CONWAY.table[0, 0] = 1
+
+    def test_lookup_matches_conway_fast_path(self) -> None:
+        g = random_grid(30, 30, seed=7)
+        n = np.random.default_rng(1).integers(0, 9, size=g.shape).astype(np.uint8)
+        lut = Rule(birth=frozenset({3}), survival=frozenset({2, 3})).table.ravel()[g * 9 + n]
+        np.testing.assert_array_equal(apply_rule(g, n), lut)
+
+
+class TestNextGenerationWithRules:
+    def test_default_rule_is_conway(self) -> None:
+        g = random_grid(20, 20, seed=2)
+        np.testing.assert_array_equal(next_generation(g, False), next_generation(g, False, CONWAY))
+
+    def test_highlife_births_on_six(self) -> None:
+        g = np.zeros((5, 5), dtype=np.uint8)
+        g[1, 1:4], g[3, 1:4] = 1, 1  # centre (2, 2) has exactly 6 neighbors
+        assert next_generation(g, False)[2, 2] == 0
+        assert next_generation(g, False, HIGHLIFE)[2, 2] == 1
+
+    def test_seeds_kills_every_live_cell(self) -> None:
+        g = random_grid(16, 16, seed=3)
+        out = next_generation(g, True, SEEDS)
+        assert not (out & g).any()
+
+    def test_rules_work_with_presets(self) -> None:
+        for key in PRESETS:
+            grid, err = build_initial_grid(40, 40, key, rng=np.random.default_rng(0))
+            assert err is None
+            out = next_generation(grid, True, DAY_NIGHT)
+            assert out.shape == grid.shape and out.dtype == np.uint8
+
+
+RULE_CASES = [HIGHLIFE, DAY_NIGHT, SEEDS, B0_RULE]
+
+
+class TestEnginesFollowRule:
+    @pytest.mark.parametrize("wrap", [False, True])
+    @pytest.mark.parametrize("rule", RULE_CASES, ids=str)
+    def test_bitpacked(self, rule: Rule, wrap: bool) -> None:
+        g = random_grid(19, 70, seed=5)
+        expected = g
+        for _ in range(6):
+            expected = next_generation(expected, wrap, rule)
+        np.testing.assert_array_equal(run_bitpacked(g, wrap, 6, rule), expected)
+
+    @pytest.mark.parametrize("wrap", [False, True])
+    @pytest.mark.parametrize("rule", RULE_CASES, ids=str)
+    def test_active_region(self, rule: Rule, wrap: bool) -> None:
+        g = random_grid(29, 31, seed=6)
+        stepper = ActiveRegionStepper(g, wrap, tile=8, rule=rule)
+        expected = g
+        for _ in range(6):
+            expected = next_generation(expected, wrap, rule)
+            np.testing.assert_array_equal(stepper.step(), expected)
+
+    @pytest.mark.parametrize("wrap", [False, True])
+    @pytest.mark.parametrize("rule", RULE_CASES, ids=str)
+    def test_parallel(self, rule: Rule, wrap: bool) -> None:
+        g = random_grid(21, 17, seed=8)
+        expected = g
+        for _ in range(6):
+            expected = next_generation(expected, wrap, rule)
+        with ParallelStepper(g, wrap, workers=2, bands=3, rule=rule) as stepper:
+            np.testing.assert_array_equal(stepper.run(6), expected)
+
+    def test_hashlife_highlife(self) -> None:
+        soup = np.zeros((40, 40), dtype=np.uint8)
+        soup[14:26, 14:26] = random_grid(12, 12, density=0.5, seed=9)
+        expected = soup
+        for _ in range(10):
+            expected = next_generation(expected, False, HIGHLIFE)
+        np.testing.assert_array_equal(hashlife_advance(soup, 10, rule=HIGHLIFE), expected)
+
+    def test_hashlife_rejects_birth_on_zero(self) -> None:
+        with pytest.raises(RuleError):
+            HashLife(rule=B0_RULE)
@@ -0,0 +1,140 @@
+"""Tests for the background simulation worker."""
+import time
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from app import next_generation
+from engine.errors import EngineError
+from engine.rules import parse_rule
+from engine.runner import SimulationWorker
+from tests.fixtures import blinker_horizontal, glider_grid, random_grid
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def worker_factory():
+    workers = []
+
+    def make(*args, **kwargs) -> SimulationWorker:
+        workers.append(SimulationWorker(*args, **kwargs))
+        return workers[-1]
+
+    yield make
+    for w in workers:
+        w.close()
+
+
+class TestSimulationWorker:
+    def test_step_matches_dense(self, worker_factory) -> None:
+        g = random_grid(20, 30, seed=4)
+        worker = worker_factory(g, True)
+        frame = worker.step(6)
+        expected = g
+        for _ in range(6):
+            expected = next_generation(expected, True)
+        assert frame.generation == 6 and not frame.playing
+        np.testing.assert_array_equal(frame.grid, expected)
+
+    def test_unthrottled_play_outruns_redraws(self, worker_factory) -> None:
+        g = random_grid(64, 64, seed=7)
+        worker = worker_factory(g, True, rate=None)
+        worker.play()
+        _wait_for(lambda: worker.snapshot().generation >= 100)
+        worker.pause()
+        frame = worker.snapshot()
+        time.sleep(0.05)
+        assert worker.snapshot().generation == frame.generation
+        expected = g
+        for _ in range(frame.generation):
+            expected = next_generation(expected, True)
+        np.testing.assert_array_equal(frame.grid, expected)
+
+    def test_unthrottled_play_does_not_hold_off_edits(self, worker_factory) -> None:
+        worker = worker_factory(random_grid(512, 512, seed=3), True, rate=None)
+        worker.play()
+        _wait_for(lambda: worker.snapshot().generation >= 5)
+        waits = []
+        for _ in range(10):
+            start = time.perf_counter()
+            worker.update(lambda g: g)
+            waits.append(time.perf_counter() - start)
+            time.sleep(0.003)
+        start = time.perf_counter()
+        worker.pause()
+        waits.append(time.perf_counter() - start)
+        # A whole frame of stepping is FRAME_INTERVAL (~33 ms); a slice is a few ms.
+        assert sorted(waits)[len(waits) // 2] < 0.015
+
+    def test_rate_limits_generations(self, worker_factory) -> None:
+        worker = worker_factory(glider_grid(16, 16), True, rate=20.0)
+        worker.play()
+        time.sleep(0.5)
+        worker.pause()
+        assert 3 <= worker.snapshot().generation <= 15
+
+    def test_cycle_pauses_worker(self, worker_factory) -> None:
+        worker = worker_factory(blinker_horizontal(), False, rate=None)
+        worker.play()
+        _wait_for(lambda: not worker.snapshot().playing)
+        frame = worker.snapshot()
+        assert frame.cycle is not None and frame.cycle.period == 2
+
+    def test_known_cycle_does_not_stop_later_steps(self, worker_factory) -> None:
+        worker = worker_factory(blinker_horizontal(), False, rate=None)
+        assert worker.step(10).generation == 10
+        frame = worker.step(10)
+        assert frame.generation == 20 and frame.cycle is not None
+        worker.play()
+        _wait_for(lambda: worker.snapshot().generation >= 40)
+        assert worker.snapshot().playing
+
+    def test_update_and_configure_restart_detection(self, worker_factory) -> None:
+        worker = worker_factory(blinker_horizontal(), False)
+        worker.step(3)
+        assert worker.snapshot().cycle is not None
+        frame = worker.update(lambda board: np.zeros_like(board), generation=0)
+        assert frame.cycle is None and frame.generation == 0 and frame.grid.sum() == 0
+
+        worker.update(lambda board: glider_grid(*board.shape))
+        worker.configure(rule=parse_rule("B36/S23"), wrap=True)
+        assert worker.snapshot().cycle is None
+
+    def test_snapshot_is_a_copy(self, worker_factory) -> None:
+        worker = worker_factory(glider_grid(8, 8), True)
+        frame = worker.snapshot()
+        frame.grid[...] = 0
+        assert worker.step().grid.sum() == 5
+
+    def test_rejects_bad_rate(self, worker_factory) -> None:
+        with pytest.raises(EngineError):
+            worker_factory(glider_grid(8, 8), True, rate=0)
+        worker = worker_factory(glider_grid(8, 8), True)
+        with pytest.raises(EngineError):
+            worker.set_rate(-1)
+
+    def test_idle_worker_pauses_and_exits(self, worker_factory) -> None:
+        worker = worker_factory(glider_grid(16, 16), True, rate=None, idle_timeout=0.1)
+        worker.play()
+        _wait_for(lambda: not worker.playing)
+        worker._thread.join(timeout=5.0)
+        assert not worker._thread.is_alive()
+        generation = worker.snapshot().generation
+        worker.play()
+        _wait_for(lambda: worker.snapshot().generation > generation)
+        assert worker._thread.is_alive()
+        with pytest.raises(EngineError):
+            worker_factory(glider_grid(8, 8), True, idle_timeout=0)
+
+    def test_close_stops_thread(self) -> None:
+        worker = SimulationWorker(glider_grid(8, 8), True, rate=None)
+        worker.play()
+        worker.close()
+        assert not worker._thread.is_alive()
@@ -0,0 +1,79 @@
+"""Tests for the startup engine self-test and structured log fields."""
+import json
+import logging
+from pathlib import Path
+
+import numpy as np
+
+from common.logging import JsonFormatter
+from engine import registry
+from engine.registry import DenseStepper
+from engine.selftest import run_self_test
+
+
+class _BrokenStepper(DenseStepper):
+    def run(self, generations: int) -> np.ndarray:
+        return 1 - super().run(generations)
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lines: list[dict] = []
+        self.setFormatter(JsonFormatter())
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(json.loads(self.format(record)))
+
+
+def _logger() -> tuple[logging.Logger, _ListHandler]:
+    logger = logging.getLogger("tests.selftest")
+    logger.handlers.clear()
+    handler = _ListHandler()
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger, handler
+
+
+class TestSelfTest:
+    def test_all_engines_rules_and_modes_pass(self) -> None:
+        report = run_self_test()
+        assert report.passed, report.failures
+        names = {r.name for r in report.results}
+        for engine in registry.ENGINES:
+            assert f"{engine}/B36/S23/wrap" in names and f"{engine}/B36/S23/bounded" in names
+        assert "hashlife/B3/S23/plane" in names and "sparse/B3/S23/plane" in names and "batch/B2/S/wrap" in names
+
+    def test_broken_engine_is_reported_and_logged(self, monkeypatch) -> None:
+        monkeypatch.setitem(registry.ENGINES, "broken", _BrokenStepper)
+        logger, handler = _logger()
+        report = run_self_test(logger)
+        assert not report.passed
+        assert {f.name.split("/")[0] for f in report.failures} == {"broken"}
+        errors = [line for line in handler.lines if line["level"] == "ERROR"]
+        assert errors and errors[0]["message"] == "self_test_check_failed" and "cells differ" in errors[0]["detail"]
+        summary = handler.lines[-1]
+        assert summary["message"] == "self_test_finished" and summary["passed"] is False
+        assert summary["checks"] == len(report.results) and summary["seconds"] > 0
+
+
+    def test_crashing_engine_is_a_failed_check(self, monkeypatch) -> None:
+        def crash(*args: object) -> None:
+            raise IndexError("index 9 is out of bounds")
+
+        monkeypatch.setitem(registry.ENGINES, "crashing", crash)
+        logger, handler = _logger()
+        report = run_self_test(logger)
+        assert {f.name.split("/")[0] for f in report.failures} == {"crashing"}
+        assert report.failures[0].detail == "IndexError: index 9 is out of bounds"
+        crashed = [line for line in handler.lines if line["message"] == "self_test_check_crashed"]
+        assert len(crashed) == len(report.failures) and "IndexError" in crashed[0]["exception"]
+
+
+class TestJsonFields:
+    def test_fields_are_merged_without_overriding_core_keys(self) -> None:
+        record = logging.LogRecord("x", logging.INFO, __file__, 1, "hello", None, None)
+        record.fields = {"count": 3, "message": "ignored", "path": Path("a/b")}
+        out = json.loads(JsonFormatter().format(record))
+        assert out["message"] == "hello" and out["count"] == 3 and out["path"] == "a/b"
@@ -0,0 +1,85 @@
+"""Tests for the sparse coordinate-set engine (unbounded plane)."""
+import numpy as np
+import pytest
+
+from app import next_generation
+from engine.errors import EngineError, GridShapeError
+from engine.rules import RuleError, parse_rule
+from engine.sparse import LIMIT, SparseLife, sparse_advance
+from tests.fixtures import blinker_horizontal, glider_grid, gosper_gun_pattern, random_grid
+
+
+def _dense_on_plane(grid: np.ndarray, generations: int, rule=None) -> np.ndarray:
+    """Reference: dense no-wrap run on a board padded beyond light-speed reach."""
+    pad = generations + 2
+    big = np.pad(grid, pad)
+    for _ in range(generations):
+        big = next_generation(big, False, rule)
+    return big[pad:-pad, pad:-pad]
+
+
+class TestSparseParity:
+    @pytest.mark.parametrize("generations", [0, 1, 5, 30])
+    def test_random_soup_matches_dense(self, generations: int) -> None:
+        soup = np.pad(random_grid(20, 25, density=0.4, seed=generations), 10)
+        np.testing.assert_array_equal(sparse_advance(soup, generations), _dense_on_plane(soup, generations))
+
+    @pytest.mark.parametrize("rulestring", ["B36/S23", "B3678/S34678", "B3/S012345678", "B2/S"])
+    def test_rules_match_dense(self, rulestring: str) -> None:
+        rule = parse_rule(rulestring)
+        soup = np.pad(random_grid(16, 16, seed=5), 8)
+        np.testing.assert_array_equal(sparse_advance(soup, 12, rule), _dense_on_plane(soup, 12, rule))
+
+    def test_isolated_cells_survive_under_s0(self) -> None:
+        life = SparseLife.from_coords(np.array([0, 50]), np.array([0, 50]), rule=parse_rule("B3/S0"))
+        life.run(10)
+        assert life.coords().tolist() == [[0, 0], [50, 50]]
+
+    def test_rejects_b0(self) -> None:
+        with pytest.raises(RuleError):
+            SparseLife(rule=parse_rule("B0/S"))
+
+
+class TestSparseUnbounded:
+    def test_glider_keeps_flying(self) -> None:
+        life = SparseLife.from_array(glider_grid(5, 5))
+        start = life.coords()
+        life.run(4000)
+        assert life.population == 5
+        np.testing.assert_array_equal(life.coords(), start + 1000)
+
+    def test_gun_emits_gliders_with_memory_proportional_to_population(self) -> None:
+        life = SparseLife.from_array(gosper_gun_pattern(), row0=-100, col0=-100)
+        life.run(300)
+        mid = life.population
+        life.run(300)
+        r0, c0, rows, cols = life.bounding_box()
+        # A new glider every 30 generations: the population keeps growing, one key per cell.
+        assert rows > 100 and cols > 100
+        assert life.population >= mid + 5 * 9
+        assert life._keys.nbytes == 8 * life.population
+
+    def test_blinker_window_and_negative_coordinates(self) -> None:
+        life = SparseLife.from_array(blinker_horizontal(), row0=-2, col0=-3)
+        life.step()
+        assert life.bounding_box() == (-1, -1, 3, 1)
+        np.testing.assert_array_equal(life.to_array(-2, -2, 5, 3)[:, 1], [0, 1, 1, 1, 0])
+        assert life.generation == 1
+
+    def test_extinct_plane_skips_remaining_generations(self) -> None:
+        life = SparseLife.from_coords(np.array([0]), np.array([0]))
+        life.run(10_000)
+        assert life.population == 0 and life.generation == 10_000 and life.bounding_box() is None
+
+    def test_rejects_bad_input(self) -> None:
+        with pytest.raises(GridShapeError):
+            SparseLife.from_array(np.zeros(3, dtype=np.uint8))
+        with pytest.raises(EngineError):
+            SparseLife.from_coords(np.array([LIMIT]), np.array([0]))
+        with pytest.raises(EngineError):
+            SparseLife().run(-1)
+
+    def test_growth_past_coordinate_range_raises(self) -> None:
+        life = SparseLife.from_array(glider_grid(5, 5), row0=LIMIT - 8, col0=LIMIT - 8)
+        with pytest.raises(EngineError, match="coordinate range"):
+            life.run(100)
@@ -0,0 +1,121 @@
+"""Tests for the memory-mapped board format and checkpoints."""
+import numpy as np
+import pytest
+
+from app import next_generation
+from cli import main
+from engine.rules import CONWAY, parse_rule
+from storage.board import (
+    HEADER_BYTES,
+    advance_board_file,
+    load_board,
+    open_board,
+    read_header,
+    save_board,
+    step_board_file,
+    write_generation,
+)
+from storage.checkpoint import Checkpointer, latest_checkpoint, resume
+from storage.errors import BoardFileError
+from tests.fixtures import glider_grid, random_grid
+
+HIGHLIFE = parse_rule("B36/S23")
+
+
+def _dense(grid: np.ndarray, wrap: bool, generations: int, rule=None) -> np.ndarray:
+    for _ in range(generations):
+        grid = next_generation(grid, wrap, rule)
+    return grid
+
+
+class TestBoardFile:
+    def test_round_trip_keeps_header_fields(self, tmp_path) -> None:
+        grid = random_grid(13, 70, seed=1)
+        path = tmp_path / "b.golb"
+        save_board(path, grid, HIGHLIFE, True, generation=42)
+        header, loaded = load_board(path)
+        np.testing.assert_array_equal(loaded, grid)
+        assert (header.rows, header.cols, header.rule, header.wrap, header.generation) == (13, 70, HIGHLIFE, True, 42)
+        assert path.stat().st_size == HEADER_BYTES + 13 * 2 * 8
+
+    def test_open_board_maps_words_without_loading(self, tmp_path) -> None:
+        path = tmp_path / "b.golb"
+        save_board(path, glider_grid(), CONWAY, False)
+        header, words = open_board(path)
+        assert isinstance(words, np.memmap) and words.shape == (header.rows, 1)
+
+    def test_write_generation_in_place(self, tmp_path) -> None:
+        path = tmp_path / "b.golb"
+        save_board(path, glider_grid(), CONWAY, False)
+        write_generation(path, 7)
+        assert read_header(path).generation == 7
+        np.testing.assert_array_equal(load_board(path)[1], glider_grid())
+
+    @pytest.mark.parametrize("damage", ["magic", "truncate"])
+    def test_rejects_damaged_files(self, tmp_path, damage: str) -> None:
+        path = tmp_path / "b.golb"
+        save_board(path, random_grid(8, 8), CONWAY, False)
+        raw = path.read_bytes()
+        path.write_bytes(b"NOPE" + raw[4:] if damage == "magic" else raw[:-8])
+        with pytest.raises(BoardFileError):
+            load_board(path)
+
+
+class TestBandStepping:
+    @pytest.mark.parametrize("wrap", [False, True])
+    @pytest.mark.parametrize("band_rows", [1, 3, 7, 100])
+    def test_matches_dense(self, tmp_path, wrap: bool, band_rows: int) -> None:
+        grid = random_grid(17, 70, density=0.35, seed=band_rows)
+        src, dst = tmp_path / "a.golb", tmp_path / "b.golb"
+        save_board(src, grid, HIGHLIFE, wrap, generation=3)
+        header = step_board_file(src, dst, band_rows=band_rows)
+        assert header.generation == 4
+        np.testing.assert_array_equal(load_board(dst)[1], _dense(grid, wrap, 1, HIGHLIFE))
+
+    def test_advance_in_place(self, tmp_path) -> None:
+        path = tmp_path / "g.golb"
+        save_board(path, glider_grid(), CONWAY, True)
+        header = advance_board_file(path, 8, band_rows=4)
+        assert header.generation == 8 and read_header(path).generation == 8
+        np.testing.assert_array_equal(load_board(path)[1], _dense(glider_grid(), True, 8))
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["g.golb"]
+
+
+class TestCheckpoints:
+    def test_keeps_newest_and_resumes_latest(self, tmp_path) -> None:
+        ckpt = Checkpointer(tmp_path, every=5, rule=CONWAY, wrap=True, keep=2)
+        grid = glider_grid()
+        for gen in range(1, 21):
+            grid = next_generation(grid, True)
+            ckpt.maybe_save(grid, gen)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["ckpt_000000015.golb", "ckpt_000000020.golb"]
+        assert latest_checkpoint(tmp_path).name == "ckpt_000000020.golb"
+        header, loaded = resume(tmp_path)
+        assert header.generation == 20
+        np.testing.assert_array_equal(loaded, grid)
+
+    def test_resume_without_checkpoints(self, tmp_path) -> None:
+        assert latest_checkpoint(tmp_path / "missing") is None
+        with pytest.raises(BoardFileError):
+            resume(tmp_path)
+
+
+class TestCliCheckpointResume:
+    def test_interrupted_run_resumes_to_same_board(self, tmp_path) -> None:
+        ckpt, full, resumed = tmp_path / "ckpt", tmp_path / "full.golb", tmp_path / "resumed.golb"
+        base = ["run", "--rows", "32", "--cols", "32", "--seed", "3", "--wrap", "--rule", "B36/S23"]
+        assert main(base + ["--generations", "30", "--save", str(full)]) == 0
+        assert main(base + ["--generations", "20", "--checkpoint-every", "10", "--checkpoint-dir", str(ckpt)]) == 0
+        assert main(["run", "--generations", "30", "--resume", "--checkpoint-dir", str(ckpt), "--save", str(resumed)]) == 0
+        full_header, full_grid = load_board(full)
+        header, grid = load_board(resumed)
+        assert header.generation == full_header.generation == 30
+        assert header.rule == HIGHLIFE and header.wrap
+        np.testing.assert_array_equal(grid, full_grid)
+
+    def test_advance_command(self, tmp_path, capsys) -> None:
+        path = tmp_path / "g.golb"
+        save_board(path, glider_grid(), CONWAY, False)
+        assert main(["advance", str(path), "--generations", "4", "--band-rows", "2"]) == 0
+        assert "generation 4" in capsys.readouterr().out
+        np.testing.assert_array_equal(load_board(path)[1], _dense(glider_grid(), False, 4))
@@ -0,0 +1,104 @@
+"""Tests for viewport rendering, level of detail and click mapping."""
+import numpy as np
+import pytest
+
+from engine.errors import EngineError, GridShapeError
+from tests.fixtures import glider_grid, random_grid
+from ui.renderer import DEFAULT_PALETTE
+from ui.viewport import Viewport, ViewportRenderer, block_reduce, shade_palette
+
+
+def _reference_levels(cells: np.ndarray, block: int, reduce: str) -> np.ndarray:
+    h, w = cells.shape
+    out = np.zeros((-(-h // block), -(-w // block)), dtype=np.uint8)
+    for i in range(out.shape[0]):
+        for j in range(out.shape[1]):
+            tile = cells[i * block : (i + 1) * block, j * block : (j + 1) * block]
+            out[i, j] = 255 * tile.max() if reduce == "max" else int(tile.mean() * 255 + 0.5)
+    return out
+
+
+class TestBlockReduce:
+    @pytest.mark.parametrize("reduce", ["mean", "max"])
+    @pytest.mark.parametrize("block", [2, 3, 4, 8, 16, 24])
+    @pytest.mark.parametrize("shape", [(64, 64), (37, 50), (20, 133)])
+    def test_matches_reference(self, shape: tuple[int, int], block: int, reduce: str) -> None:
+        cells = random_grid(*shape, density=0.4, seed=block)
+        np.testing.assert_array_equal(block_reduce(cells, block, reduce), _reference_levels(cells, block, reduce))
+
+    @pytest.mark.parametrize("block", [128, 256, 512, 1024])
+    @pytest.mark.parametrize("fill", ["ones", "random"])
+    def test_large_blocks_match_mean(self, block: int, fill: str) -> None:
+        shape = (2 * block, 3 * block)
+        cells = np.ones(shape, dtype=np.uint8) if fill == "ones" else random_grid(*shape, density=0.5, seed=block)
+        means = cells.reshape(2, block, 3, block).mean(axis=(1, 3))
+        expected = np.floor(means * 255 + 0.5).astype(np.uint8)
+        np.testing.assert_array_equal(block_reduce(cells, block), expected)
+
+    def test_works_on_strided_window(self) -> None:
+        cells = random_grid(40, 90, seed=2)
+        window = cells[3:35, 5:85]
+        np.testing.assert_array_equal(block_reduce(window, 8), _reference_levels(window, 8, "mean"))
+
+    def test_rejects_unknown_reduction(self) -> None:
+        with pytest.raises(EngineError):
+            block_reduce(glider_grid(), 2, "median")
+
+
+class TestViewport:
+    def test_fit_keeps_cell_size_when_board_fits(self) -> None:
+        assert Viewport.fit((50, 50), (960, 720), 8) == Viewport(0, 0, 50, 50, cell_px=8)
+        assert Viewport.fit((200, 200), (960, 720), 8).cell_px == 3
+
+    def test_fit_zooms_out_by_power_of_two(self) -> None:
+        view = Viewport.fit((3000, 5000), (960, 720), 8)
+        assert view.block == 8 and view.image_size == (625, 375)
+
+    def test_image_size_is_bounded_for_huge_boards(self) -> None:
+        width, height = Viewport.fit((100_000, 100_000), (960, 720), 8).image_size
+        assert width <= 960 and height <= 720
+
+    def test_window_is_clamped_to_board(self) -> None:
+        view = Viewport.window((500, 500), (400, 400), 10, center=(495, 2))
+        assert (view.row0, view.col0, view.rows, view.cols) == (460, 0, 40, 40)
+
+    def test_cell_at_zoomed_in(self) -> None:
+        view = Viewport(100, 200, 40, 40, cell_px=10)
+        assert view.cell_at(0, 0) == (100, 200)
+        assert view.cell_at(399, 15) == (101, 239)
+        assert view.cell_at(400, 0) is None
+
+    def test_cell_at_zoomed_out_picks_block_centre(self) -> None:
+        view = Viewport(0, 0, 100, 100, block=8)
+        assert view.cell_at(0, 0) == (4, 4)
+        assert view.cell_at(12, 12) == (99, 99)
+
+    def test_rejects_invalid_scale(self) -> None:
+        with pytest.raises(EngineError):
+            Viewport(0, 0, 10, 10, cell_px=2, block=2)
+
+
+class TestViewportRenderer:
+    def test_zoomed_in_window_matches_cropped_board(self) -> None:
+        board = random_grid(60, 80, seed=5)
+        view = Viewport(10, 20, 30, 40, cell_px=3)
+        img = ViewportRenderer().render(board, view)
+        assert img.size == (120, 90)
+        rgb = np.asarray(img.convert("RGB"))
+        expected = np.repeat(np.repeat(board[10:40, 20:60], 3, axis=0), 3, axis=1)
+        np.testing.assert_array_equal(rgb, np.where(expected[:, :, None], DEFAULT_PALETTE[1], DEFAULT_PALETTE[0]))
+
+    def test_zoomed_out_shades_density(self) -> None:
+        board = np.zeros((16, 16), dtype=np.uint8)
+        board[:8, :8] = 1
+        board[8:, 8:12] = 1
+        img = ViewportRenderer().render(board, Viewport(0, 0, 16, 16, block=8))
+        shades = shade_palette(DEFAULT_PALETTE)
+        rgb = np.asarray(img.convert("RGB"))
+        np.testing.assert_array_equal(rgb[0, 0], DEFAULT_PALETTE[1])
+        np.testing.assert_array_equal(rgb[0, 1], DEFAULT_PALETTE[0])
+        np.testing.assert_array_equal(rgb[1, 1], shades[128])
+
+    def test_rejects_viewport_outside_board(self) -> None:
+        with pytest.raises(GridShapeError):
+            ViewportRenderer().render(glider_grid(10, 10), Viewport(5, 5, 10, 10))
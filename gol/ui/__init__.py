@@ -0,0 +1 @@
+__all__ = ["canvas", "delta", "renderer", "viewport"]
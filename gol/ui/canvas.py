@@ -0,0 +1,28 @@
+"""
+Streamlit wrapper for the grid canvas component (ui/components/grid_canvas).
+
+The component is a static HTML page, so it needs no frontend build. Each
+rerun passes it one ui.delta message; it returns the last click or drag as
+{"x", "y", "points", "click", "resync"} in image pixels (see
+Viewport.cell_at), where `points` lists the pixels a drag crossed, `click`
+counts clicks and `resync` counts requests for a key frame.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Optional
+
+import streamlit.components.v1 as components
+
+from ui.delta import Message
+
+__all__ = ["COMPONENT_DIR", "grid_canvas"]
+
+COMPONENT_DIR = Path(__file__).resolve().parent / "components" / "grid_canvas"
+
+_component = components.declare_component("grid_canvas", path=str(COMPONENT_DIR))
+
+
+def grid_canvas(message: Message, key: str) -> Optional[dict[str, Any]]:
+    """Send `message` to the canvas mounted under `key`; returns its latest value, if any."""
+    return _component(message=message, key=key, default=None)
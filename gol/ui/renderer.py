@@ -0,0 +1,75 @@
+"""
+Incremental frame renderer: persistent palette-indexed buffer, repaint only changed cells.
+
+The frame is a (rows * cell, cols * cell) uint8 array holding each pixel's
+cell state, viewed as (rows, cell, cols, cell) so a whole cell block is one
+index. Each render diffs the grid against the previous one and rewrites the
+changed blocks only. The PIL image is a "P" (palette) image that wraps the
+buffer with Image.frombuffer (no copy), with the colours attached as its
+palette; one byte per pixel also makes PNG encoding much cheaper than RGB.
+The image must be consumed (encoded or copied) before the next render call.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+from engine.errors import EngineError, GridShapeError
+
+__all__ = ["DEFAULT_PALETTE", "FULL_REPAINT_FRACTION", "FrameRenderer"]
+
+# Row 0 = dead, row 1 = alive.
+DEFAULT_PALETTE = np.array([[255, 255, 255], [40, 40, 40]], dtype=np.uint8)
+
+# Above this fraction of changed cells a full broadcast repaint is cheaper.
+FULL_REPAINT_FRACTION = 0.25
+
+
+class FrameRenderer:
+    """Keeps the last frame and grid; render() repaints the difference."""
+
+    def __init__(self, cell_size: int, palette: Optional[np.ndarray] = None) -> None:
+        if cell_size <= 0:
+            raise EngineError("cell_size must be positive.")
+        self.cell_size = cell_size
+        self.palette = DEFAULT_PALETTE if palette is None else np.asarray(palette, dtype=np.uint8)
+        if self.palette.shape != (2, 3):
+            raise EngineError(f"Expected a (2, 3) RGB palette, got shape {self.palette.shape}.")
+        self.last_repainted = 0
+        self._frame: Optional[np.ndarray] = None
+        self._blocks: Optional[np.ndarray] = None
+        self._last: Optional[np.ndarray] = None
+
+    def _allocate(self, shape: tuple[int, int]) -> None:
+        rows, cols = shape
+        cs = self.cell_size
+        self._frame = np.empty((rows * cs, cols * cs), dtype=np.uint8)
+        self._blocks = self._frame.reshape(rows, cs, cols, cs)
+        self._last = np.empty(shape, dtype=np.uint8)
+
+    def render(self, grid: np.ndarray) -> Image.Image:
+        if grid.ndim != 2 or grid.size == 0:
+            raise GridShapeError(f"Expected a non-empty 2-D grid, got shape {grid.shape}.")
+        if self._last is None or self._last.shape != grid.shape:
+            self._allocate(grid.shape)
+            self._repaint_all(grid)
+        else:
+            rr, cc = np.nonzero(grid != self._last)
+            if len(rr) > FULL_REPAINT_FRACTION * grid.size:
+                self._repaint_all(grid)
+            elif len(rr):
+                state = (grid[rr, cc] != 0).astype(np.uint8)
+                self._blocks[rr, :, cc, :] = state[:, None, None]
+                self._last[rr, cc] = state
+            self.last_repainted = len(rr)
+        h, w = self._frame.shape
+        image = Image.frombuffer("P", (w, h), self._frame, "raw", "P", 0, 1)
+        image.putpalette(self.palette.tobytes())
+        return image
+
+    def _repaint_all(self, grid: np.ndarray) -> None:
+        np.not_equal(grid, 0, out=self._last)
+        self._blocks[...] = self._last[:, None, :, None]
+        self.last_repainted = grid.size
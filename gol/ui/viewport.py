@@ -0,0 +1,240 @@
+"""
+Viewport rendering: rasterize only the visible window, with level of detail.
+
+A Viewport is a window of the board (top-left cell, size in cells) plus a
+scale: either `cell_px` pixels per cell (zoomed in) or `block` cells per
+pixel along each axis (zoomed out). The image size is bounded by the
+viewport, not the board, so the PNG shipped per rerun stays the same size
+however large the board grows.
+
+Zoomed in, the window is handed to an incremental FrameRenderer. Zoomed
+out, each block x block square becomes one pixel: "mean" shades it by live
+density through a 256-entry palette ramp, "max" shows it alive if any cell
+is. Full blocks are reduced on uint64 words where the layout allows: blocks
+of 2 and 4 as SWAR lanes inside a word, multiples of 8 by adding whole words
+and taking one byte-sum per block. Other blocks use reshapes, and partial
+blocks at the board edge np.add/maximum.reduceat.
+
+Clicks: Viewport.cell_at maps image pixel coordinates back to a board cell
+(the centre cell of a block when zoomed out).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+from engine.errors import EngineError, GridShapeError
+from ui.renderer import DEFAULT_PALETTE, FrameRenderer
+
+__all__ = ["REDUCTIONS", "Viewport", "ViewportRenderer", "block_reduce", "shade_palette", "viewport_levels"]
+
+REDUCTIONS = ("mean", "max")
+# Largest block: the word path adds block / 8 words bytewise, so each byte holds at most 128.
+MAX_BLOCK = 1024
+# Largest block whose live count fits the top byte of the multiply byte-sum.
+_BYTE_SUM_MAX_BLOCK = 128
+
+# Byte-sum of a uint64 whose eight bytes are each 0 or 1: multiply, keep the top byte.
+_BYTE_SUM = np.uint64(0x0101010101010101)
+_TOP_BYTE = np.uint64(56)
+# Low half of every 2 * width-bit lane, for pairwise lane reductions.
+_LANE_MASKS = {8: np.uint64(0x00FF00FF00FF00FF), 16: np.uint64(0x0000FFFF0000FFFF)}
+
+
+@dataclass(frozen=True)
+class Viewport:
+    """Board window [row0, row0+rows) x [col0, col0+cols) drawn at one scale."""
+
+    row0: int
+    col0: int
+    rows: int
+    cols: int
+    cell_px: int = 1
+    block: int = 1
+
+    def __post_init__(self) -> None:
+        if self.rows <= 0 or self.cols <= 0 or self.row0 < 0 or self.col0 < 0:
+            raise EngineError(f"Invalid viewport window {self.rows}x{self.cols} at ({self.row0}, {self.col0}).")
+        if self.cell_px < 1 or not 1 <= self.block <= MAX_BLOCK or (self.cell_px > 1 and self.block > 1):
+            raise EngineError(f"Viewport scale needs cell_px >= 1 or 1 <= block <= {MAX_BLOCK}, not both above 1.")
+
+    @classmethod
+    def fit(cls, shape: tuple[int, int], max_px: tuple[int, int], cell_px: int) -> Viewport:
+        """The whole board, at `cell_px` if it fits in max_px (width, height), else zoomed out to fit.
+
+        Zoomed out, the block is the smallest power of two that fits.
+        """
+        rows, cols = shape
+        max_w, max_h = max_px
+        px = min(cell_px, max_w // cols, max_h // rows)
+        if px >= 1:
+            return cls(0, 0, rows, cols, cell_px=px)
+        needed = max(-(-cols // max_w), -(-rows // max_h))
+        # Power-of-two blocks keep the word-level reductions in use.
+        block = 1 << (needed - 1).bit_length()
+        if block > MAX_BLOCK:
+            raise EngineError(f"A {rows}x{cols} board does not fit in {max_w}x{max_h} pixels.")
+        return cls(0, 0, rows, cols, block=block)
+
+    @classmethod
+    def window(
+        cls, shape: tuple[int, int], max_px: tuple[int, int], cell_px: int, center: tuple[int, int]
+    ) -> Viewport:
+        """As much of the board as fits at `cell_px`, centred on `center` and clamped to the board."""
+        rows, cols = shape
+        max_w, max_h = max_px
+        view_rows = max(1, min(rows, max_h // cell_px))
+        view_cols = max(1, min(cols, max_w // cell_px))
+        row0 = min(max(center[0] - view_rows // 2, 0), rows - view_rows)
+        col0 = min(max(center[1] - view_cols // 2, 0), cols - view_cols)
+        return cls(row0, col0, view_rows, view_cols, cell_px=cell_px)
+
+    @property
+    def image_size(self) -> tuple[int, int]:
+        """(width, height) of the rendered image in pixels."""
+        if self.block > 1:
+            return -(-self.cols // self.block), -(-self.rows // self.block)
+        return self.cols * self.cell_px, self.rows * self.cell_px
+
+    def cell_at(self, x: int, y: int) -> Optional[tuple[int, int]]:
+        """Board (row, col) under image pixel (x, y), or None outside the window."""
+        width, height = self.image_size
+        if not (0 <= x < width and 0 <= y < height):
+            return None
+        if self.block > 1:
+            r = min(y * self.block + self.block // 2, self.rows - 1)
+            c = min(x * self.block + self.block // 2, self.cols - 1)
+        else:
+            r, c = y // self.cell_px, x // self.cell_px
+        return self.row0 + r, self.col0 + c
+
+    def crop(self, grid: np.ndarray) -> np.ndarray:
+        """The visible cells of `grid` (a view, not a copy)."""
+        return grid[self.row0 : self.row0 + self.rows, self.col0 : self.col0 + self.cols]
+
+
+def _packable(cells: np.ndarray, block: int) -> bool:
+    """Whether column blocks can be reduced on uint64 words (8 cells each)."""
+    return (block % 8 == 0 or 8 % block == 0) and cells.dtype.itemsize == 1 and cells.strides[1] == 1
+
+
+def _reduce_cols(cells: np.ndarray, block: int, reduce: str) -> np.ndarray:
+    """(h, w // block) sums (or maxima) over column blocks; w must be a multiple of block.
+
+    On packable input (w a multiple of 8), blocks of 2 and 4 are combined as
+    SWAR lanes inside each word, and blocks of 8k as whole words.
+    """
+    h, w = cells.shape
+    if not _packable(cells, block) or w % 8:
+        grouped = cells.reshape(h, w // block, block)
+        return grouped.max(axis=2) if reduce == "max" else grouped.sum(axis=2, dtype=np.uint16)
+    words = cells.view(np.uint64)
+    if block < 8:
+        combine = np.bitwise_or if reduce == "max" else np.add
+        lanes, width = words, 8
+        while width < 8 * block:
+            mask = _LANE_MASKS[width]
+            lanes = combine(lanes & mask, (lanes >> np.uint64(width)) & mask)
+            width *= 2
+        return lanes.view(f"<u{block}").reshape(h, w // block)
+    words = words.reshape(h, w // block, block // 8)
+    # Add (or OR) the block's words lane-wise first: each byte stays <= block / 8,
+    # so no byte carries and one byte-sum per block remains.
+    combine = np.bitwise_or if reduce == "max" else np.add
+    total = words[:, :, 0].copy()
+    for k in range(1, block // 8):
+        combine(total, words[:, :, k], out=total)
+    if reduce == "max":
+        return total != 0
+    if block > _BYTE_SUM_MAX_BLOCK:
+        # A count of 256 or more would wrap the top byte; add the eight bytes widened instead.
+        return total.view(np.uint8).reshape(h, w // block, 8).sum(axis=2, dtype=np.uint16)
+    return ((total * _BYTE_SUM) >> _TOP_BYTE).astype(np.uint16)
+
+
+def _levels(sums: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Live fraction sums / counts as 0..255 palette indices, rounded to nearest."""
+    return ((sums.astype(np.uint32) * 255 + counts // 2) // counts).astype(np.uint8)
+
+
+def _reduce_edges(cells: np.ndarray, block: int, reduce: str) -> np.ndarray:
+    """Generic reduction of any window, partial trailing blocks included."""
+    h, w = cells.shape
+    row_idx, col_idx = np.arange(0, h, block), np.arange(0, w, block)
+    if reduce == "max":
+        hit = np.maximum.reduceat(np.maximum.reduceat(cells, col_idx, axis=1), row_idx, axis=0)
+        return np.where(hit != 0, 255, 0).astype(np.uint8)
+    sums = np.add.reduceat(np.add.reduceat(cells, col_idx, axis=1, dtype=np.uint32), row_idx, axis=0)
+    counts = np.outer(np.diff(np.append(row_idx, h)), np.diff(np.append(col_idx, w))).astype(np.uint32)
+    return _levels(sums, counts)
+
+
+def block_reduce(cells: np.ndarray, block: int, reduce: str = "mean") -> np.ndarray:
+    """Downsample a 0/1 window to one 0..255 level per block x block square.
+
+    "mean" gives the live fraction scaled to 0..255, "max" 255 for any live
+    cell. Trailing partial blocks cover only the cells that exist.
+    """
+    if reduce not in REDUCTIONS:
+        raise EngineError(f"Unknown reduction {reduce!r}; choose from {', '.join(REDUCTIONS)}.")
+    if cells.ndim != 2 or cells.size == 0:
+        raise GridShapeError(f"Expected a non-empty 2-D grid, got shape {cells.shape}.")
+    h, w = cells.shape
+    # Word paths need whole words per row; leftover columns are edge blocks.
+    align = max(block, 8) if _packable(cells, block) else block
+    full_h, full_w = h // block, (w // align) * align // block
+    out = np.empty((-(-h // block), -(-w // block)), dtype=np.uint8)
+    if full_h and full_w:
+        cols = _reduce_cols(cells[: full_h * block, : full_w * block], block, reduce)
+        rows = cols.reshape(full_h, block, full_w)
+        if reduce == "max":
+            out[:full_h, :full_w] = np.where(rows.any(axis=1), 255, 0)
+        else:
+            out[:full_h, :full_w] = _levels(rows.sum(axis=1, dtype=np.uint32), np.uint32(block * block))
+    if full_h < out.shape[0]:
+        out[full_h:, :] = _reduce_edges(cells[full_h * block :, :], block, reduce)
+    if full_w < out.shape[1]:
+        out[:full_h, full_w:] = _reduce_edges(cells[: full_h * block, full_w * block :], block, reduce)
+    return out
+
+
+def shade_palette(palette: np.ndarray) -> np.ndarray:
+    """256-entry RGB ramp from the dead colour (index 0) to the alive colour (index 255)."""
+    t = np.linspace(0.0, 1.0, 256)[:, None]
+    return np.rint(palette[0] + (palette[1].astype(np.float64) - palette[0]) * t).astype(np.uint8)
+
+
+def viewport_levels(grid: np.ndarray, viewport: Viewport, reduce: str = "mean") -> np.ndarray:
+    """One 0..255 shade index per displayed unit: 0/255 per cell zoomed in, block levels zoomed out."""
+    cells = viewport.crop(grid)
+    if viewport.block > 1:
+        return block_reduce(cells, viewport.block, reduce)
+    return np.where(cells != 0, np.uint8(255), np.uint8(0))
+
+
+class ViewportRenderer:
+    """Renders the viewport of a board; reuses one FrameRenderer while zoomed in."""
+
+    def __init__(self, palette: Optional[np.ndarray] = None, reduce: str = "mean") -> None:
+        if reduce not in REDUCTIONS:
+            raise EngineError(f"Unknown reduction {reduce!r}; choose from {', '.join(REDUCTIONS)}.")
+        self.palette = DEFAULT_PALETTE if palette is None else np.asarray(palette, dtype=np.uint8)
+        self.reduce = reduce
+        self._shades = shade_palette(self.palette).tobytes()
+        self._frames: Optional[FrameRenderer] = None
+
+    def render(self, grid: np.ndarray, viewport: Viewport) -> Image.Image:
+        if grid.ndim != 2 or viewport.row0 + viewport.rows > grid.shape[0] or viewport.col0 + viewport.cols > grid.shape[1]:
+            raise GridShapeError(f"Viewport {viewport} does not fit a board of shape {grid.shape}.")
+        cells = viewport.crop(grid)
+        if viewport.block == 1:
+            if self._frames is None or self._frames.cell_size != viewport.cell_px:
+                self._frames = FrameRenderer(viewport.cell_px, self.palette)
+            return self._frames.render(cells)
+        levels = block_reduce(cells, viewport.block, self.reduce)
+        image = Image.frombuffer("P", (levels.shape[1], levels.shape[0]), levels, "raw", "P", 0, 1)
+        image.putpalette(self._shades)
+        return image